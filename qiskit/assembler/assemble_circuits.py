@@ -12,12 +12,13 @@
 
 """Assemble function for converting a list of circuits into a qobj."""
 import copy
+import itertools
 from collections import defaultdict
 from typing import Dict, List, Optional, Tuple
 
 from qiskit.assembler.run_config import RunConfig
 from qiskit.assembler.assemble_schedules import _assemble_instructions as _assemble_schedule
-from qiskit.circuit import QuantumCircuit
+from qiskit.circuit import Gate, Instruction, QuantumCircuit
 from qiskit.circuit.classicalregister import Clbit
 from qiskit.exceptions import QiskitError
 from qiskit.qobj import (
@@ -34,11 +35,14 @@ from qiskit.qobj import (
     converters,
     QobjHeader,
 )
-from qiskit.tools.parallel import parallel_map
+from qiskit.tools.parallel import parallel_map, CPU_COUNT
 
 
 PulseLibrary = Dict[str, List[complex]]
 
+# assemble methods which only depend on the parameters of an instruction besides its structure
+_PATCHABLE_ASSEMBLERS = (Instruction.assemble, Gate.assemble)
+
 
 def _assemble_circuit(
     circuit: QuantumCircuit, run_config: RunConfig
@@ -60,48 +64,11 @@ def _assemble_circuit(
             "Unable to assemble circuit with unit '{}', which must be 'dt'.".format(circuit.unit)
         )
 
-    # header data
-    num_qubits = 0
-    memory_slots = 0
-    qubit_labels = []
-    clbit_labels = []
-
-    qreg_sizes = []
-    creg_sizes = []
-    for qreg in circuit.qregs:
-        qreg_sizes.append([qreg.name, qreg.size])
-        for j in range(qreg.size):
-            qubit_labels.append([qreg.name, j])
-        num_qubits += qreg.size
-    for creg in circuit.cregs:
-        creg_sizes.append([creg.name, creg.size])
-        for j in range(creg.size):
-            clbit_labels.append([creg.name, j])
-        memory_slots += creg.size
-
+    header, config = _assemble_experiment_header(circuit)
+    memory_slots = config.memory_slots
     qubit_indices = {qubit: idx for idx, qubit in enumerate(circuit.qubits)}
     clbit_indices = {clbit: idx for idx, clbit in enumerate(circuit.clbits)}
 
-    # TODO: why do we need creq_sizes and qreg_sizes in header
-    # TODO: we need to rethink memory_slots as they are tied to classical bit
-    metadata = circuit.metadata
-    if metadata is None:
-        metadata = {}
-    header = QobjExperimentHeader(
-        qubit_labels=qubit_labels,
-        n_qubits=num_qubits,
-        qreg_sizes=qreg_sizes,
-        clbit_labels=clbit_labels,
-        memory_slots=memory_slots,
-        creg_sizes=creg_sizes,
-        name=circuit.name,
-        global_phase=float(circuit.global_phase),
-        metadata=metadata,
-    )
-
-    # TODO: why do we need n_qubits and memory_slots in both the header and the config
-    config = QasmQobjExperimentConfig(n_qubits=num_qubits, memory_slots=memory_slots)
-
     calibrations, pulse_library = _assemble_pulse_gates(circuit, run_config)
     if calibrations:
         config.calibrations = calibrations
@@ -112,11 +79,11 @@ def _assemble_circuit(
     # their clbit_index, create a new register slot for every conditional gate
     # and add a bfunc to map the creg=val mask onto the gating register bit.
 
-    is_conditional_experiment = any(op.condition for (op, qargs, cargs) in circuit.data)
+    is_conditional_experiment = any(op.condition for (op, qargs, cargs) in circuit._data)
     max_conditional_idx = 0
 
     instructions = []
-    for op_context in circuit.data:
+    for op_context in circuit._data:
         instruction = op_context[0].assemble()
 
         # Add register attributes to the instruction
@@ -171,6 +138,188 @@ def _assemble_circuit(
     )
 
 
+def _assemble_experiment_header(
+    circuit: QuantumCircuit,
+) -> Tuple[QobjExperimentHeader, QasmQobjExperimentConfig]:
+    """Assemble the header and the configuration of the experiment for one circuit.
+
+    Args:
+        circuit: circuit to assemble
+
+    Returns:
+        The header and the configuration of the experiment
+    """
+    # header data
+    num_qubits = 0
+    memory_slots = 0
+    qubit_labels = []
+    clbit_labels = []
+
+    qreg_sizes = []
+    creg_sizes = []
+    for qreg in circuit.qregs:
+        qreg_sizes.append([qreg.name, qreg.size])
+        for j in range(qreg.size):
+            qubit_labels.append([qreg.name, j])
+        num_qubits += qreg.size
+    for creg in circuit.cregs:
+        creg_sizes.append([creg.name, creg.size])
+        for j in range(creg.size):
+            clbit_labels.append([creg.name, j])
+        memory_slots += creg.size
+
+    # TODO: why do we need creq_sizes and qreg_sizes in header
+    # TODO: we need to rethink memory_slots as they are tied to classical bit
+    metadata = circuit.metadata
+    if metadata is None:
+        metadata = {}
+    header = QobjExperimentHeader(
+        qubit_labels=qubit_labels,
+        n_qubits=num_qubits,
+        qreg_sizes=qreg_sizes,
+        clbit_labels=clbit_labels,
+        memory_slots=memory_slots,
+        creg_sizes=creg_sizes,
+        name=circuit.name,
+        global_phase=float(circuit.global_phase),
+        metadata=metadata,
+    )
+
+    # TODO: why do we need n_qubits and memory_slots in both the header and the config
+    config = QasmQobjExperimentConfig(n_qubits=num_qubits, memory_slots=memory_slots)
+    return header, config
+
+
+def _template_shape(circuit: QuantumCircuit) -> Optional[Tuple[int, int, int]]:
+    """Return a cheap summary of the structure of a circuit, which is equal for circuits with
+    the same structure, or None if the circuit can not be assembled from a template."""
+    if circuit.unit != "dt" or circuit.calibrations:
+        return None
+    return (circuit.num_qubits, circuit.num_clbits, len(circuit._data))
+
+
+def _template_positions(circuit: QuantumCircuit) -> Optional[List[int]]:
+    """Return the positions of the assembled instructions of a circuit in its experiment, or
+    None if the instructions can not be patched with the parameters of other circuits."""
+    positions = []
+    position = 0
+    for op, _, _ in circuit._data:
+        if type(op).assemble not in _PATCHABLE_ASSEMBLERS:
+            return None
+        # conditional instructions are preceded by a bfunc
+        if op.condition:
+            position += 1
+        positions.append(position)
+        position += 1
+    return positions
+
+
+def _assemble_from_template(
+    circuit: QuantumCircuit, template: List
+) -> Optional[QasmQobjExperiment]:
+    """Assemble a circuit by copying the instructions assembled for a circuit with the same
+    structure and replacing their parameters.
+
+    The instruction contexts shared by the circuit and the template, e.g. because both were
+    bound from the same parameterized circuit, are equal without further checks, while the
+    other instructions must have the same class, name, condition, label and bits.
+
+    Args:
+        circuit: circuit to assemble
+        template: the template circuit, its experiment and the positions of the instructions
+            of the circuit in the experiment, which are computed when first needed and are empty
+            if the instructions of the template can not be patched
+
+    Returns:
+        The experiment for the QasmQobj, or None if the circuit does not fit the template
+    """
+    template_circuit, template_experiment, positions = template
+    if (
+        positions == []
+        or circuit._qubits != template_circuit._qubits
+        or circuit._clbits != template_circuit._clbits
+    ):
+        return None
+
+    patches = []
+    for index, (context, template_context) in enumerate(zip(circuit._data, template_circuit._data)):
+        if context is template_context:
+            continue
+        op, qargs, cargs = context
+        template_op, template_qargs, template_cargs = template_context
+        if op is not template_op:
+            if (
+                type(op) is not type(template_op)
+                or op.name != template_op.name
+                or len(op.params) != len(template_op.params)
+                or op.condition != template_op.condition
+                or getattr(op, "_label", None) != getattr(template_op, "_label", None)
+            ):
+                return None
+            if op.params:
+                patches.append((index, op.params))
+        if qargs != template_qargs or cargs != template_cargs:
+            return None
+
+    if positions is None:
+        positions = template[2] = _template_positions(template_circuit) or []
+        if not positions:
+            return None
+    instructions = [
+        _copy_qobj_instruction(instruction) for instruction in template_experiment.instructions
+    ]
+    for index, params in patches:
+        instructions[positions[index]].params = [
+            x.evalf(x) if hasattr(x, "evalf") else x for x in params
+        ]
+    header, config = _assemble_experiment_header(circuit)
+    return QasmQobjExperiment(instructions=instructions, header=header, config=config)
+
+
+def _copy_qobj_instruction(instruction: QasmQobjInstruction) -> QasmQobjInstruction:
+    cpy = QasmQobjInstruction.__new__(QasmQobjInstruction)
+    # set the attributes one by one rather than assigning __dict__, which keeps the compact
+    # attribute storage of the instance and allocates fewer objects for the garbage collector
+    for name, value in instruction.__dict__.items():
+        setattr(cpy, name, value.copy() if isinstance(value, list) else value)
+    return cpy
+
+
+def _assemble_circuit_batch(
+    circuits: List[QuantumCircuit], run_config: RunConfig
+) -> List[Tuple[QasmQobjExperiment, Optional[PulseLibrary]]]:
+    """Assemble a batch of circuits.
+
+    The instructions assembled for a circuit are reused for the following circuits of the batch
+    with the same structure, e.g. the bound copies of a parameterized circuit, of which only the
+    parameters are replaced.
+
+    Args:
+        circuits: circuits to assemble
+        run_config: configuration of the runtime environment
+
+    Returns:
+        The experiment and pulse library of each circuit
+    """
+    # the last circuit assembled for each shape, with its experiment
+    templates = {}
+    results = []
+    for circuit in circuits:
+        shape = _template_shape(circuit)
+        template = templates.get(shape)
+        if template is not None:
+            experiment = _assemble_from_template(circuit, template)
+            if experiment is not None:
+                results.append((experiment, None))
+                continue
+
+        experiment, pulse_library = _assemble_circuit(circuit, run_config)
+        if shape is not None:
+            templates[shape] = [circuit, experiment, None]
+        results.append((experiment, pulse_library))
+    return results
+
+
 def _assemble_pulse_gates(
     circuit: QuantumCircuit, run_config: RunConfig
 ) -> Tuple[Optional[QasmExperimentCalibrations], Optional[PulseLibrary]]:
@@ -312,11 +461,20 @@ def assemble_circuits(
     Returns:
         The qobj to be run on the backends
     """
-    # assemble the circuit experiments
-    experiments_and_pulse_libs = parallel_map(_assemble_circuit, circuits, [run_config])
+    # assemble the circuit experiments in parallel, in one batch of consecutive circuits per
+    # process
+    num_batches = max(1, min(CPU_COUNT, len(circuits)))
+    batch_size, remainder = divmod(len(circuits), num_batches)
+    batches = []
+    start = 0
+    for index in range(num_batches):
+        stop = start + batch_size + (1 if index < remainder else 0)
+        batches.append(circuits[start:stop])
+        start = stop
+    experiments_and_pulse_libs = parallel_map(_assemble_circuit_batch, batches, [run_config])
     experiments = []
     pulse_library = {}
-    for exp, lib in experiments_and_pulse_libs:
+    for exp, lib in itertools.chain.from_iterable(experiments_and_pulse_libs):
         experiments.append(exp)
         if lib:
             pulse_library.update(lib)
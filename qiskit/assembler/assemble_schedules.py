@@ -13,9 +13,12 @@
 # pylint: disable=unused-import
 
 """Assemble function for converting a list of circuits into a qobj."""
+import copy
 import hashlib
 from collections import defaultdict
-from typing import Any, Dict, List, Tuple, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
 
 from qiskit import qobj, pulse
 from qiskit.assembler.run_config import RunConfig
@@ -104,10 +107,11 @@ def _assemble_experiments(
     compressed_schedules = transforms.compress_pulses(formatted_schedules)
 
     user_pulselib = {}
+    waveforms = {}
     experiments = []
     for idx, sched in enumerate(compressed_schedules):
         qobj_instructions, max_memory_slot = _assemble_instructions(
-            sched, instruction_converter, run_config, user_pulselib
+            sched, instruction_converter, run_config, user_pulselib, waveforms
         )
 
         metadata = sched.metadata
@@ -160,7 +164,8 @@ def _assemble_instructions(
     sched: Union[pulse.Schedule, pulse.ScheduleBlock],
     instruction_converter: converters.InstructionToQobjConverter,
     run_config: RunConfig,
-    user_pulselib: Dict[str, List[complex]],
+    user_pulselib: Dict[str, np.ndarray],
+    waveforms: Optional[Dict[int, Tuple[library.Waveform, library.Waveform]]] = None,
 ) -> Tuple[List[qobj.PulseQobjInstruction], int]:
     """Assembles the instructions in a schedule into a list of PulseQobjInstructions and returns
     related metadata that will be assembled into the Qobj configuration. Lookup table for
@@ -174,12 +179,16 @@ def _assemble_instructions(
                                PulseQobjInstructions.
         run_config: Configuration of the runtime environment.
         user_pulselib: User pulse library from previous schedule.
+        waveforms: Map from the ids of the waveforms assembled for previous schedules to the
+            waveforms and their copies named by the hash of their samples.
 
     Returns:
         A list of converted instructions, the user pulse library dictionary (from pulse name to
         pulse samples), and the maximum number of readout memory slots used by this Schedule.
     """
     sched = transforms.target_qobj_transform(sched)
+    if waveforms is None:
+        waveforms = {}
 
     max_memory_slot = 0
     qobj_instructions = []
@@ -199,13 +208,19 @@ def _assemble_instructions(
         if isinstance(instruction, instructions.Play) and isinstance(
             instruction.pulse, library.Waveform
         ):
-            name = hashlib.sha256(instruction.pulse.samples).hexdigest()
+            # hash the samples of each waveform once, the waveforms played many times are shared
+            # by the compressed schedules
+            waveform = instruction.pulse
+            if id(waveform) in waveforms:
+                named_waveform = waveforms[id(waveform)][1]
+            else:
+                named_waveform = copy.copy(waveform)
+                named_waveform.name = hashlib.sha256(waveform.samples).hexdigest()
+                waveforms[id(waveform)] = (waveform, named_waveform)
+                user_pulselib[named_waveform.name] = named_waveform.samples
             instruction = instructions.Play(
-                library.Waveform(name=name, samples=instruction.pulse.samples),
-                channel=instruction.channel,
-                name=name,
+                named_waveform, channel=instruction.channel, name=named_waveform.name
             )
-            user_pulselib[name] = instruction.pulse.samples
 
         # ignore explicit delay instrs on acq channels as they are invalid on IBMQ backends;
         # timing of other instrs will still be shifted appropriately
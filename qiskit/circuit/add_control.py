@@ -12,11 +12,20 @@
 
 """Add control to operation if supported."""
 
+from collections import OrderedDict
 from typing import Union, Optional
 
 from qiskit.circuit.exceptions import CircuitError
 from qiskit.extensions import UnitaryGate
 from . import ControlledGate, Gate, QuantumRegister, QuantumCircuit
+from .definitioncache import definition_key
+
+# maximum number of controlled circuits kept in the cache
+CONTROLLED_CIRCUIT_CACHE_SIZE = 128
+
+# definitions of controlled gates (with closed controls) by definition key of the base
+# operation and number of controls, see _controlled_circuit
+_CONTROLLED_CIRCUIT_CACHE = OrderedDict()
 
 
 def add_control(
@@ -53,9 +62,6 @@ def add_control(
     """
     if ctrl_state is None:
         ctrl_state = 2 ** num_ctrl_qubits - 1
-    if isinstance(operation, UnitaryGate):
-        # attempt decomposition
-        operation._define()
     cgate = control(operation, num_ctrl_qubits=num_ctrl_qubits, label=label, ctrl_state=ctrl_state)
     cgate.base_gate.label = operation.label
     return cgate
@@ -88,11 +94,76 @@ def control(
     Raises:
         CircuitError: gate contains non-gate in definition
     """
+    # pylint: disable=cyclic-import
+    import qiskit.circuit.controlledgate as controlledgate
+
+    controlled_circ = _controlled_circuit(operation, num_ctrl_qubits)
+    if isinstance(operation, controlledgate.ControlledGate):
+        new_num_ctrl_qubits = num_ctrl_qubits + operation.num_ctrl_qubits
+        new_ctrl_state = operation.ctrl_state << num_ctrl_qubits | ctrl_state
+        base_name = operation.base_gate.name
+        base_gate = operation.base_gate
+    else:
+        new_num_ctrl_qubits = num_ctrl_qubits
+        new_ctrl_state = ctrl_state
+        base_name = operation.name
+        base_gate = operation
+    # In order to maintain some backward compatibility with gate names this
+    # uses a naming convention where if the number of controls is <=2 the gate
+    # is named like "cc<base_gate.name>", else it is named like
+    # "c<num_ctrl_qubits><base_name>".
+    if new_num_ctrl_qubits > 2:
+        ctrl_substr = "c{:d}".format(new_num_ctrl_qubits)
+    else:
+        ctrl_substr = ("{0}" * new_num_ctrl_qubits).format("c")
+    new_name = "{}{}".format(ctrl_substr, base_name)
+    # the definition is copied by ControlledGate, so the cached circuit is not modified
+    cgate = controlledgate.ControlledGate(
+        new_name,
+        controlled_circ.num_qubits,
+        operation.params,
+        label=label,
+        num_ctrl_qubits=new_num_ctrl_qubits,
+        definition=controlled_circ,
+        ctrl_state=new_ctrl_state,
+        base_gate=base_gate,
+    )
+    return cgate
+
+
+def _controlled_circuit(operation, num_ctrl_qubits):
+    """Return the definition of ``operation`` controlled on ``num_ctrl_qubits`` closed controls.
+
+    The circuits are cached by the definition key of the operation (including its unbound
+    parameters) and the number of controls, so that controlling equal gates only unrolls
+    and controls their definition once. The returned circuit must not be modified.
+    """
+    key = definition_key(operation, allow_parameters=True)
+    if key is not None:
+        key = (key, num_ctrl_qubits)
+        controlled_circ = _CONTROLLED_CIRCUIT_CACHE.get(key)
+        if controlled_circ is not None:
+            _CONTROLLED_CIRCUIT_CACHE.move_to_end(key)
+            return controlled_circ
+
+    controlled_circ = _build_controlled_circuit(operation, num_ctrl_qubits)
+    if key is not None:
+        _CONTROLLED_CIRCUIT_CACHE[key] = controlled_circ
+        if len(_CONTROLLED_CIRCUIT_CACHE) > CONTROLLED_CIRCUIT_CACHE_SIZE:
+            _CONTROLLED_CIRCUIT_CACHE.popitem(last=False)
+    return controlled_circ
+
+
+def _build_controlled_circuit(operation, num_ctrl_qubits):
     from math import pi
 
     # pylint: disable=cyclic-import
     import qiskit.circuit.controlledgate as controlledgate
 
+    if isinstance(operation, UnitaryGate):
+        # attempt decomposition
+        operation._define()
+
     q_control = QuantumRegister(num_ctrl_qubits, name="control")
     q_target = QuantumRegister(operation.num_qubits, name="target")
     q_ancillae = None  # TODO: add
@@ -218,35 +289,7 @@ def control(
             controlled_circ.mcp(global_phase, q_control[:-1], q_control[-1])
     if isinstance(operation, controlledgate.ControlledGate):
         operation.ctrl_state = original_ctrl_state
-        new_num_ctrl_qubits = num_ctrl_qubits + operation.num_ctrl_qubits
-        new_ctrl_state = operation.ctrl_state << num_ctrl_qubits | ctrl_state
-        base_name = operation.base_gate.name
-        base_gate = operation.base_gate
-    else:
-        new_num_ctrl_qubits = num_ctrl_qubits
-        new_ctrl_state = ctrl_state
-        base_name = operation.name
-        base_gate = operation
-    # In order to maintain some backward compatibility with gate names this
-    # uses a naming convention where if the number of controls is <=2 the gate
-    # is named like "cc<base_gate.name>", else it is named like
-    # "c<num_ctrl_qubits><base_name>".
-    if new_num_ctrl_qubits > 2:
-        ctrl_substr = "c{:d}".format(new_num_ctrl_qubits)
-    else:
-        ctrl_substr = ("{0}" * new_num_ctrl_qubits).format("c")
-    new_name = "{}{}".format(ctrl_substr, base_name)
-    cgate = controlledgate.ControlledGate(
-        new_name,
-        controlled_circ.num_qubits,
-        operation.params,
-        label=label,
-        num_ctrl_qubits=new_num_ctrl_qubits,
-        definition=controlled_circ,
-        ctrl_state=new_ctrl_state,
-        base_gate=base_gate,
-    )
-    return cgate
+    return controlled_circ
 
 
 def _gate_to_dag(operation):
@@ -0,0 +1,238 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""
+Incrementally maintained metrics of the instructions in a QuantumCircuit.
+"""
+import itertools
+
+from .classicalregister import Clbit
+
+
+class CircuitMetrics:
+    """Class for caching the size, depth, operation counts and connectivity of circuit data.
+
+    The metrics are computed lazily for the instruction list of a circuit. Instructions
+    appended to the end of the list since the last update are processed incrementally, while
+    any other modification of the list requires :meth:`invalidate` to be called, unless the
+    list object itself is replaced. The same holds for modifications of the processed
+    instructions themselves, such as conditioning them, so that an update without any
+    change to the circuit takes constant time.
+
+    The structural hashes of the circuit are cached along with the metrics, in the dictionary
+    returned by :meth:`hashes_for`, which does not compute the metrics. They are discarded
+    whenever the instruction list changes, and the hashes of the parameter values when
+    :meth:`invalidate_parameters` is called.
+    """
+
+    __slots__ = [
+        "_data",
+        "_length",
+        "_last",
+        "size",
+        "depth",
+        "count_ops",
+        "num_nonlocal_gates",
+        "_levels",
+        "_roots",
+        "_unions",
+        "_unitary_roots",
+        "_unitary_unions",
+        "hashes",
+        "_hashed",
+    ]
+
+    def __init__(self):
+        # the instruction list the metrics were computed for, the number of processed
+        # instructions and the last processed instruction context
+        self._data = None
+        self._length = 0
+        self._last = None
+
+        self.size = 0
+        self.depth = 0
+        self.count_ops = {}
+        self.num_nonlocal_gates = 0
+
+        # stack height of each bit, as in QuantumCircuit.depth
+        self._levels = {}
+
+        # union-find forests of the bits joined by instructions (unitary: qubits only) and
+        # the number of merges done in them
+        self._roots = {}
+        self._unions = 0
+        self._unitary_roots = {}
+        self._unitary_unions = 0
+
+        # structural hashes of the circuit, by whether they include the parameter values, and
+        # the instruction list, its length and its last instruction context they are valid for
+        self.hashes = {}
+        self._hashed = None
+
+    def invalidate(self):
+        """Discard the metrics, they are recomputed on the next update."""
+        self._data = None
+        self._hashed = None
+
+    def invalidate_parameters(self):
+        """Discard the cached values which depend on the parameter values of the circuit."""
+        self.hashes.pop(True, None)
+
+    def invalidate_hashes(self):
+        """Discard the cached structural hashes, e.g. because the bits of the circuit changed."""
+        self.hashes = {}
+
+    def hashes_for(self, data):
+        """Return the cached structural hashes of an instruction list.
+
+        Args:
+            data (list): the ``(instruction, qargs, cargs)`` tuples of the circuit.
+
+        Returns:
+            dict: the structural hashes by whether they include the parameter values, empty if
+            they were discarded.
+        """
+        length = len(data)
+        last = data[-1] if length else None
+        hashed = self._hashed
+        if hashed is None or hashed[0] is not data or hashed[1] != length or hashed[2] is not last:
+            self._hashed = (data, length, last)
+            self.hashes = {}
+        return self.hashes
+
+    def update(self, data):
+        """Bring the metrics up to date with an instruction list.
+
+        Args:
+            data (list): the ``(instruction, qargs, cargs)`` tuples of the circuit.
+        """
+        length = len(data)
+        processed = self._length
+        if (
+            data is not self._data
+            or length < processed
+            or (processed and data[processed - 1] is not self._last)
+        ):
+            hashes, hashed = self.hashes, self._hashed
+            self.__init__()
+            self.hashes, self._hashed = hashes, hashed
+            self._data = data
+            processed = 0
+        elif length == processed:
+            return
+
+        for instruction, qargs, cargs in itertools.islice(data, processed, None):
+            self._add(instruction, qargs, cargs)
+
+        self._length = length
+        self._last = data[-1] if length else None
+
+    def copy(self, data, new_data):
+        """Return a copy of the metrics for a copy of an instruction list.
+
+        Args:
+            data (list): the instruction list which was copied.
+            new_data (list): the copy of ``data``.
+
+        Returns:
+            CircuitMetrics: the metrics of ``new_data``.
+        """
+        cpy = CircuitMetrics()
+        if data is self._data:
+            cpy._data = new_data
+            cpy._length = self._length
+            cpy._last = self._last
+            cpy.size = self.size
+            cpy.depth = self.depth
+            cpy.count_ops = self.count_ops.copy()
+            cpy.num_nonlocal_gates = self.num_nonlocal_gates
+            cpy._levels = self._levels.copy()
+            cpy._roots = self._roots.copy()
+            cpy._unions = self._unions
+            cpy._unitary_roots = self._unitary_roots.copy()
+            cpy._unitary_unions = self._unitary_unions
+        if self._hashed is not None and data is self._hashed[0]:
+            cpy._hashed = (new_data,) + self._hashed[1:]
+            cpy.hashes = self.hashes.copy()
+        return cpy
+
+    def num_connected_components(self, num_bits, unitary_only=False):
+        """Return the number of connected components of the bits.
+
+        Args:
+            num_bits (int): the number of bits (qubits only if ``unitary_only``) in the circuit.
+            unitary_only (bool): only consider the unitary part of the circuit.
+
+        Returns:
+            int: the number of connected components.
+        """
+        return num_bits - (self._unitary_unions if unitary_only else self._unions)
+
+    def _add(self, instruction, qargs, cargs):
+        directive = instruction._directive
+        name = instruction.name
+        self.count_ops[name] = self.count_ops.get(name, 0) + 1
+        if not directive:
+            self.size += 1
+            if instruction.num_qubits > 1:
+                self.num_nonlocal_gates += 1
+
+        bits = qargs + cargs
+        condition_bits = []
+        condition = instruction.condition
+        if condition:
+            # Controls operate over all bits of a classical register or over a single bit
+            if isinstance(condition[0], Clbit):
+                condition_bits = [condition[0]]
+            else:
+                condition_bits = list(condition[0])
+
+        # Stack the instruction on its bits and on the bits of its condition, directives
+        # such as barriers or snapshots do not add to the stack heights.
+        levels = self._levels
+        level = max([levels.get(bit, 0) for bit in bits], default=0)
+        if not directive:
+            level += 1
+        extra_bits = [bit for bit in condition_bits if bit not in bits]
+        if extra_bits:
+            level = max(level, max(levels.get(bit, 0) for bit in extra_bits) + 1)
+        for bit in itertools.chain(bits, extra_bits):
+            levels[bit] = level
+        if level > self.depth:
+            self.depth = level
+
+        if directive:
+            return
+        if len(qargs) >= 2:
+            self._unitary_unions += _join(self._unitary_roots, qargs)
+        if len(bits) + (1 if condition else 0) >= 2:
+            self._unions += _join(self._roots, bits + condition_bits)
+
+
+def _find(roots, bit):
+    root = roots.get(bit, bit)
+    while root != bit:
+        parent = roots.get(root, root)
+        roots[bit] = parent
+        bit, root = root, parent
+    return root
+
+
+def _join(roots, bits):
+    """Join the trees of ``bits`` and return the number of merged trees."""
+    unions = 0
+    first = _find(roots, bits[0])
+    for bit in bits[1:]:
+        root = _find(roots, bit)
+        if root != first:
+            roots[root] = first
+            unions += 1
+    return unions
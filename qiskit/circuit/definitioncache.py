@@ -0,0 +1,181 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""
+Cache of instruction definitions shared between equal instructions.
+
+Computing the definition of instructions such as :class:`~.MCXGate` or :class:`~.Isometry`
+is expensive. Since the definition of a library instruction is fully determined by its
+class and its attributes (parameters, number of qubits, control state, ...), unless it was
+set explicitly, the definition computed for one instance can be reused for all equal
+instances, which is done by the :class:`~.Decompose` and :class:`~.Unroller` passes through
+:func:`cached_definition`.
+The keys returned by :func:`definition_key` also identify the controlled versions of
+gates built by :func:`~qiskit.circuit.add_control.add_control`.
+"""
+
+from collections import OrderedDict
+
+import numpy
+
+from qiskit.circuit.gate import Gate
+from qiskit.circuit.controlledgate import ControlledGate
+from qiskit.circuit.instruction import Instruction
+from qiskit.circuit.parameterexpression import ParameterExpression
+
+# maximum number of definitions kept in the cache
+DEFINITION_CACHE_SIZE = 256
+
+# attributes which do not influence the definition of an instruction
+_IGNORED_ATTRIBUTES = frozenset(["_definition", "condition", "_label", "_duration", "_unit"])
+
+# instruction classes whose instances are only defined through a set definition
+_PLAIN_TYPES = (Gate, Instruction, ControlledGate)
+
+_DEFINITION_CACHE = OrderedDict()
+
+# marks instructions without definition in the cache
+_NO_DEFINITION = object()
+
+
+class _Uncacheable(Exception):
+    """Raised if the definition of an instruction can not be cached."""
+
+
+def definition_key(instruction, allow_parameters=False):
+    """Return the key identifying the definition of an instruction.
+
+    The key of a library instruction is made of its class and attributes, while the key of
+    a plain :class:`~.Gate`, :class:`~.Instruction` or :class:`~.ControlledGate`, or of an
+    instruction whose definition is set, includes the contents of its definition.
+
+    Args:
+        instruction (Instruction): the instruction.
+        allow_parameters (bool): if True, unbound parameter expressions are part of the key.
+            Otherwise, instructions with unbound parameters have no key.
+
+    Returns:
+        tuple or None: a hashable key which is equal for instructions with the same definition,
+        or None if the definition of the instruction can not be shared, e.g. because it has
+        unbound parameters.
+    """
+    try:
+        return _instruction_key(instruction, allow_parameters)
+    except _Uncacheable:
+        return None
+
+
+def cached_definition(instruction):
+    """Return the definition of an instruction, reusing the definition of an equal instruction.
+
+    The returned definition may be shared with other instructions and must not be modified.
+
+    Args:
+        instruction (Instruction): the instruction.
+
+    Returns:
+        QuantumCircuit or None: the definition of ``instruction``.
+    """
+    # a set definition may be custom and is computed already
+    if instruction._definition is not None:
+        return instruction.definition
+
+    key = definition_key(instruction)
+    if key is None:
+        return instruction.definition
+
+    definition = _DEFINITION_CACHE.get(key)
+    if definition is None:
+        definition = instruction.definition
+        _DEFINITION_CACHE[key] = _NO_DEFINITION if definition is None else definition
+        if len(_DEFINITION_CACHE) > DEFINITION_CACHE_SIZE:
+            _DEFINITION_CACHE.popitem(last=False)
+        return definition
+
+    _DEFINITION_CACHE.move_to_end(key)
+    return None if definition is _NO_DEFINITION else definition
+
+
+def clear_definition_cache():
+    """Remove all definitions from the cache."""
+    _DEFINITION_CACHE.clear()
+
+
+def _instruction_key(instruction, allow_parameters):
+    key = (type(instruction),) + tuple(
+        (name, _value_key(value, allow_parameters))
+        for name, value in sorted(vars(instruction).items())
+        if name not in _IGNORED_ATTRIBUTES
+    )
+    # the definition of a library instruction may have been set to a custom circuit
+    if type(instruction) in _PLAIN_TYPES or instruction._definition is not None:
+        key += (_circuit_key(instruction._definition, allow_parameters),)
+    return key
+
+
+def _circuit_key(circuit, allow_parameters):
+    if circuit is None:
+        return None
+    bit_indices = {
+        bit: index for bits in (circuit.qubits, circuit.clbits) for index, bit in enumerate(bits)
+    }
+    key = [
+        circuit.num_qubits,
+        circuit.num_clbits,
+        _value_key(circuit.global_phase, allow_parameters),
+    ]
+    for instruction, qargs, cargs in circuit._data:
+        if instruction.condition:
+            raise _Uncacheable
+        key.append(
+            (
+                _instruction_key(instruction, allow_parameters),
+                tuple(bit_indices[qubit] for qubit in qargs),
+                tuple(bit_indices[clbit] for clbit in cargs),
+            )
+        )
+    return tuple(key)
+
+
+def _value_key(value, allow_parameters):
+    for types, key in _VALUE_KEYS:
+        if isinstance(value, types):
+            return key(value, allow_parameters)
+    try:
+        hash(value)
+    except TypeError as ex:
+        raise _Uncacheable from ex
+    return value
+
+
+def _parameter_key(value, allow_parameters):
+    if value.parameters:
+        if allow_parameters:
+            return value
+        raise _Uncacheable
+    try:
+        return float(value)
+    except TypeError:
+        return complex(value)
+
+
+def _sequence_key(value, allow_parameters):
+    return tuple(_value_key(item, allow_parameters) for item in value)
+
+
+# keys of attribute values by type, the first matching type is used, other values must be
+# hashable
+_VALUE_KEYS = (
+    (ParameterExpression, _parameter_key),
+    (numpy.ndarray, lambda value, _: (value.shape, value.dtype.str, value.tobytes())),
+    ((list, tuple), _sequence_key),
+    (Instruction, _instruction_key),
+)
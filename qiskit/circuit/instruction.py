@@ -180,6 +180,25 @@ class Instruction:
 
         return True
 
+    def structural_hash(self, parameters: bool = True) -> str:
+        """Return a hash of the structure of the instruction.
+
+        Instructions of the same class with equal names, dimensions, parameters, conditions and
+        attributes have the same hash, regardless of their labels. The hash of a plain
+        instruction without a library class also includes the hash of its definition. The hash
+        is stable across processes, which makes it usable as a key for persistent caches.
+
+        Args:
+            parameters: If True, the parameter values are part of the hash. Otherwise,
+                instructions which only differ in their parameter values have the same hash.
+
+        Returns:
+            The hexadecimal digest of the structural hash.
+        """
+        from qiskit.circuit.structuralhash import instruction_hash  # pylint: disable=cyclic-import
+
+        return instruction_hash(self, parameters)
+
     def _define(self):
         """Populates self.definition with a decomposition of this gate."""
         pass
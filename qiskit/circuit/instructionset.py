@@ -20,15 +20,21 @@ from .instruction import Instruction
 class InstructionSet:
     """Instruction collection, and their contexts."""
 
-    def __init__(self):
+    def __init__(self, circuit=None):
         """New collection of instructions.
 
         The context (qargs and cargs that each instruction is attached to)
         is also stored separately for each instruction.
+
+        Args:
+            circuit (QuantumCircuit): the circuit the instructions were added to, if any.
+                Its copies stop sharing the instructions and its cached metrics are discarded
+                when the instructions are conditioned.
         """
         self.instructions = []
         self.qargs = []
         self.cargs = []
+        self._circuit = circuit
 
     def __len__(self):
         """Return number of instructions in set"""
@@ -54,6 +60,10 @@ class InstructionSet:
 
     def c_if(self, classical, val):
         """Add condition on classical register to all instructions."""
+        if self._circuit is not None:
+            self._circuit._unshare_instructions(self.instructions)
         for gate in self.instructions:
             gate.c_if(classical, val)
+        if self._circuit is not None:
+            self._circuit._metrics.invalidate()
         return self
@@ -110,11 +110,21 @@ class BlueprintCircuit(QuantumCircuit, ABC):
             self._build()
         return super().qasm(formatted, filename, encoding)
 
+    def write_qasm(self, stream):
+        if self._data is None:
+            self._build()
+        return super().write_qasm(stream)
+
     def append(self, instruction, qargs=None, cargs=None):
         if self._data is None:
             self._build()
         return super().append(instruction, qargs, cargs)
 
+    def extend_trusted(self, instructions):
+        if self._data is None:
+            self._build()
+        return super().extend_trusted(instructions)
+
     def compose(self, other, qubits=None, clbits=None, front=False, inplace=False):
         if self._data is None:
             self._build()
@@ -166,6 +176,11 @@ class BlueprintCircuit(QuantumCircuit, ABC):
             self._build()
         return super().num_connected_components(unitary_only=unitary_only)
 
+    def structural_hash(self, parameters=True):
+        if self._data is None:
+            self._build()
+        return super().structural_hash(parameters=parameters)
+
     def copy(self, name=None):
         if self._data is None:
             self._build()
@@ -13,7 +13,8 @@
 """The n-local circuit class."""
 
 from typing import Union, Optional, List, Any, Tuple, Sequence, Set, Callable
-from itertools import combinations
+from itertools import combinations, islice
+from operator import is_, length_hint
 
 import numpy
 from qiskit.circuit.quantumcircuit import QuantumCircuit
@@ -126,7 +127,7 @@ class NLocal(BlueprintCircuit):
         self._appended_blocks = []
         self._appended_entanglement = []
         self._entanglement = None
-        self._entangler_maps = None
+        self._entangler_maps = {}
         self._ordered_parameters = ParameterVector(name=parameter_prefix)
         self._overwrite_block_parameters = overwrite_block_parameters
         self._skip_final_rotation_layer = skip_final_rotation_layer
@@ -134,6 +135,9 @@ class NLocal(BlueprintCircuit):
         self._initial_state, self._initial_state_circuit = None, None
         self._data = None
         self._bounds = None
+        self._block_templates = {}
+        self._rep_offsets = None
+        self._partial_build = None
 
         if int(reps) != reps:
             raise TypeError("The value of reps should be int")
@@ -304,6 +308,7 @@ class NLocal(BlueprintCircuit):
         """
         self._invalidate()
         self._entanglement = entanglement
+        self._entangler_maps = {}
 
     @property
     def num_layers(self) -> int:
@@ -505,8 +510,12 @@ class NLocal(BlueprintCircuit):
         if repetitions < 0:
             raise ValueError("The repetitions should be larger than or equal to 0")
         if repetitions != self._reps:
+            # keep the layers shared by the current and the new number of repetitions, such that
+            # only the remaining layers have to be built
+            partial_build = self._truncate_to_rep(min(repetitions, self._reps))
             self._invalidate()
             self._reps = repetitions
+            self._partial_build = partial_build
 
     def print_settings(self) -> str:
         """Returns information about the setting.
@@ -570,6 +579,22 @@ class NLocal(BlueprintCircuit):
             ValueError: If the value of ``entanglement`` could not be cast to a corresponding
                 entangler map.
         """
+        # entangler maps specified by a name are cached, since they are required for every
+        # repetition and block whenever the circuit or the number of parameters is computed
+        if self._entanglement is None or isinstance(self._entanglement, str):
+            key = (rep_num, block_num, num_block_qubits, self.num_qubits)
+            if key not in self._entangler_maps:
+                self._entangler_maps[key] = self._get_entangler_map(
+                    rep_num, block_num, num_block_qubits
+                )
+            return self._entangler_maps[key]
+
+        return self._get_entangler_map(rep_num, block_num, num_block_qubits)
+
+    def _get_entangler_map(
+        self, rep_num: int, block_num: int, num_block_qubits: int
+    ) -> List[List[int]]:
+        """Compute the entangler map, see :meth:`get_entangler_map`."""
         i, j, n = rep_num, block_num, num_block_qubits
         entanglement = self._entanglement
 
@@ -714,6 +739,63 @@ class NLocal(BlueprintCircuit):
         """Invalidate the current circuit build."""
         self._data = None
         self._parameter_table = ParameterTable()
+        self._rep_offsets = None
+        self._partial_build = None
+
+    def _truncate_to_rep(self, rep: int) -> Optional[Tuple]:
+        """Return the current build up to (excluding) the repetition ``rep``.
+
+        Args:
+            rep: The number of repetitions to keep.
+
+        Returns:
+            A tuple of the repetition, the offsets of the kept repetitions, the circuit data,
+            parameter table, global phase and the number of used parameters, to continue
+            building the circuit from, or ``None`` if the current build cannot be reused.
+        """
+        if not self._data or self._rep_offsets is None:
+            return None
+
+        rep_offsets, built_data = self._rep_offsets
+        # the circuit must not have been modified after it was built, which also includes entries
+        # replaced in place, and the parameters must remain the same, which is only guaranteed for
+        # the default parameter vector
+        if (
+            len(self._data) != len(built_data)
+            or rep >= len(rep_offsets)
+            or self._skip_unentangled_qubits
+            or not isinstance(self._ordered_parameters, ParameterVector)
+            or not all(map(is_, self._data, built_data))
+        ):
+            return None
+
+        size, global_phase, num_consumed = rep_offsets[rep]
+        if not all(
+            parameter in self._parameter_table
+            for parameter in self._ordered_parameters[:num_consumed]
+        ):
+            return None
+
+        data = self._data[:size]
+        removed = self._data[size:]
+        removed_ids = {id(instruction) for instruction, _, _ in removed}
+        parameter_table = self._parameter_table.copy()
+        for instruction, _, _ in removed:
+            for param in instruction.params:
+                if isinstance(param, ParameterExpression):
+                    for parameter in param.parameters:
+                        if parameter in parameter_table:
+                            entries = [
+                                entry
+                                for entry in parameter_table[parameter]
+                                if id(entry[0]) not in removed_ids
+                            ]
+                            if entries:
+                                parameter_table[parameter] = entries
+                            else:
+                                del parameter_table[parameter]
+
+        return rep, rep_offsets[:rep], data, parameter_table, global_phase, num_consumed
 
     def add_layer(
         self,
@@ -851,6 +933,82 @@ class NLocal(BlueprintCircuit):
 
         return block.copy()
 
+    def _append_block(self, block, param_iter, rep_num, block_num, indices):
+        """Append ``block`` on the qubits ``indices``, parameterized using the iterator.
+
+        The instructions of the block are copied into this circuit with the new parameters,
+        instead of assigning the parameters of a copy of the block and composing it. Blocks that
+        cannot be handled like this (see :meth:`_get_block_template`) are composed.
+        """
+        block_parameters, instructions, global_phase = self._get_block_template(block)
+
+        params = None
+        if self._overwrite_block_parameters:
+            # pylint: disable=assignment-from-none
+            params = self._parameter_generator(rep_num, block_num, indices)
+            if params is None:
+                params = [next(param_iter) for _ in range(len(block_parameters))]
+
+        if instructions is None or (
+            params is not None
+            and not all(isinstance(param, ParameterExpression) for param in params)
+        ):
+            parameterized_block = self._parameterize_block(block, params=params)
+            self.compose(parameterized_block, indices, inplace=True)
+            return
+
+        parameter_map = dict(zip(block_parameters, params)) if params is not None else {}
+        qubits = [self.qubits[index] for index in indices]
+        for instruction, qargs in instructions:
+            new_instruction = instruction.copy()
+            if parameter_map:
+                for param_index, param in enumerate(new_instruction.params):
+                    if isinstance(param, ParameterExpression):
+                        new_instruction.params[param_index] = param.subs(
+                            {
+                                parameter: parameter_map[parameter]
+                                for parameter in param.parameters
+                                if parameter in parameter_map
+                            }
+                        )
+            self._append(new_instruction, [qubits[index] for index in qargs], [])
+
+        if global_phase != 0:
+            self.global_phase += global_phase
+
+    def _get_block_template(self, block):
+        """Get the parameters, instructions and global phase of ``block`` to append it.
+
+        The instructions are given with the indices of the qubits they act on and are ``None``
+        if the block has classical bits, conditions, calibrations, a parameterized global phase
+        or parameterized instructions with a definition, which have to be handled by
+        :meth:`compose` and :meth:`assign_parameters`.
+        """
+        key = id(block)
+        if key not in self._block_templates:
+            instructions = None
+            if (
+                block.num_clbits == 0
+                and not block.calibrations
+                and not isinstance(block.global_phase, ParameterExpression)
+            ):
+                qubit_indices = {bit: index for index, bit in enumerate(block.qubits)}
+                instructions = []
+                for instruction, qargs, cargs in block.data:
+                    if (
+                        cargs
+                        or instruction.condition is not None
+                        or instruction._definition is not None
+                        and any(isinstance(p, ParameterExpression) for p in instruction.params)
+                    ):
+                        instructions = None
+                        break
+                    instructions.append((instruction, [qubit_indices[qarg] for qarg in qargs]))
+
+            self._block_templates[key] = (get_parameters(block), instructions, block.global_phase)
+
+        return self._block_templates[key]
+
     def _build_rotation_layer(self, param_iter, i):
         """Build a rotation layer."""
         # if the unentangled qubits are skipped, compute the set of qubits that are not entangled
@@ -859,9 +1017,6 @@ class NLocal(BlueprintCircuit):
 
         # iterate over all rotation blocks
         for j, block in enumerate(self.rotation_blocks):
-            # create a new layer
-            layer = QuantumCircuit(*self.qregs)
-
             # we apply the rotation gates stacked on top of each other, i.e.
             # if we have 4 qubits and a rotation block of width 2, we apply two instances
             block_indices = [
@@ -880,27 +1035,18 @@ class NLocal(BlueprintCircuit):
 
             # apply the operations in the layer
             for indices in block_indices:
-                parameterized_block = self._parameterize_block(block, param_iter, i, j, indices)
-                layer.compose(parameterized_block, indices, inplace=True)
-
-            # add the layer to the circuit
-            self.compose(layer, inplace=True)
+                self._append_block(block, param_iter, i, j, indices)
 
     def _build_entanglement_layer(self, param_iter, i):
         """Build an entanglement layer."""
         # iterate over all entanglement blocks
         for j, block in enumerate(self.entanglement_blocks):
-            # create a new layer and get the entangler map for this block
-            layer = QuantumCircuit(*self.qregs)
+            # get the entangler map for this block
             entangler_map = self.get_entangler_map(i, j, block.num_qubits)
 
             # apply the operations in the layer
             for indices in entangler_map:
-                parameterized_block = self._parameterize_block(block, param_iter, i, j, indices)
-                layer.compose(parameterized_block, indices, inplace=True)
-
-            # add the layer to the circuit
-            self.compose(layer, inplace=True)
+                self._append_block(block, param_iter, i, j, indices)
 
     def _build_additional_layers(self, which):
         if which == "appended":
@@ -933,18 +1079,52 @@ class NLocal(BlueprintCircuit):
         if self.num_qubits == 0:
             return
 
-        # use the initial state circuit if it is not None
-        if self._initial_state:
-            circuit = self._initial_state.construct_circuit("circuit", register=self.qregs[0])
-            self.compose(circuit, inplace=True)
+        ordered_parameters = self.ordered_parameters
+        param_iter = iter(ordered_parameters)
+
+        if self._partial_build is None:
+            first_rep, rep_offsets = 0, []
+            self._block_templates = {}
 
-        param_iter = iter(self.ordered_parameters)
+            # use the initial state circuit if it is not None
+            if self._initial_state:
+                circuit = self._initial_state.construct_circuit("circuit", register=self.qregs[0])
+                self.compose(circuit, inplace=True)
 
-        # build the prepended layers
-        self._build_additional_layers("prepended")
+            # build the prepended layers
+            self._build_additional_layers("prepended")
+        else:
+            # continue from the repetitions kept when the number of repetitions was changed
+            (
+                first_rep,
+                rep_offsets,
+                data,
+                parameter_table,
+                global_phase,
+                num_consumed,
+            ) = self._partial_build
+            self._partial_build = None
+            self._data = data
+            self._parameter_table = parameter_table
+            self._parameters = None
+            self.global_phase = global_phase
+            # skip the parameters consumed by the kept repetitions
+            next(islice(param_iter, num_consumed, num_consumed), None)
 
         # main loop to build the entanglement and rotation layers
-        for i in range(self.reps):
+        for i in range(first_rep, self.reps + 1):
+            # store where the repetition starts, to be able to continue building from here if
+            # the number of repetitions changes (the length hint of a list iterator is exact)
+            rep_offsets.append(
+                (
+                    len(self._data),
+                    self.global_phase,
+                    len(ordered_parameters) - length_hint(param_iter),
+                )
+            )
+            if i == self.reps:
+                break
+
             # insert barrier if specified and there is a preceding layer
             if self._insert_barriers and (i > 0 or len(self._prepended_blocks) > 0):
                 self.barrier()
@@ -968,6 +1148,8 @@ class NLocal(BlueprintCircuit):
         # add the appended layers
         self._build_additional_layers("appended")
 
+        self._rep_offsets = (rep_offsets, tuple(self._data))
+
     # pylint: disable=unused-argument
     def _parameter_generator(self, rep: int, block: int, indices: List[int]) -> Optional[Parameter]:
         """If certain blocks should use certain parameters this method can be overriden."""
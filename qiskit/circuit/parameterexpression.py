@@ -12,7 +12,7 @@
 """
 ParameterExpression Class to enable creating simple expressions of Parameters.
 """
-from typing import Callable, Dict, Set, Union
+from typing import Callable, Dict, Iterable, Optional, Set, Union
 
 import numbers
 import operator
@@ -35,7 +35,7 @@ ParameterValueType = Union["ParameterExpression", float]
 class ParameterExpression:
     """ParameterExpression class to enable creating expressions of Parameters."""
 
-    __slots__ = ["_parameter_symbols", "_parameters", "_symbol_expr", "_names"]
+    __slots__ = ["_parameter_symbols", "_parameters", "_symbol_expr", "_names", "_compiled"]
 
     def __init__(self, symbol_map: Dict, expr):
         """Create a new :class:`ParameterExpression`.
@@ -53,6 +53,7 @@ class ParameterExpression:
         self._parameters = set(self._parameter_symbols)
         self._symbol_expr = expr
         self._names = None
+        self._compiled = None
 
     @property
     def parameters(self) -> Set:
@@ -107,6 +108,17 @@ class ParameterExpression:
         self._raise_if_passed_unknown_parameters(parameter_values.keys())
         self._raise_if_passed_nan(parameter_values)
 
+        if len(parameter_values) == len(self._parameters) and all(
+            isinstance(value, (float, numpy.floating)) for value in parameter_values.values()
+        ):
+            # All parameters are bound to floats, so evaluate the compiled numeric function
+            # instead of substituting the values symbolically, unless the value is complex or
+            # not finite (e.g. from a division by zero), which the substitution handles exactly.
+            function = self.compile(parameter_values)
+            value = function(list(parameter_values.values())).item()
+            if isinstance(value, float) and numpy.isfinite(value):
+                return ParameterExpression._from_number(value)
+
         symbol_values = {}
         for parameter, value in parameter_values.items():
             param_expr = self._parameter_symbols[parameter]
@@ -140,6 +152,100 @@ class ParameterExpression:
 
         return ParameterExpression(free_parameter_symbols, bound_symbol_expr)
 
+    @staticmethod
+    def _from_number(value):
+        """Return a fully bound expression of the numeric ``value``."""
+        if HAS_SYMENGINE:
+            return ParameterExpression({}, symengine.sympify(value))
+        else:
+            from sympy import sympify
+
+            return ParameterExpression({}, sympify(value))
+
+    def compile(self, parameters: Optional[Iterable] = None) -> Callable:
+        """Compile the expression to a numeric function.
+
+        The function is built once for each order of the parameters and cached on the
+        expression, so that evaluating the expression many times only requires numeric
+        operations instead of a symbolic substitution per evaluation.
+
+        Args:
+            parameters (Iterable[Parameter]): The parameters in the order in which the
+                function expects their values. This must include all parameters of the
+                expression and may include others, whose values are ignored. Defaults to
+                the parameters of the expression sorted by name.
+
+        Raises:
+            CircuitError: If ``parameters`` does not contain all parameters of the expression.
+
+        Returns:
+            A function taking an array of values of shape ``(..., len(parameters))`` and
+            returning the values of the expression as an array of shape ``(...)``. The values
+            are real unless the expression evaluates to a complex number.
+        """
+        if parameters is None:
+            parameters = sorted(self.parameters, key=lambda parameter: parameter.name)
+        parameters = tuple(parameters)
+
+        if self._compiled is None:
+            self._compiled = {}
+        function = self._compiled.get(parameters)
+        if function is None:
+            missing_parameters = self.parameters - set(parameters)
+            if missing_parameters:
+                raise CircuitError(
+                    "Cannot compile expression without values for Parameters ({}).".format(
+                        [str(p) for p in missing_parameters]
+                    )
+                )
+            function = self._compiled[parameters] = self._lambdify(parameters)
+        return function
+
+    def _lambdify(self, parameters):
+        """Build the numeric function returned by :meth:`compile`."""
+        if HAS_SYMENGINE:
+            dummy = symengine.Dummy
+        else:
+            from sympy import Dummy as dummy
+
+        symbols = [
+            self._parameter_symbols[parameter] if parameter in self._parameter_symbols else dummy()
+            for parameter in parameters
+        ]
+
+        if self._symbol_expr in symbols:
+            # the expression is a single parameter, so its value is one of the inputs
+            index = symbols.index(self._symbol_expr)
+
+            def select(values):
+                return numpy.asarray(values, dtype=float)[..., index]
+
+            return select
+
+        real_lambdified = _lambdify_numeric(symbols, self._symbol_expr, real=True)
+        complex_lambdified = None
+
+        def evaluate(values):
+            nonlocal complex_lambdified
+            values = numpy.asarray(values, dtype=float)
+            result = real_lambdified(values)
+            if (
+                not numpy.iscomplexobj(result)
+                and numpy.isnan(result).any()
+                and not numpy.isnan(values).any()
+            ):
+                # the value is complex for some of the inputs (e.g. the logarithm of a
+                # negative number), which the real valued evaluation gives as nan
+                if complex_lambdified is None:
+                    complex_lambdified = _lambdify_numeric(symbols, self._symbol_expr, real=False)
+                result = complex_lambdified(values)
+            result = numpy.asarray(result).reshape(values.shape[:-1])
+            if numpy.iscomplexobj(result) and not numpy.any(result.imag):
+                result = result.real
+            return result
+
+        return evaluate
+
     def subs(self, parameter_map: Dict) -> "ParameterExpression":
         """Returns a new Expression with replacement Parameters.
 
@@ -494,6 +600,7 @@ class ParameterExpression:
             self._parameter_symbols = state["symbols"]
             self._parameters = set(self._parameter_symbols)
         self._names = state["names"]
+        self._compiled = None
 
     def is_real(self):
         """Return whether the expression is real"""
@@ -510,3 +617,33 @@ class ParameterExpression:
             else:
                 return False
         return True
+
+
+def _lambdify_numeric(symbols, symbol_expr, real):
+    """Build a numeric function of ``symbol_expr``, taking the values of ``symbols`` along the
+    last axis of its argument and evaluating with real or complex numbers."""
+    if HAS_SYMENGINE:
+        # the lambda backend is much faster to build than the LLVM one, which only pays
+        # off for very large arrays of values
+        for real_backend in (True, False) if real else (False,):
+            try:
+                return symengine.Lambdify(symbols, symbol_expr, real=real_backend, backend="lambda")
+            except RuntimeError:
+                # the real valued backend cannot handle complex constants and some
+                # functions (e.g. conjugate) are not supported by symengine
+                pass
+
+    from sympy import lambdify, sympify
+
+    sympy_lambdified = lambdify(
+        [sympify(symbol) for symbol in symbols], sympify(symbol_expr), modules="numpy"
+    )
+    dtype = float if real else complex
+
+    def evaluate_sympy(values):
+        values = numpy.asarray(values, dtype=dtype)
+        with numpy.errstate(invalid="ignore"):
+            result = sympy_lambdified(*numpy.moveaxis(values, -1, 0))
+        return numpy.broadcast_to(result, values.shape[:-1])
+
+    return evaluate_sympy
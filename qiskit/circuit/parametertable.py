@@ -15,14 +15,16 @@ Look-up table for variable parameters in QuantumCircuit.
 import warnings
 import functools
 from collections.abc import MutableMapping, MappingView
+from operator import attrgetter
 
 from .instruction import Instruction
+from .parametervector import ParameterVectorElement
 
 
 class ParameterTable(MutableMapping):
     """Class for managing and setting circuit parameters"""
 
-    __slots__ = ["_table", "_keys", "_names"]
+    __slots__ = ["_table", "_keys", "_names", "_shared", "_sorted", "_added", "_removed"]
 
     def __init__(self, *args, **kwargs):
         """
@@ -32,8 +34,19 @@ class ParameterTable(MutableMapping):
         self._table = dict(*args, **kwargs)
         self._keys = set(self._table)
         self._names = {x.name for x in self._table}
+        # keys whose entry lists are shared with a copy of this table
+        self._shared = set()
+        # cached sorted keys (never modified in place, as it is shared with copies) and the
+        # changes to the keys since it was computed
+        self._sorted = None
+        self._added = []
+        self._removed = False
 
     def __getitem__(self, key):
+        if self._shared and key in self._shared:
+            # copy-on-write: callers may mutate the returned list
+            self._table[key] = list(self._table[key])
+            self._shared.discard(key)
         return self._table[key]
 
     def __setitem__(self, parameter, instr_params):
@@ -48,9 +61,12 @@ class ParameterTable(MutableMapping):
         for instruction, param_index in instr_params:
             assert isinstance(instruction, Instruction)
             assert isinstance(param_index, int)
+        if self._sorted is not None and parameter not in self._table:
+            self._added.append(parameter)
         self._table[parameter] = instr_params
         self._keys.add(parameter)
         self._names.add(parameter.name)
+        self._shared.discard(parameter)
 
     def get_keys(self):
         """Return a set of all keys in the parameter table
@@ -68,10 +84,65 @@ class ParameterTable(MutableMapping):
         """
         return self._names
 
+    def get_sorted_keys(self):
+        """Return the keys of the parameter table in the order of ``QuantumCircuit.parameters``.
+
+        The keys are sorted by name, except for elements of the same :class:`.ParameterVector`,
+        which are sorted by their index. The order is cached and updated incrementally when
+        parameters are removed, or added after all existing ones (e.g. when consecutive
+        elements of a :class:`.ParameterVector` are added), so that it is only sorted again
+        when a parameter is inserted in between.
+
+        Returns:
+            list: The sorted keys of the parameter table. The list must not be modified.
+        """
+        if self._sorted is None or (self._added and self._removed):
+            self._sorted = _sort_parameters(self._table)
+        elif self._removed:
+            self._sorted = [parameter for parameter in self._sorted if parameter in self._table]
+        elif self._added:
+            if self._sorted:
+                added = _sort_parameters(self._added + self._sorted[-1:])
+                if added[0] is self._sorted[-1]:
+                    self._sorted = self._sorted + added[1:]
+                else:
+                    self._sorted = _sort_parameters(self._table)
+            else:
+                self._sorted = _sort_parameters(self._added)
+        self._added = []
+        self._removed = False
+        return self._sorted
+
+    def copy(self):
+        """Return a copy of the parameter table.
+
+        The entry lists are shared between the copy and this table and are only copied
+        once they are accessed for a given parameter, by whichever table accesses them.
+
+        Returns:
+            ParameterTable: a copy of the parameter table
+        """
+        cpy = ParameterTable()
+        cpy._table = self._table.copy()
+        cpy._keys = self._keys.copy()
+        cpy._names = self._names.copy()
+        cpy._shared = set(self._table)
+        self._shared = set(self._table)
+        cpy._sorted = self._sorted
+        cpy._added = self._added.copy()
+        cpy._removed = self._removed
+        return cpy
+
     def __delitem__(self, key):
         del self._table[key]
         self._keys.discard(key)
         self._names.discard(key.name)
+        self._shared.discard(key)
+        if self._sorted is not None:
+            self._removed = True
+
+    def __contains__(self, key):
+        return key in self._table
 
     def __iter__(self):
         return iter(self._table)
@@ -83,6 +154,27 @@ class ParameterTable(MutableMapping):
         return "ParameterTable({})".format(repr(self._table))
 
 
+def _sort_parameters(parameters):
+    """Sort parameters by name, where elements of the same vector are sorted by index.
+
+    Elements of a :class:`.ParameterVector` are kept at the positions they have when sorting
+    by name and are only reordered by their integer index among themselves, which avoids
+    sorting with a pairwise comparison function.
+    """
+    ordered = sorted(parameters, key=attrgetter("name"))
+    vectors = {}
+    for position, parameter in enumerate(ordered):
+        if isinstance(parameter, ParameterVectorElement):
+            vectors.setdefault(parameter.vector.name, []).append(position)
+
+    for positions in vectors.values():
+        elements = sorted((ordered[position] for position in positions), key=attrgetter("index"))
+        for position, element in zip(positions, elements):
+            ordered[position] = element
+
+    return ordered
+
+
 def _deprecated_set_method():
     def deprecate(func):
         @functools.wraps(func)
@@ -29,6 +29,8 @@ QPY serialization (:mod:`qiskit.circuit.qpy_serialization`)
 
     load
     dump
+    QpyReader
+    QpyWriter
 
 QPY Format
 ==========
@@ -57,28 +59,63 @@ compatibility.
 The file header is immediately followed by the circuit payloads.
 Each individual circuit is composed of the following parts:
 
-``HEADER | METADATA | REGISTERS | CUSTOM_DEFINITIONS | INSTRUCTIONS``
+``HEADER | METADATA | REGISTERS | CUSTOM_DEFINITIONS | STRING_TABLE | EXPRESSION_TABLE |
+INSTRUCTIONS``
+
+The current ``qpy_version`` is 3. Version 1 circuit payloads have no
+STRING_TABLE and EXPRESSION_TABLE and use the version 1 encoding of
+INSTRUCTIONS, described below. Version 1 and 2 circuit payloads use the
+version 1 HEADER, which can only store a numeric global phase. Version 3 files
+are written by default, version 1 and 2 files can still be loaded.
 
 There is a circuit payload for each circuit (where the total number is dictated
 by ``num_circuits`` in the file header). There is no padding between the
 circuits in the data.
 
-HEADER
-------
+The circuit payloads can optionally be followed by an INDEX, which is used by
+:class:`~qiskit.circuit.qpy_serialization.QpyReader` for random access to the
+circuits (see INDEX below). Readers which do not use the index stop reading
+after the last circuit payload, so files with and without an index can be
+loaded by any reader.
+
+HEADER (version 3)
+------------------
 
 The contents of HEADER as defined as a C struct are:
 
 .. code-block:: c
 
     struct {
-        unit16_t name_size;
+        uint16_t name_size;
+        char global_phase_type;
+        uint16_t global_phase_size;
+        uint32_t num_qubits;
+        uint32_t num_clbits;
+        uint64_t metadata_size;
+        uint32_t num_registers;
+        uint64_t num_instructions;
+    }
+
+This is immediately followed by ``name_size`` bytes of utf8 data for the name
+of the circuit, and then by ``global_phase_size`` bytes for the global phase of
+the circuit. As for an INSTRUCTION_PARAM, ``global_phase_type`` is ``'f'`` for
+a double, ``'p'`` for a PARAMETER or ``'e'`` for a PARAMETER_EXPR (see below).
+
+HEADER (version 1)
+------------------
+
+The contents of HEADER in version 1 and 2 payloads as defined as a C struct are:
+
+.. code-block:: c
+
+    struct {
+        uint16_t name_size;
         double global_phase;
         uint32_t num_qubits;
         uint32_t num_clbits;
         uint64_t metadata_size;
         uint32_t num_registers;
         uint64_t num_instructions;
-        uint64_t num_custom_gates;
     }
 
 This is immediately followed by ``name_size`` bytes of utf8 data for the name
@@ -149,9 +186,58 @@ If ``custom_definition`` is ``True`` that means that the immediately following
 definition of that gate. If ``custom_definition`` is ``False`` than the
 instruction can be considered opaque (ie no definition).
 
-INSTRUCTIONS
+STRING_TABLE
 ------------
 
+The STRING_TABLE contains the instruction and condition register names used
+in INSTRUCTIONS (version 2), which refer to them by their position in the
+table. It starts with a ``uint32_t`` for the number of strings, each of which
+is a ``uint16_t`` size followed by that many bytes of utf8 data.
+
+EXPRESSION_TABLE
+----------------
+
+The EXPRESSION_TABLE contains each parameter and parameter expression used as
+an instruction parameter in the circuit once, and INSTRUCTIONS (version 2)
+refer to them by their position in the table. It starts with a ``uint64_t``
+for the number of entries, each of which is an INSTRUCTION_PARAM struct
+(see below) followed by ``size`` bytes of data. The ``type`` is ``'p'`` for
+a PARAMETER or ``'e'`` for a PARAMETER_EXPR.
+
+INSTRUCTIONS (version 2)
+------------------------
+
+The contents of INSTRUCTIONS is a list of INSTRUCTION objects
+
+.. code-block:: c
+
+    struct {
+        uint32_t name_index;
+        uint16_t num_parameters;
+        uint32_t num_qargs;
+        uint32_t num_cargs;
+        _Bool has_condition;
+        uint32_t condition_register_index;
+        int64_t condition_value;
+    }
+
+``name_index`` and ``condition_register_index`` are positions in the
+STRING_TABLE, where ``name`` is defined as for version 1 (see below). The
+struct is immediately followed by a ``uint32_t`` array of the indices of
+the quantum arguments in the circuit's qubits, followed by the indices of the
+classical arguments in the circuit's clbits.
+
+If ``num_parameters`` is greater than 0, the arguments are followed by
+``num_parameters`` bytes with a type character for each parameter, and then a
+packed array with one value per parameter: an ``int64_t`` for type ``'i'``, a
+double for ``'f'``, a ``uint32_t`` position in the EXPRESSION_TABLE for
+``'r'`` and a ``uint64_t`` size for ``'n'``. For each parameter of type
+``'n'``, in order, the array is followed by ``size`` bytes of .npy format [#f2]_
+data.
+
+INSTRUCTIONS (version 1)
+------------------------
+
 The contents of INSTRUCTIONS is a list of INSTRUCTION metadata objects
 
 .. code-block:: c
@@ -274,14 +360,50 @@ size will be 0, the value will just be the same as the key. If
 this matches the internal C representation of Python's complex type. [#f3]_
 Finally, if type is ``i`` it represents an integer which is an ``int64_t``.
 
+INDEX
+-----
+
+The INDEX is written by :func:`~qiskit.circuit.qpy_serialization.dump` and
+:class:`~qiskit.circuit.qpy_serialization.QpyWriter` after the last circuit
+payload unless ``index=False`` is passed. It contains an
+INDEX_ENTRY for each circuit, defined as:
+
+.. code-block:: c
+
+    struct {
+        uint64_t offset;
+        uint16_t name_size;
+    }
+
+which is immediately followed by ``name_size`` bytes of utf8 data for the name
+of the circuit. ``offset`` is the position of the circuit's HEADER in bytes,
+relative to the start of the QPY data (the ``QISKIT`` string). The entries are
+followed by the INDEX_FOOTER, which ends the QPY data:
+
+.. code-block:: c
+
+    struct {
+        uint64_t index_offset;
+        uint64_t num_circuits;
+        char magic[8];
+    }
+
+``index_offset`` is the position of the first INDEX_ENTRY relative to the start
+of the QPY data, ``num_circuits`` matches the file header and ``magic`` is the
+string ``QPYINDEX``. As the footer is located from the end of the data, the
+index can only be used if the QPY data is at the end of the file.
+
 
 .. [#f1] https://tools.ietf.org/html/rfc1700
 .. [#f2] https://numpy.org/doc/stable/reference/generated/numpy.lib.format.html
 .. [#f3] https://docs.python.org/3/c-api/complex.html#c.Py_complex
 """
 from collections import namedtuple
+import functools
 import io
 import json
+import mmap
+import os
 import struct
 import uuid
 import warnings
@@ -396,14 +518,89 @@ COMPLEX = namedtuple("COMPLEX", ["real", "imag"])
 COMPLEX_PACK = "!dd"
 COMPLEX_SIZE = struct.calcsize(COMPLEX_PACK)
 
+# v2 Binary Format
+# ----------------
+QPY_VERSION = 3
+# STRING_TABLE
+STRING_TABLE_HEADER_PACK = "!I"
+STRING_TABLE_HEADER_SIZE = struct.calcsize(STRING_TABLE_HEADER_PACK)
+STRING_PACK = "!H"
+STRING_SIZE = struct.calcsize(STRING_PACK)
+# EXPRESSION_TABLE
+EXPRESSION_TABLE_HEADER_PACK = "!Q"
+EXPRESSION_TABLE_HEADER_SIZE = struct.calcsize(EXPRESSION_TABLE_HEADER_PACK)
+# INSTRUCTION binary format
+INSTRUCTION_V2 = namedtuple(
+    "INSTRUCTION_V2",
+    [
+        "name_index",
+        "num_parameters",
+        "num_qargs",
+        "num_cargs",
+        "has_condition",
+        "condition_register_index",
+        "value",
+    ],
+)
+INSTRUCTION_V2_PACK = "!IHII?Iq"
+INSTRUCTION_V2_SIZE = struct.calcsize(INSTRUCTION_V2_PACK)
+# struct format of the fixed size value of each INSTRUCTION_V2 parameter type
+INSTRUCTION_V2_PARAM_FORMATS = {"i": "q", "f": "d", "r": "I", "n": "Q"}
 
-def _read_header(file_obj):
-    header_raw = struct.unpack(HEADER_PACK, file_obj.read(HEADER_SIZE))
-    header = HEADER._make(header_raw)
-    name = file_obj.read(header[0]).decode("utf8")
-    metadata_raw = file_obj.read(header[4])
+# v3 Binary Format
+# ----------------
+# HEADER binary format
+HEADER_V3 = namedtuple(
+    "HEADER_V3",
+    [
+        "name_size",
+        "global_phase_type",
+        "global_phase_size",
+        "num_qubits",
+        "num_clbits",
+        "metadata_size",
+        "num_registers",
+        "num_instructions",
+    ],
+)
+HEADER_V3_PACK = "!H1cHIIQIQ"
+HEADER_V3_SIZE = struct.calcsize(HEADER_V3_PACK)
+
+# INDEX_ENTRY
+INDEX_ENTRY = namedtuple("INDEX_ENTRY", ["offset", "name_size"])
+INDEX_ENTRY_PACK = "!QH"
+INDEX_ENTRY_SIZE = struct.calcsize(INDEX_ENTRY_PACK)
+# INDEX_FOOTER
+INDEX_FOOTER = namedtuple("INDEX_FOOTER", ["index_offset", "num_circuits", "magic"])
+INDEX_FOOTER_PACK = "!QQ8s"
+INDEX_FOOTER_SIZE = struct.calcsize(INDEX_FOOTER_PACK)
+INDEX_MAGIC = b"QPYINDEX"
+
+
+def _read_header(file_obj, version):
+    if version < 3:
+        header = HEADER._make(struct.unpack(HEADER_PACK, file_obj.read(HEADER_SIZE)))
+        name = file_obj.read(header.name_size).decode("utf8")
+        global_phase = header.global_phase
+    else:
+        header = HEADER_V3._make(struct.unpack(HEADER_V3_PACK, file_obj.read(HEADER_V3_SIZE)))
+        name = file_obj.read(header.name_size).decode("utf8")
+        global_phase = _read_global_phase(
+            header.global_phase_type, file_obj.read(header.global_phase_size)
+        )
+    metadata_raw = file_obj.read(header.metadata_size)
     metadata = json.loads(metadata_raw)
-    return header, name, metadata
+    return header, name, global_phase, metadata
+
+
+def _read_global_phase(type_key, data):
+    if type_key == b"f":
+        return struct.unpack("!d", data)[0]
+    if type_key == b"p":
+        return _read_parameter(io.BytesIO(data))
+    if type_key == b"e":
+        return _read_parameter_expression(io.BytesIO(data))
+    raise TypeError("Invalid global phase type: %s" % type_key.decode("utf8"))
 
 
 def _read_registers(file_obj, num_registers):
@@ -528,35 +725,33 @@ def _read_instruction(file_obj, circuit, registers, custom_instructions):
         else:
             raise TypeError("Invalid parameter type: %s" % type_str)
         params.append(param)
-    # Load Gate object
-    gate_class = None
-    if gate_name in ("Gate", "Instruction"):
-        inst_obj = _parse_custom_instruction(custom_instructions, gate_name, params)
-        inst_obj.condition = condition_tuple
-        circuit._append(inst_obj, qargs, cargs)
-        return
-    elif hasattr(library, gate_name):
-        gate_class = getattr(library, gate_name)
-    elif hasattr(circuit_mod, gate_name):
-        gate_class = getattr(circuit_mod, gate_name)
-    elif hasattr(extensions, gate_name):
-        gate_class = getattr(extensions, gate_name)
-    elif hasattr(quantum_initializer, gate_name):
-        gate_class = getattr(quantum_initializer, gate_name)
-    elif gate_name in custom_instructions:
-        inst_obj = _parse_custom_instruction(custom_instructions, gate_name, params)
-        inst_obj.condition = condition_tuple
-        circuit._append(inst_obj, qargs, cargs)
-        return
-    else:
-        raise AttributeError("Invalid instruction type: %s" % gate_name)
-    if gate_name == "Barrier":
-        params = [len(qargs)]
-    gate = gate_class(*params)
+    gate = _build_instruction(gate_name, params, num_qargs, custom_instructions)
     gate.condition = condition_tuple
     circuit._append(gate, qargs, cargs)
 
 
+@functools.lru_cache(maxsize=256)
+def _standard_instruction_class(class_name):
+    """Return the Qiskit instruction class of the given name, or None if there is none."""
+    if class_name in ("Gate", "Instruction"):
+        return None
+    for module in (library, circuit_mod, extensions, quantum_initializer):
+        if hasattr(module, class_name):
+            return getattr(module, class_name)
+    return None
+
+
+def _build_instruction(gate_name, params, num_qargs, custom_instructions):
+    gate_class = _standard_instruction_class(gate_name)
+    if gate_class is None:
+        if gate_name in ("Gate", "Instruction") or gate_name in custom_instructions:
+            return _parse_custom_instruction(custom_instructions, gate_name, params)
+        raise AttributeError("Invalid instruction type: %s" % gate_name)
+    if gate_name == "Barrier":
+        params = [num_qargs]
+    return gate_class(*params)
+
+
 def _parse_custom_instruction(custom_instructions, gate_name, params):
     (type_str, num_qubits, num_clbits, definition) = custom_instructions[gate_name]
     if type_str == "i":
@@ -571,7 +766,7 @@ def _parse_custom_instruction(custom_instructions, gate_name, params):
     return inst_obj
 
 
-def _read_custom_instructions(file_obj):
+def _read_custom_instructions(file_obj, version):
     custom_instructions = {}
     custom_definition_header_raw = file_obj.read(CUSTOM_DEFINITION_HEADER_SIZE)
     custom_definition_header = struct.unpack(
@@ -594,7 +789,7 @@ def _read_custom_instructions(file_obj):
             definition_circuit = None
             if has_custom_definition:
                 definition_buffer = io.BytesIO(file_obj.read(size))
-                definition_circuit = _read_circuit(definition_buffer)
+                definition_circuit = _read_circuit(definition_buffer, version)
             custom_instructions[name] = (type_str, num_qubits, num_clbits, definition_circuit)
     return custom_instructions
 
@@ -648,92 +843,106 @@ def _write_parameter_expression(file_obj, param):
         file_obj.write(data)
 
 
-def _write_instruction(file_obj, instruction_tuple, custom_instructions, index_map):
-    gate_class_name = instruction_tuple[0].__class__.__name__
-    if (
-        (
-            not hasattr(library, gate_class_name)
-            and not hasattr(circuit_mod, gate_class_name)
-            and not hasattr(extensions, gate_class_name)
-            and not hasattr(quantum_initializer, gate_class_name)
-        )
-        or gate_class_name == "Gate"
-        or gate_class_name == "Instruction"
-    ):
-        if instruction_tuple[0].name not in custom_instructions:
-            custom_instructions[instruction_tuple[0].name] = instruction_tuple[0]
-        gate_class_name = instruction_tuple[0].name
+def _write_instruction(
+    file_obj, instruction_tuple, custom_instructions, index_map, string_table, expression_table
+):
+    instruction, qargs, cargs = instruction_tuple
+    gate_class_name = instruction.__class__.__name__
+    if _standard_instruction_class(gate_class_name) is None:
+        if instruction.name not in custom_instructions:
+            custom_instructions[instruction.name] = instruction
+        gate_class_name = instruction.name
+    name_index = string_table.setdefault(gate_class_name, len(string_table))
 
     has_condition = False
-    condition_register = "".encode("utf8")
+    condition_register_index = 0
     condition_value = 0
-    if instruction_tuple[0].condition:
+    if instruction.condition:
         has_condition = True
-        condition_register = instruction_tuple[0].condition[0].name.encode("utf8")
-        condition_value = instruction_tuple[0].condition[1]
-
-    gate_class_name = gate_class_name.encode("utf8")
-    instruction_raw = struct.pack(
-        INSTRUCTION_PACK,
-        len(gate_class_name),
-        len(instruction_tuple[0].params),
-        instruction_tuple[0].num_qubits,
-        instruction_tuple[0].num_clbits,
-        has_condition,
-        len(condition_register),
-        condition_value,
-    )
-    file_obj.write(instruction_raw)
-    file_obj.write(gate_class_name)
-    file_obj.write(condition_register)
-    # Encode instruciton args
-    for qbit in instruction_tuple[1]:
-        instruction_arg_raw = struct.pack(
-            INSTRUCTION_ARG_PACK, "q".encode("utf8"), index_map["q"][qbit]
+        condition_register_index = string_table.setdefault(
+            instruction.condition[0].name, len(string_table)
         )
-        file_obj.write(instruction_arg_raw)
-    for clbit in instruction_tuple[2]:
-        instruction_arg_raw = struct.pack(
-            INSTRUCTION_ARG_PACK, "c".encode("utf8"), index_map["c"][clbit]
-        )
-        file_obj.write(instruction_arg_raw)
-    # Encode instruction params
-    for param in instruction_tuple[0].params:
-        container = io.BytesIO()
+        condition_value = instruction.condition[1]
+
+    type_keys = []
+    values = []
+    arrays = []
+    for param in instruction.params:
         if isinstance(param, int):
-            type_key = "i"
-            data = struct.pack("<q", param)
-            size = struct.calcsize("<q")
+            type_keys.append("i")
+            values.append(param)
         elif isinstance(param, float):
-            type_key = "f"
-            data = struct.pack("<d", param)
-            size = struct.calcsize("<d")
-        elif isinstance(param, Parameter):
-            type_key = "p"
-            _write_parameter(container, param)
-            container.seek(0)
-            data = container.read()
-            size = len(data)
+            type_keys.append("f")
+            values.append(param)
         elif isinstance(param, ParameterExpression):
-            type_key = "e"
-            _write_parameter_expression(container, param)
-            container.seek(0)
-            data = container.read()
-            size = len(data)
+            # parameters are looked up by value, other expressions by identity as their
+            # equality check is symbolic
+            key = param if isinstance(param, Parameter) else id(param)
+            if key not in expression_table:
+                expression_table[key] = (len(expression_table), param)
+            type_keys.append("r")
+            values.append(expression_table[key][0])
         elif isinstance(param, (np.integer, np.floating, np.ndarray)):
-            type_key = "n"
+            container = io.BytesIO()
             np.save(container, param)
-            container.seek(0)
-            data = container.read()
-            size = len(data)
+            data = container.getvalue()
+            container.close()
+            type_keys.append("n")
+            values.append(len(data))
+            arrays.append(data)
         else:
-            raise TypeError(
-                "Invalid parameter type %s for gate %s," % (instruction_tuple[0], type(param))
-            )
-        instruction_param_raw = struct.pack(INSTRUCTION_PARAM_PACK, type_key.encode("utf8"), size)
-        file_obj.write(instruction_param_raw)
-        file_obj.write(data)
+            raise TypeError("Invalid parameter type %s for gate %s," % (instruction, type(param)))
+
+    file_obj.write(
+        struct.pack(
+            INSTRUCTION_V2_PACK,
+            name_index,
+            len(instruction.params),
+            len(qargs),
+            len(cargs),
+            has_condition,
+            condition_register_index,
+            condition_value,
+        )
+    )
+    file_obj.write(
+        struct.pack(
+            "!%sI" % (len(qargs) + len(cargs)),
+            *[index_map["q"][qubit] for qubit in qargs],
+            *[index_map["c"][clbit] for clbit in cargs],
+        )
+    )
+    if type_keys:
+        file_obj.write("".join(type_keys).encode("utf8"))
+        param_pack = "!" + "".join(INSTRUCTION_V2_PARAM_FORMATS[key] for key in type_keys)
+        file_obj.write(struct.pack(param_pack, *values))
+        for data in arrays:
+            file_obj.write(data)
+
+
+def _write_string_table(file_obj, string_table):
+    file_obj.write(struct.pack(STRING_TABLE_HEADER_PACK, len(string_table)))
+    # dicts keep insertion order, which is the order of the indices
+    for string in string_table:
+        string_raw = string.encode("utf8")
+        file_obj.write(struct.pack(STRING_PACK, len(string_raw)))
+        file_obj.write(string_raw)
+
+
+def _write_expression_table(file_obj, expression_table):
+    file_obj.write(struct.pack(EXPRESSION_TABLE_HEADER_PACK, len(expression_table)))
+    for _, param in expression_table.values():
+        container = io.BytesIO()
+        if isinstance(param, Parameter):
+            type_key = "p"
+            _write_parameter(container, param)
+        else:
+            type_key = "e"
+            _write_parameter_expression(container, param)
+        data = container.getvalue()
         container.close()
+        file_obj.write(struct.pack(INSTRUCTION_PARAM_PACK, type_key.encode("utf8"), len(data)))
+        file_obj.write(data)
 
 
 def _write_custom_instruction(file_obj, name, instruction):
@@ -770,7 +979,7 @@ def _write_custom_instruction(file_obj, name, instruction):
         file_obj.write(data)
 
 
-def dump(file_obj, circuits):
+def dump(file_obj, circuits, index=True):
     """Write QPY binary data to a file
 
     This function is used to save a circuit to a file for later use or transfer
@@ -812,22 +1021,165 @@ def dump(file_obj, circuits):
         circuits (list or QuantumCircuit): The quantum circuit object(s) to
             store in the specified file like object. This can either be a
             single QuantumCircuit object or a list of QuantumCircuits.
+        index (bool): If ``True`` (the default) an index of the circuits is
+            written after them, which allows :class:`.QpyReader` to load
+            individual circuits without reading the preceding ones. The index
+            is ignored by :func:`load`.
     """
     if isinstance(circuits, QuantumCircuit):
         circuits = [circuits]
+    file_obj.write(_file_header(len(circuits)))
+    offset = FILE_HEADER_SIZE
+    index_entries = []
+    for circuit in circuits:
+        index_entries.append((offset, circuit.name))
+        offset += _write_circuit_data(file_obj, circuit)
+    if index:
+        _write_index(file_obj, index_entries, offset)
+
+
+def _file_header(num_circuits):
     version_parts = [int(x) for x in __version__.split(".")[0:3]]
-    header = struct.pack(
+    return struct.pack(
         FILE_HEADER_PACK,
         "QISKIT".encode("utf8"),
-        1,
+        QPY_VERSION,
         version_parts[0],
         version_parts[1],
         version_parts[2],
-        len(circuits),
+        num_circuits,
     )
-    file_obj.write(header)
-    for circuit in circuits:
-        _write_circuit(file_obj, circuit)
+
+
+def _write_circuit_data(file_obj, circuit):
+    """Write a circuit payload and return its size in bytes."""
+    circuit_buffer = io.BytesIO()
+    _write_circuit(circuit_buffer, circuit)
+    data = circuit_buffer.getvalue()
+    circuit_buffer.close()
+    file_obj.write(data)
+    return len(data)
+
+
+def _write_index(file_obj, index_entries, index_offset):
+    for offset, name in index_entries:
+        name_raw = name.encode("utf8")
+        file_obj.write(struct.pack(INDEX_ENTRY_PACK, offset, len(name_raw)))
+        file_obj.write(name_raw)
+    file_obj.write(struct.pack(INDEX_FOOTER_PACK, index_offset, len(index_entries), INDEX_MAGIC))
+
+
+class QpyWriter:
+    """Incremental writer for QPY data.
+
+    :func:`dump` needs all circuits up front, as their number is stored in the
+    file header. A :class:`QpyWriter` instead writes circuits as they are
+    passed to :meth:`write` and only holds their positions in memory. The
+    number of circuits in the file header and the index (see :func:`dump`)
+    are written by :meth:`close`, which is called when leaving the ``with``
+    block:
+
+    .. code-block:: python
+
+        from qiskit.circuit.qpy_serialization import QpyWriter
+
+        with QpyWriter('circuits.qpy') as writer:
+            for circuit in generate_circuits():
+                writer.write(circuit)
+
+    As the file header is updated when the writer is closed, the file must be
+    seekable. Until then the file header contains no circuits, so the data
+    written so far can not be loaded.
+    """
+
+    def __init__(self, file, index=True):
+        """
+        Args:
+            file (str or os.PathLike or File): The path of the QPY file to
+                write, or a seekable file like object to write the QPY data to
+                at its current position. File like objects are not closed by
+                :meth:`close`.
+            index (bool): If ``True`` an index of the circuits is written on
+                :meth:`close`, which is used by :class:`.QpyReader`.
+
+        Raises:
+            QiskitError: if ``file`` is not seekable.
+        """
+        self._owned = isinstance(file, (str, os.PathLike))
+        self._file = open(file, "wb") if self._owned else file
+        if not self._file.seekable():
+            raise QiskitError("QpyWriter requires a seekable file")
+        self._index = index
+        self._start = self._file.tell()
+        self._file.write(_file_header(0))
+        self._offset = FILE_HEADER_SIZE
+        self._index_entries = []
+        self._closed = False
+
+    @property
+    def num_circuits(self):
+        """The number of circuits written so far.
+
+        Returns:
+            int: the number of circuits
+        """
+        return len(self._index_entries)
+
+    def write(self, circuits):
+        """Append circuits to the QPY data.
+
+        Args:
+            circuits (list or QuantumCircuit): The quantum circuit object(s) to
+                append. This can either be a single QuantumCircuit object or a
+                list of QuantumCircuits.
+
+        Raises:
+            QiskitError: if the writer is closed.
+        """
+        if self._closed:
+            raise QiskitError("Can not write to a closed QpyWriter")
+        if isinstance(circuits, QuantumCircuit):
+            circuits = [circuits]
+        for circuit in circuits:
+            self._index_entries.append((self._offset, circuit.name))
+            self._offset += _write_circuit_data(self._file, circuit)
+
+    def close(self):
+        """Write the file header and the index, and close the file if the writer opened it."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._index:
+            _write_index(self._file, self._index_entries, self._offset)
+        end = self._file.tell()
+        self._file.seek(self._start)
+        self._file.write(_file_header(len(self._index_entries)))
+        self._file.seek(end)
+        if self._owned:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _write_global_phase(global_phase):
+    if isinstance(global_phase, Parameter):
+        type_key = "p"
+        container = io.BytesIO()
+        _write_parameter(container, global_phase)
+        data = container.getvalue()
+    elif isinstance(global_phase, ParameterExpression):
+        type_key = "e"
+        container = io.BytesIO()
+        _write_parameter_expression(container, global_phase)
+        data = container.getvalue()
+    else:
+        type_key = "f"
+        data = struct.pack("!d", global_phase)
+    return type_key.encode("utf8"), data
 
 
 def _write_circuit(file_obj, circuit):
@@ -836,18 +1188,21 @@ def _write_circuit(file_obj, circuit):
     num_registers = len(circuit.qregs) + len(circuit.cregs)
     num_instructions = len(circuit)
     circuit_name = circuit.name.encode("utf8")
-    header_raw = HEADER(
+    global_phase_type, global_phase_data = _write_global_phase(circuit.global_phase)
+    header_raw = HEADER_V3(
         name_size=len(circuit_name),
-        global_phase=circuit.global_phase,
+        global_phase_type=global_phase_type,
+        global_phase_size=len(global_phase_data),
         num_qubits=circuit.num_qubits,
         num_clbits=circuit.num_clbits,
         metadata_size=metadata_size,
         num_registers=num_registers,
         num_instructions=num_instructions,
     )
-    header = struct.pack(HEADER_PACK, *header_raw)
+    header = struct.pack(HEADER_V3_PACK, *header_raw)
     file_obj.write(header)
     file_obj.write(circuit_name)
+    file_obj.write(global_phase_data)
     file_obj.write(metadata_raw)
     qubit_indices = {bit: index for index, bit in enumerate(circuit.qubits)}
     clbit_indices = {bit: index for index, bit in enumerate(circuit.clbits)}
@@ -866,16 +1221,29 @@ def _write_circuit(file_obj, circuit):
             file_obj.write(struct.pack(REGISTER_ARRAY_PACK, *[clbit_indices[bit] for bit in reg]))
     instruction_buffer = io.BytesIO()
     custom_instructions = {}
+    string_table = {}
+    expression_table = {}
     index_map = {}
     index_map["q"] = qubit_indices
     index_map["c"] = clbit_indices
-    for instruction in circuit.data:
-        _write_instruction(instruction_buffer, instruction, custom_instructions, index_map)
+    # read the instructions directly, accessing circuit.data would copy instructions shared
+    # with copies of the circuit
+    for instruction in circuit._data:
+        _write_instruction(
+            instruction_buffer,
+            instruction,
+            custom_instructions,
+            index_map,
+            string_table,
+            expression_table,
+        )
     file_obj.write(struct.pack(CUSTOM_DEFINITION_HEADER_PACK, len(custom_instructions)))
 
     for name, instruction in custom_instructions.items():
         _write_custom_instruction(file_obj, name, instruction)
 
+    _write_string_table(file_obj, string_table)
+    _write_expression_table(file_obj, expression_table)
     instruction_buffer.seek(0)
     file_obj.write(instruction_buffer.read())
     instruction_buffer.close()
@@ -918,10 +1286,25 @@ def load(file_obj):
     Raises:
         QiskitError: if ``file_obj`` is not a valid QPY file
     """
+    file_header = _read_file_header(file_obj)
+    circuits = []
+    for _ in range(file_header[5]):
+        circuits.append(_read_circuit(file_obj, file_header[1]))
+    return circuits
+
+
+def _read_file_header(file_obj):
     file_header_raw = file_obj.read(FILE_HEADER_SIZE)
+    if len(file_header_raw) != FILE_HEADER_SIZE:
+        raise QiskitError("Input file is not a valid QPY file")
     file_header = struct.unpack(FILE_HEADER_PACK, file_header_raw)
     if file_header[0].decode("utf8") != "QISKIT":
         raise QiskitError("Input file is not a valid QPY file")
+    if file_header[1] > QPY_VERSION:
+        raise QiskitError(
+            "The QPY format version of the provided file, %s, is not supported by this "
+            "qiskit version, which supports up to version %s" % (file_header[1], QPY_VERSION)
+        )
     version_parts = [int(x) for x in __version__.split(".")[0:3]]
     header_version_parts = [file_header[2], file_header[3], file_header[4]]
     if (
@@ -941,25 +1324,17 @@ def load(file_obj):
             "file, %s, is newer than the current qiskit version %s. "
             "This may result in an error if the QPY file uses "
             "instructions not present in this current qiskit "
-            "version" % (".".join(header_version_parts), __version__)
+            "version" % (".".join(map(str, header_version_parts)), __version__)
         )
-    circuits = []
-    for _ in range(file_header[5]):
-        circuits.append(_read_circuit(file_obj))
-    return circuits
+    return file_header
 
 
-def _read_circuit(file_obj):
-    header, name, metadata = _read_header(file_obj)
-    (
-        name_size,  # pylint: disable=unused-variable
-        global_phase,
-        num_qubits,
-        num_clbits,
-        metadata_size,  # pylint: disable=unused-variable
-        num_registers,
-        num_instructions,
-    ) = header
+def _read_circuit(file_obj, version):
+    header, name, global_phase, metadata = _read_header(file_obj, version)
+    num_qubits = header.num_qubits
+    num_clbits = header.num_clbits
+    num_registers = header.num_registers
+    num_instructions = header.num_instructions
     registers = {}
     if num_registers > 0:
         circ = QuantumCircuit(name=name, global_phase=global_phase, metadata=metadata)
@@ -987,8 +1362,293 @@ def _read_circuit(file_obj):
             global_phase=global_phase,
             metadata=metadata,
         )
-    custom_instructions = _read_custom_instructions(file_obj)
+    custom_instructions = _read_custom_instructions(file_obj, version)
+    if version < 2:
+        for _instruction in range(num_instructions):
+            _read_instruction(file_obj, circ, registers, custom_instructions)
+        return circ
+
+    strings = _read_string_table(file_obj)
+    expressions = _read_expression_table(file_obj)
+    instructions = []
     for _instruction in range(num_instructions):
-        _read_instruction(file_obj, circ, registers, custom_instructions)
-
+        instructions.append(
+            _read_instruction_v2(file_obj, registers, custom_instructions, strings, expressions)
+        )
+    # the qubit and clbit indices were validated when the circuit was written
+    circ.extend_trusted(instructions)
     return circ
+
+
+def _read_string_table(file_obj):
+    num_strings = struct.unpack(
+        STRING_TABLE_HEADER_PACK, file_obj.read(STRING_TABLE_HEADER_SIZE)
+    )[0]
+    strings = []
+    for _ in range(num_strings):
+        size = struct.unpack(STRING_PACK, file_obj.read(STRING_SIZE))[0]
+        strings.append(file_obj.read(size).decode("utf8"))
+    return strings
+
+
+def _read_expression_table(file_obj):
+    num_expressions = struct.unpack(
+        EXPRESSION_TABLE_HEADER_PACK, file_obj.read(EXPRESSION_TABLE_HEADER_SIZE)
+    )[0]
+    expressions = []
+    for _ in range(num_expressions):
+        type_key, size = struct.unpack(
+            INSTRUCTION_PARAM_PACK, file_obj.read(INSTRUCTION_PARAM_SIZE)
+        )
+        container = io.BytesIO(file_obj.read(size))
+        if type_key == b"p":
+            expressions.append(_read_parameter(container))
+        elif type_key == b"e":
+            expressions.append(_read_parameter_expression(container))
+        else:
+            raise TypeError("Invalid expression table type: %s" % type_key.decode("utf8"))
+    return expressions
+
+
+def _read_instruction_v2(file_obj, registers, custom_instructions, strings, expressions):
+    instruction = INSTRUCTION_V2._make(
+        struct.unpack(INSTRUCTION_V2_PACK, file_obj.read(INSTRUCTION_V2_SIZE))
+    )
+    num_args = instruction.num_qargs + instruction.num_cargs
+    args = struct.unpack("!%sI" % num_args, file_obj.read(4 * num_args))
+    params = []
+    if instruction.num_parameters:
+        type_keys = file_obj.read(instruction.num_parameters).decode("utf8")
+        try:
+            param_pack = "!" + "".join(INSTRUCTION_V2_PARAM_FORMATS[key] for key in type_keys)
+        except KeyError as ex:
+            raise TypeError("Invalid parameter type: %s" % ex.args[0]) from ex
+        values = struct.unpack(param_pack, file_obj.read(struct.calcsize(param_pack)))
+        for type_key, value in zip(type_keys, values):
+            if type_key == "r":
+                value = expressions[value]
+            elif type_key == "n":
+                value = np.load(io.BytesIO(file_obj.read(value)))
+            params.append(value)
+    gate = _build_instruction(
+        strings[instruction.name_index], params, instruction.num_qargs, custom_instructions
+    )
+    if instruction.has_condition:
+        condition_register = strings[instruction.condition_register_index]
+        gate.condition = (registers["c"][condition_register]["register"], instruction.value)
+    return gate, args[: instruction.num_qargs], args[instruction.num_qargs :]
+
+
+def _skip_circuit(file_obj, version):
+    """Move ``file_obj`` past a circuit payload without building the circuit.
+
+    Returns:
+        str: the name of the skipped circuit.
+    """
+    if version < 3:
+        header = HEADER._make(struct.unpack(HEADER_PACK, file_obj.read(HEADER_SIZE)))
+        name = file_obj.read(header.name_size).decode("utf8")
+        file_obj.seek(header.metadata_size, io.SEEK_CUR)
+    else:
+        header = HEADER_V3._make(struct.unpack(HEADER_V3_PACK, file_obj.read(HEADER_V3_SIZE)))
+        name = file_obj.read(header.name_size).decode("utf8")
+        file_obj.seek(header.global_phase_size + header.metadata_size, io.SEEK_CUR)
+    for _ in range(header.num_registers):
+        register = REGISTER._make(struct.unpack(REGISTER_PACK, file_obj.read(REGISTER_SIZE)))
+        file_obj.seek(register.name_size + struct.calcsize("%sI" % register.size), io.SEEK_CUR)
+    num_custom_definitions = struct.unpack(
+        CUSTOM_DEFINITION_HEADER_PACK, file_obj.read(CUSTOM_DEFINITION_HEADER_SIZE)
+    )[0]
+    for _ in range(num_custom_definitions):
+        custom_definition = CUSTOM_DEFINITION._make(
+            struct.unpack(CUSTOM_DEFINITION_PACK, file_obj.read(CUSTOM_DEFINITION_SIZE))
+        )
+        size = custom_definition.size if custom_definition.custom_definition else 0
+        file_obj.seek(custom_definition.gate_name_size + size, io.SEEK_CUR)
+    if version >= 2:
+        _skip_instructions_v2(file_obj, header.num_instructions)
+        return name
+    for _ in range(header.num_instructions):
+        instruction = INSTRUCTION._make(
+            struct.unpack(INSTRUCTION_PACK, file_obj.read(INSTRUCTION_SIZE))
+        )
+        file_obj.seek(
+            instruction.name_size
+            + instruction.condition_register_size
+            + (instruction.num_qargs + instruction.num_cargs) * INSTRUCTION_ARG_SIZE,
+            io.SEEK_CUR,
+        )
+        for _ in range(instruction.num_parameters):
+            param = struct.unpack(INSTRUCTION_PARAM_PACK, file_obj.read(INSTRUCTION_PARAM_SIZE))
+            file_obj.seek(param[1], io.SEEK_CUR)
+    return name
+
+
+def _skip_instructions_v2(file_obj, num_instructions):
+    num_strings = struct.unpack(
+        STRING_TABLE_HEADER_PACK, file_obj.read(STRING_TABLE_HEADER_SIZE)
+    )[0]
+    for _ in range(num_strings):
+        size = struct.unpack(STRING_PACK, file_obj.read(STRING_SIZE))[0]
+        file_obj.seek(size, io.SEEK_CUR)
+    num_expressions = struct.unpack(
+        EXPRESSION_TABLE_HEADER_PACK, file_obj.read(EXPRESSION_TABLE_HEADER_SIZE)
+    )[0]
+    for _ in range(num_expressions):
+        param = struct.unpack(INSTRUCTION_PARAM_PACK, file_obj.read(INSTRUCTION_PARAM_SIZE))
+        file_obj.seek(param[1], io.SEEK_CUR)
+    for _ in range(num_instructions):
+        instruction = INSTRUCTION_V2._make(
+            struct.unpack(INSTRUCTION_V2_PACK, file_obj.read(INSTRUCTION_V2_SIZE))
+        )
+        file_obj.seek(4 * (instruction.num_qargs + instruction.num_cargs), io.SEEK_CUR)
+        if not instruction.num_parameters:
+            continue
+        type_keys = file_obj.read(instruction.num_parameters).decode("utf8")
+        param_pack = "!" + "".join(INSTRUCTION_V2_PARAM_FORMATS[key] for key in type_keys)
+        values = struct.unpack(param_pack, file_obj.read(struct.calcsize(param_pack)))
+        for type_key, value in zip(type_keys, values):
+            if type_key == "n":
+                file_obj.seek(value, io.SEEK_CUR)
+
+
+class QpyReader:
+    """Random access reader for QPY data.
+
+    Unlike :func:`load`, which reads and builds all circuits in the QPY data,
+    a :class:`QpyReader` only reads the file header and the index of the
+    circuits when it is created. Circuits are built when they are accessed, by
+    their position or by their name (the first circuit with that name):
+
+    .. code-block:: python
+
+        from qiskit.circuit.qpy_serialization import QpyReader
+
+        with QpyReader('circuits.qpy') as reader:
+            num_circuits = len(reader)
+            circuit = reader[9000]
+            bell = reader['Bell']
+
+    If the QPY data was written with an index (see :func:`dump`) the circuit
+    positions are read from it, otherwise they are found by scanning the
+    circuit payloads once, without building any circuits. Files are memory
+    mapped by default, so that only the accessed circuits are read from disk.
+
+    Each access builds a new :class:`~qiskit.circuit.QuantumCircuit` object.
+    """
+
+    def __init__(self, file, use_mmap=True):
+        """
+        Args:
+            file (str or os.PathLike or File): The path of a QPY file, or a
+                seekable file like object positioned at the start of the QPY
+                data. File like objects are not closed by :meth:`close`.
+            use_mmap (bool): If ``True`` and ``file`` is a path, the file is
+                memory mapped instead of being read through a file object.
+
+        Raises:
+            QiskitError: if ``file`` does not contain valid QPY data.
+        """
+        self._file = file
+        self._owned = []
+        if isinstance(file, (str, os.PathLike)):
+            self._file = open(file, "rb")
+            self._owned.append(self._file)
+            if use_mmap:
+                try:
+                    self._file = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+                except ValueError as ex:
+                    # empty files can not be mapped
+                    self.close()
+                    raise QiskitError("Input file is not a valid QPY file") from ex
+                self._owned.append(self._file)
+        try:
+            self._start = self._file.tell()
+            file_header = _read_file_header(self._file)
+            self._version = file_header[1]
+            num_circuits = file_header[5]
+            index = self._read_index(num_circuits)
+            if index is None:
+                index = self._scan(num_circuits)
+        except Exception:
+            self.close()
+            raise
+        self._offsets = [offset for offset, _ in index]
+        self._names = [name for _, name in index]
+        self._name_map = {}
+        for position, name in enumerate(self._names):
+            self._name_map.setdefault(name, position)
+
+    def _read_index(self, num_circuits):
+        """Read the index at the end of the data, or return None if there is none."""
+        self._file.seek(0, io.SEEK_END)
+        end = self._file.tell()
+        if end - self._start < FILE_HEADER_SIZE + INDEX_FOOTER_SIZE:
+            return None
+        self._file.seek(end - INDEX_FOOTER_SIZE)
+        footer = INDEX_FOOTER._make(
+            struct.unpack(INDEX_FOOTER_PACK, self._file.read(INDEX_FOOTER_SIZE))
+        )
+        if (
+            footer.magic != INDEX_MAGIC
+            or footer.num_circuits != num_circuits
+            or not FILE_HEADER_SIZE <= footer.index_offset <= end - self._start
+        ):
+            return None
+        self._file.seek(self._start + footer.index_offset)
+        index = []
+        for _ in range(num_circuits):
+            entry = INDEX_ENTRY._make(
+                struct.unpack(INDEX_ENTRY_PACK, self._file.read(INDEX_ENTRY_SIZE))
+            )
+            index.append((entry.offset, self._file.read(entry.name_size).decode("utf8")))
+        return index
+
+    def _scan(self, num_circuits):
+        """Build the index by skipping over all circuit payloads."""
+        self._file.seek(self._start + FILE_HEADER_SIZE)
+        index = []
+        for _ in range(num_circuits):
+            offset = self._file.tell() - self._start
+            index.append((offset, _skip_circuit(self._file, self._version)))
+        return index
+
+    @property
+    def names(self):
+        """The names of the circuits, in the order they are stored in.
+
+        Returns:
+            list: a list of str circuit names.
+        """
+        return list(self._names)
+
+    def __len__(self):
+        return len(self._offsets)
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            try:
+                position = self._name_map[key]
+            except KeyError as ex:
+                raise KeyError("No circuit named '%s' in the QPY data" % key) from ex
+        elif isinstance(key, slice):
+            return [self[position] for position in range(len(self))[key]]
+        else:
+            position = range(len(self))[key]
+        self._file.seek(self._start + self._offsets[position])
+        return _read_circuit(self._file, self._version)
+
+    def __iter__(self):
+        for position in range(len(self)):
+            yield self[position]
+
+    def close(self):
+        """Close the files opened by the reader."""
+        while self._owned:
+            self._owned.pop().close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
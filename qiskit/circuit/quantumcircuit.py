@@ -15,9 +15,10 @@
 """Quantum circuit object."""
 
 import copy
+import io
 import itertools
-import functools
 import warnings
+import weakref
 import numbers
 import multiprocessing as mp
 from collections import OrderedDict, defaultdict
@@ -35,7 +36,8 @@ from qiskit.utils.deprecation import deprecate_function, deprecate_arguments
 from .parameterexpression import ParameterExpression
 from .quantumregister import QuantumRegister, Qubit, AncillaRegister, AncillaQubit
 from .classicalregister import ClassicalRegister, Clbit
-from .parametertable import ParameterTable, ParameterView
+from .parametertable import ParameterTable, ParameterView, _sort_parameters
+from .circuitmetrics import CircuitMetrics
 from .parametervector import ParameterVector, ParameterVectorElement
 from .instructionset import InstructionSet
 from .register import Register
@@ -54,6 +56,54 @@ except Exception:  # pylint: disable=broad-except
     HAS_PYGMENTS = False
 
 
+# names of the gates which are defined by the extension library or by qiskit
+_QASM_EXISTING_GATE_NAMES = {
+    "ch",
+    "cp",
+    "cx",
+    "cy",
+    "cz",
+    "crx",
+    "cry",
+    "crz",
+    "ccx",
+    "cswap",
+    "csx",
+    "cu",
+    "cu1",
+    "cu3",
+    "dcx",
+    "h",
+    "i",
+    "id",
+    "iden",
+    "iswap",
+    "ms",
+    "p",
+    "r",
+    "rx",
+    "rxx",
+    "ry",
+    "ryy",
+    "rz",
+    "rzx",
+    "rzz",
+    "s",
+    "sdg",
+    "swap",
+    "sx",
+    "x",
+    "y",
+    "z",
+    "t",
+    "tdg",
+    "u",
+    "u1",
+    "u2",
+    "u3",
+}
+
+
 class QuantumCircuit:
     """Create a new circuit.
 
@@ -183,6 +233,12 @@ class QuantumCircuit:
         # in the order they were applied.
         self._data = []
 
+        # Instructions in data which are shared with circuits created by copy() and from it.
+        self._sharing = _InstructionSharing()
+
+        # Metrics of data, updated incrementally as instructions are appended.
+        self._metrics = CircuitMetrics()
+
         # This is a map of registers bound to this circuit, by name.
         self.qregs = []
         self.cregs = []
@@ -258,6 +314,7 @@ class QuantumCircuit:
         # below will also empty data_input, so make a shallow copy first.
         data_input = data_input.copy()
         self._data = []
+        self._sharing.borrowed = []
         self._parameter_table = ParameterTable()
 
         for inst, qargs, cargs in data_input:
@@ -952,6 +1009,9 @@ class QuantumCircuit:
 
     def __getitem__(self, item):
         """Return indexed operation."""
+        self._unshare_instructions()
+        # the caller may mutate the returned instructions
+        self._metrics.invalidate()
         return self._data[item]
 
     @staticmethod
@@ -1068,7 +1128,7 @@ class QuantumCircuit:
         expanded_qargs = [self.qbit_argument_conversion(qarg) for qarg in qargs or []]
         expanded_cargs = [self.cbit_argument_conversion(carg) for carg in cargs or []]
 
-        instructions = InstructionSet()
+        instructions = InstructionSet(circuit=self)
         for (qarg, carg) in instruction.broadcast_arguments(expanded_qargs, expanded_cargs):
             instructions.add(self._append(instruction, qarg, carg), qarg, carg)
         return instructions
@@ -1109,6 +1169,78 @@ class QuantumCircuit:
 
         return instruction
 
+    def extend_trusted(self, instructions):
+        """Append many instructions to the end of the circuit without validating them.
+
+        This is a fast path for programmatically generating large circuits. Unlike
+        :meth:`append`, the instructions are not converted, copied or broadcast and the
+        qubits and clbits are not checked, while the parameter table is updated once for
+        all instructions. The caller is responsible for passing valid input; invalid
+        instructions or duplicate qubits are not detected and result in an invalid circuit.
+
+        Args:
+            instructions (Iterable[tuple[Instruction, Sequence[int], Sequence[int]]]): the
+                instructions to append, each given with the indices of the qubits and clbits
+                of this circuit it acts on, e.g. ``(CXGate(), [0, 1], [])``.
+
+        Raises:
+            IndexError: if a qubit or clbit index is out of range. In that case no instruction
+                is appended.
+            CircuitError: if a parameter has the same name as a different parameter in the circuit.
+
+        Examples::
+
+            from qiskit.circuit import QuantumCircuit
+            from qiskit.circuit.library import HGate, CXGate
+
+            num_qubits = 100
+            circuit = QuantumCircuit(num_qubits)
+            circuit.extend_trusted(
+                [(HGate(), [0], [])]
+                + [(CXGate(), [i, i + 1], []) for i in range(num_qubits - 1)]
+            )
+        """
+        qubits, clbits = self._qubits, self._clbits
+        new_data = [
+            (instruction, [qubits[qarg] for qarg in qargs], [clbits[carg] for carg in cargs])
+            for instruction, qargs, cargs in instructions
+        ]
+
+        # collect the parameter table entries of all instructions before updating the table
+        new_entries = {}
+        for instruction, _, _ in new_data:
+            for param_index, param in enumerate(instruction.params):
+                if isinstance(param, ParameterExpression):
+                    for parameter in param.parameters:
+                        new_entries.setdefault(parameter, {})[(id(instruction), param_index)] = (
+                            instruction,
+                            param_index,
+                        )
+
+        names, new_names = self._parameter_table.get_names(), set()
+        for parameter in new_entries:
+            if parameter not in self._parameter_table:
+                if parameter.name in names or parameter.name in new_names:
+                    raise CircuitError(
+                        "Name conflict on adding parameter: {}".format(parameter.name)
+                    )
+                new_names.add(parameter.name)
+
+        self._data.extend(new_data)
+        for parameter, entries in new_entries.items():
+            if parameter in self._parameter_table:
+                current = self._parameter_table[parameter]
+                present = {(id(instruction), param_index) for instruction, param_index in current}
+                current.extend(entry for key, entry in entries.items() if key not in present)
+            else:
+                self._parameter_table[parameter] = list(entries.values())
+                self._parameters = None
+
+        # mark as normal circuit if new instructions are added
+        if new_data:
+            self.duration = None
+            self.unit = "dt"
+
     def _update_parameter_table(self, instruction):
 
         for param_index, param in enumerate(instruction.params):
@@ -1159,6 +1291,8 @@ class QuantumCircuit:
                     " with %s." % (regs,)
                 )
 
+        # the registers are part of the structural hash
+        self._metrics.invalidate_hashes()
         for register in regs:
             if isinstance(register, Register) and any(
                 register.name == reg.name for reg in self.qregs + self.cregs
@@ -1191,6 +1325,7 @@ class QuantumCircuit:
                 "Attempted to add bits found already in circuit: " "{}".format(duplicate_bits)
             )
 
+        self._metrics.invalidate_hashes()
         for bit in bits:
             if isinstance(bit, AncillaQubit):
                 self._ancillas.append(bit)
@@ -1352,65 +1487,101 @@ class QuantumCircuit:
                 ``True``.
             QasmError: If circuit has free parameters.
         """
+        stream = io.StringIO()
+        composite_definitions = []
+        self._write_qasm(stream, composite_definitions)
+        string_temp = stream.getvalue()
+        stream.close()
+
+        if composite_definitions:
+            # Insert composite circuit qasm definitions right after header and extension lib
+            header = self.header + "\n" + self.extension_lib + "\n"
+            string_temp = (
+                header
+                + "".join(definition + "\n" for definition in reversed(composite_definitions))
+                + string_temp[len(header) :]
+            )
+
+        if filename:
+            with open(filename, "w+", encoding=encoding) as file:
+                file.write(string_temp)
+            file.close()
+
+        if formatted:
+            if not HAS_PYGMENTS:
+                raise MissingOptionalLibraryError(
+                    libname="pygments>2.4",
+                    name="formatted QASM output",
+                    pip_install="pip install pygments",
+                )
+            code = pygments.highlight(
+                string_temp, OpenQASMLexer(), Terminal256Formatter(style=QasmTerminalStyle)
+            )
+            print(code)
+            return None
+        else:
+            return string_temp
+
+    def write_qasm(self, stream):
+        """Write the OpenQASM 2 representation of the circuit to a text stream.
+
+        Unlike :meth:`qasm`, which builds the whole program as a string, the
+        program is written line by line, so that large circuits can be exported
+        with bounded memory. The definition of each custom gate is written right
+        before the gate is first used, instead of after the ``include``
+        statement, and is only computed once per gate object.
+
+        Args:
+            stream (TextIO): the text stream to write to, e.g. a file opened in
+                text mode.
+
+        Raises:
+            QasmError: If circuit has free parameters.
+
+        Examples::
+
+            from qiskit.circuit import QuantumCircuit
+
+            circuit = QuantumCircuit(2, 2)
+            circuit.h(0)
+            circuit.cx(0, 1)
+            circuit.measure([0, 1], [0, 1])
+
+            with open("bell.qasm", "w") as file:
+                circuit.write_qasm(file)
+        """
+        self._write_qasm(stream)
+
+    def _write_qasm(self, stream, composite_definitions=None):
+        """Write the OpenQASM 2 program to ``stream``.
+
+        Args:
+            stream (TextIO): the text stream to write to.
+            composite_definitions (list or None): if a list, the definitions of composite
+                gates are appended to it in the order they are first used, instead of being
+                written to ``stream`` before the first use of the gate.
+
+        Raises:
+            QasmError: If circuit has free parameters.
+        """
         from qiskit.circuit.controlledgate import ControlledGate
 
         if self.num_parameters > 0:
             raise QasmError("Cannot represent circuits with unbound parameters in OpenQASM 2.")
 
-        existing_gate_names = [
-            "ch",
-            "cp",
-            "cx",
-            "cy",
-            "cz",
-            "crx",
-            "cry",
-            "crz",
-            "ccx",
-            "cswap",
-            "csx",
-            "cu",
-            "cu1",
-            "cu3",
-            "dcx",
-            "h",
-            "i",
-            "id",
-            "iden",
-            "iswap",
-            "ms",
-            "p",
-            "r",
-            "rx",
-            "rxx",
-            "ry",
-            "ryy",
-            "rz",
-            "rzx",
-            "rzz",
-            "s",
-            "sdg",
-            "swap",
-            "sx",
-            "x",
-            "y",
-            "z",
-            "t",
-            "tdg",
-            "u",
-            "u1",
-            "u2",
-            "u3",
-        ]
-
-        existing_composite_circuits = []
+        existing_gate_names = set(_QASM_EXISTING_GATE_NAMES)
+        # composite instructions by id, whose definition was written, and the written
+        # instruction of each name, to reuse the definition for equal instructions
+        existing_composite_ids = {}
+        existing_composite_names = {}
 
-        string_temp = self.header + "\n"
-        string_temp += self.extension_lib + "\n"
+        write = stream.write
+        write(self.header + "\n")
+        write(self.extension_lib + "\n")
         for register in self.qregs:
-            string_temp += register.qasm() + "\n"
+            write(register.qasm() + "\n")
         for register in self.cregs:
-            string_temp += register.qasm() + "\n"
+            write(register.qasm() + "\n")
 
         qreg_bits = set(bit for reg in self.qregs for bit in reg)
         creg_bits = set(bit for reg in self.cregs for bit in reg)
@@ -1419,11 +1590,11 @@ class QuantumCircuit:
 
         if set(self.qubits) != qreg_bits:
             regless_qubits = [bit for bit in self.qubits if bit not in qreg_bits]
-            string_temp += "qreg %s[%d];\n" % ("regless", len(regless_qubits))
+            write("qreg %s[%d];\n" % ("regless", len(regless_qubits)))
 
         if set(self.clbits) != creg_bits:
             regless_clbits = [bit for bit in self.clbits if bit not in creg_bits]
-            string_temp += "creg %s[%d];\n" % ("regless", len(regless_clbits))
+            write("creg %s[%d];\n" % ("regless", len(regless_clbits)))
 
         unitary_gates = []
 
@@ -1441,84 +1612,59 @@ class QuantumCircuit:
             }
         )
 
-        for instruction, qargs, cargs in self._data:
-            if instruction.name == "measure":
-                qubit = qargs[0]
-                clbit = cargs[0]
-                string_temp += "%s %s -> %s;\n" % (
-                    instruction.qasm(),
-                    bit_labels[qubit],
-                    bit_labels[clbit],
-                )
-
-            # If instruction is a root gate or a root instruction (in that case, compositive)
-
-            elif (
-                type(instruction)
-                in [
-                    Gate,
-                    Instruction,
-                ]
-                or (isinstance(instruction, ControlledGate) and instruction._open_ctrl)
-            ):
-                if instruction not in existing_composite_circuits:
-                    if instruction.name in existing_gate_names:
-                        old_name = instruction.name
-                        instruction.name += "_" + str(id(instruction))
-
-                        warnings.warn(
-                            "A gate named {} already exists. "
-                            "We have renamed "
-                            "your gate to {}".format(old_name, instruction.name)
-                        )
-
-                    # Get qasm of composite circuit
-                    qasm_string = self._get_composite_circuit_qasm_from_instruction(instruction)
-
-                    # Insert composite circuit qasm definition right after header and extension lib
-                    string_temp = string_temp.replace(
-                        self.extension_lib, "%s\n%s" % (self.extension_lib, qasm_string)
+        try:
+            for instruction, qargs, cargs in self._data:
+                if instruction.name == "measure":
+                    qubit = qargs[0]
+                    clbit = cargs[0]
+                    write(
+                        "%s %s -> %s;\n"
+                        % (instruction.qasm(), bit_labels[qubit], bit_labels[clbit])
                     )
+                    continue
 
-                    existing_composite_circuits.append(instruction)
-                    existing_gate_names.append(instruction.name)
-
-                # Insert qasm representation of the original instruction
-                string_temp += "%s %s;\n" % (
-                    instruction.qasm(),
-                    ",".join([bit_labels[j] for j in qargs + cargs]),
-                )
-            else:
-                string_temp += "%s %s;\n" % (
-                    instruction.qasm(),
-                    ",".join([bit_labels[j] for j in qargs + cargs]),
-                )
-            if instruction.name == "unitary":
-                unitary_gates.append(instruction)
+                # If instruction is a root gate or a root instruction (in that case, compositive)
+                if type(instruction) in [Gate, Instruction] or (
+                    isinstance(instruction, ControlledGate) and instruction._open_ctrl
+                ):
+                    if id(instruction) not in existing_composite_ids:
+                        existing = existing_composite_names.get(instruction.name)
+                        if existing is None or existing != instruction:
+                            if instruction.name in existing_gate_names:
+                                old_name = instruction.name
+                                instruction.name += "_" + str(id(instruction))
+                                self._metrics.invalidate()
+
+                                warnings.warn(
+                                    "A gate named {} already exists. "
+                                    "We have renamed "
+                                    "your gate to {}".format(old_name, instruction.name)
+                                )
+
+                            # Get qasm of composite circuit
+                            qasm_string = self._get_composite_circuit_qasm_from_instruction(
+                                instruction
+                            )
+                            if composite_definitions is None:
+                                write(qasm_string + "\n")
+                            else:
+                                composite_definitions.append(qasm_string)
 
-        # this resets them, so if another call to qasm() is made the gate def is added again
-        for gate in unitary_gates:
-            gate._qasm_def_written = False
+                            existing_composite_names[instruction.name] = instruction
+                            existing_gate_names.add(instruction.name)
+                        existing_composite_ids[id(instruction)] = instruction
 
-        if filename:
-            with open(filename, "w+", encoding=encoding) as file:
-                file.write(string_temp)
-            file.close()
-
-        if formatted:
-            if not HAS_PYGMENTS:
-                raise MissingOptionalLibraryError(
-                    libname="pygments>2.4",
-                    name="formatted QASM output",
-                    pip_install="pip install pygments",
+                # Insert qasm representation of the original instruction
+                write(
+                    "%s %s;\n"
+                    % (instruction.qasm(), ",".join([bit_labels[j] for j in qargs + cargs]))
                 )
-            code = pygments.highlight(
-                string_temp, OpenQASMLexer(), Terminal256Formatter(style=QasmTerminalStyle)
-            )
-            print(code)
-            return None
-        else:
-            return string_temp
+                if instruction.name == "unitary":
+                    unitary_gates.append(instruction)
+        finally:
+            # this resets them, so if another call to qasm() is made the gate def is added again
+            for gate in unitary_gates:
+                gate._qasm_def_written = False
 
     def draw(
         self,
@@ -1677,11 +1823,7 @@ class QuantumCircuit:
         Returns:
             int: Total number of gate operations.
         """
-        gate_ops = 0
-        for instr, _, _ in self._data:
-            if not instr._directive:
-                gate_ops += 1
-        return gate_ops
+        return self._updated_metrics().size
 
     def depth(self):
         """Return circuit depth (i.e., length of critical path).
@@ -1695,63 +1837,7 @@ class QuantumCircuit:
             The circuit depth and the DAG depth need not be the
             same.
         """
-        # Assign each bit in the circuit a unique integer
-        # to index into op_stack.
-        bit_indices = {bit: idx for idx, bit in enumerate(self.qubits + self.clbits)}
-
-        # If no bits, return 0
-        if not bit_indices:
-            return 0
-
-        # A list that holds the height of each qubit
-        # and classical bit.
-        op_stack = [0] * len(bit_indices)
-
-        # Here we are playing a modified version of
-        # Tetris where we stack gates, but multi-qubit
-        # gates, or measurements have a block for each
-        # qubit or cbit that are connected by a virtual
-        # line so that they all stacked at the same depth.
-        # Conditional gates act on all cbits in the register
-        # they are conditioned on.
-        # We treat barriers or snapshots different as
-        # They are transpiler and simulator directives.
-        # The max stack height is the circuit depth.
-        for instr, qargs, cargs in self._data:
-            levels = []
-            reg_ints = []
-            # If count then add one to stack heights
-            count = True
-            if instr._directive:
-                count = False
-            for ind, reg in enumerate(qargs + cargs):
-                # Add to the stacks of the qubits and
-                # cbits used in the gate.
-                reg_ints.append(bit_indices[reg])
-                if count:
-                    levels.append(op_stack[reg_ints[ind]] + 1)
-                else:
-                    levels.append(op_stack[reg_ints[ind]])
-            # Assuming here that there is no conditional
-            # snapshots or barriers ever.
-            if instr.condition:
-                # Controls operate over all bits of a classical register
-                # or over a single bit
-                if isinstance(instr.condition[0], Clbit):
-                    condition_bits = [instr.condition[0]]
-                else:
-                    condition_bits = instr.condition[0]
-                for cbit in condition_bits:
-                    idx = bit_indices[cbit]
-                    if idx not in reg_ints:
-                        reg_ints.append(idx)
-                        levels.append(op_stack[idx] + 1)
-
-            max_level = max(levels)
-            for ind in reg_ints:
-                op_stack[ind] = max_level
-
-        return max(op_stack)
+        return self._updated_metrics().depth
 
     def width(self):
         """Return number of qubits plus clbits in circuit.
@@ -1783,9 +1869,7 @@ class QuantumCircuit:
         Returns:
             OrderedDict: a breakdown of how many operations of each kind, sorted by amount.
         """
-        count_ops = {}
-        for instr, _, _ in self._data:
-            count_ops[instr.name] = count_ops.get(instr.name, 0) + 1
+        count_ops = self._updated_metrics().count_ops
         return OrderedDict(sorted(count_ops.items(), key=lambda kv: kv[1], reverse=True))
 
     def num_nonlocal_gates(self):
@@ -1793,11 +1877,7 @@ class QuantumCircuit:
 
         Conditional nonlocal gates are also included.
         """
-        multi_qubit_gates = 0
-        for instr, _, _ in self._data:
-            if instr.num_qubits > 1 and not instr._directive:
-                multi_qubit_gates += 1
-        return multi_qubit_gates
+        return self._updated_metrics().num_nonlocal_gates
 
     def num_connected_components(self, unitary_only=False):
         """How many non-entangled subcircuits can the circuit be factored to.
@@ -1808,68 +1888,42 @@ class QuantumCircuit:
         Returns:
             int: Number of connected components in circuit.
         """
-        # Convert registers to ints (as done in depth).
-        bits = self.qubits if unitary_only else (self.qubits + self.clbits)
-        bit_indices = {bit: idx for idx, bit in enumerate(bits)}
+        num_bits = len(self._qubits) if unitary_only else len(self._qubits) + len(self._clbits)
+        return self._updated_metrics().num_connected_components(num_bits, unitary_only)
 
-        # Start with each qubit or cbit being its own subgraph.
-        sub_graphs = [[bit] for bit in range(len(bit_indices))]
+    def structural_hash(self, parameters=True):
+        """Return a hash of the structure of the circuit.
 
-        num_sub_graphs = len(sub_graphs)
+        Circuits with equal instructions applied to the same qubits and clbits, in the same
+        order and with the same registers, have the same hash, regardless of their names and
+        metadata. Unbound parameters are identified by their names and UUIDs, which are kept
+        when pickling the circuit. The hash is stable across processes.
 
-        # Here we are traversing the gates and looking to see
-        # which of the sub_graphs the gate joins together.
-        for instr, qargs, cargs in self._data:
-            if unitary_only:
-                args = qargs
-                num_qargs = len(args)
-            else:
-                args = qargs + cargs
-                num_qargs = len(args) + (1 if instr.condition else 0)
-
-            if num_qargs >= 2 and not instr._directive:
-                graphs_touched = []
-                num_touched = 0
-                # Controls necessarily join all the cbits in the
-                # register that they use.
-                if instr.condition and not unitary_only:
-                    creg = instr.condition[0]
-                    for bit in creg:
-                        idx = bit_indices[bit]
-                        for k in range(num_sub_graphs):
-                            if idx in sub_graphs[k]:
-                                graphs_touched.append(k)
-                                break
-
-                for item in args:
-                    reg_int = bit_indices[item]
-                    for k in range(num_sub_graphs):
-                        if reg_int in sub_graphs[k]:
-                            if k not in graphs_touched:
-                                graphs_touched.append(k)
-                                break
-
-                graphs_touched = list(set(graphs_touched))
-                num_touched = len(graphs_touched)
-
-                # If the gate touches more than one subgraph
-                # join those graphs together and return
-                # reduced number of subgraphs
-                if num_touched > 1:
-                    connections = []
-                    for idx in graphs_touched:
-                        connections.extend(sub_graphs[idx])
-                    _sub_graphs = []
-                    for idx in range(num_sub_graphs):
-                        if idx not in graphs_touched:
-                            _sub_graphs.append(sub_graphs[idx])
-                    _sub_graphs.append(connections)
-                    sub_graphs = _sub_graphs
-                    num_sub_graphs -= num_touched - 1
-            # Cannot go lower than one so break
-            if num_sub_graphs == 1:
-                break
-        return num_sub_graphs
+        The hash is cached on the circuit until it is modified, like the metrics returned by
+        :meth:`depth` or :meth:`count_ops`. Modifications of instructions made outside of the
+        circuit, other than through :attr:`data`, are not tracked.
+
+        Args:
+            parameters (bool): If True, the values of the instruction parameters and of the
+                global phase are part of the hash. Otherwise, circuits which only differ in
+                their parameter values have the same hash.
+
+        Returns:
+            str: The hexadecimal digest of the structural hash.
+        """
+        from qiskit.circuit.structuralhash import circuit_hash  # pylint: disable=cyclic-import
+
+        hashes = self._metrics.hashes_for(self._data)
+        digest = hashes.get(parameters)
+        if digest is None:
+            digest = hashes[parameters] = circuit_hash(self, parameters)
+        return digest
+
+    def _updated_metrics(self):
+        """Return the metrics of the circuit data, processing the instructions appended since
+        the last call."""
+        self._metrics.update(self._data)
+        return self._metrics
 
     def num_unitary_factors(self):
         """Computes the number of tensor factors in the unitary
@@ -1891,6 +1945,11 @@ class QuantumCircuit:
     def copy(self, name=None):
         """Copy the circuit.
 
+        The instructions are not copied immediately but shared between the copy and this
+        circuit. The copy replaces a shared instruction by a private copy once either circuit
+        mutates it, e.g. when binding its parameters, or hands it out through :attr:`data`,
+        so that this circuit always keeps its own instruction objects.
+
         Args:
           name (str): name to be given to the copied circuit. If None, then the name stays the same
 
@@ -1906,24 +1965,12 @@ class QuantumCircuit:
         cpy._qubit_set = self._qubit_set.copy()
         cpy._clbit_set = self._clbit_set.copy()
 
-        instr_instances = {id(instr): instr for instr, _, __ in self._data}
+        cpy._sharing = _InstructionSharing(instr for instr, _, _ in self._data)
+        self._sharing.add_copy(cpy)
 
-        instr_copies = {id_: instr.copy() for id_, instr in instr_instances.items()}
-
-        cpy._parameter_table = ParameterTable(
-            {
-                param: [
-                    (instr_copies[id(instr)], param_index)
-                    for instr, param_index in self._parameter_table[param]
-                ]
-                for param in self._parameter_table
-            }
-        )
-
-        cpy._data = [
-            (instr_copies[id(inst)], qargs.copy(), cargs.copy())
-            for inst, qargs, cargs in self._data
-        ]
+        cpy._parameter_table = self._parameter_table.copy()
+        cpy._data = self._data.copy()
+        cpy._metrics = self._metrics.copy(self._data, cpy._data)
 
         cpy._calibrations = copy.deepcopy(self._calibrations)
         cpy._metadata = copy.deepcopy(self._metadata)
@@ -1932,6 +1979,68 @@ class QuantumCircuit:
             cpy.name = name
         return cpy
 
+    def _unshare_instructions(self, instructions=None):
+        """Make sure that instructions about to be mutated are not shared with other circuits.
+
+        Instructions that this circuit borrowed from the circuit it was copied from are replaced
+        by private copies, and the circuits copied from this one do the same. The instructions
+        thus stay in the circuit which created them, like in the :class:`.InstructionSet`
+        returned when they were appended.
+
+        Args:
+            instructions (Iterable[Instruction]): the instructions about to be mutated. If None,
+                all instructions in the circuit may be mutated.
+        """
+        sharing = self._sharing
+        if not sharing.borrowed and not sharing.copies:
+            return
+
+        if instructions is None:
+            targets = [instr for instr, _, _ in self._data]
+        else:
+            targets = list(instructions)
+            if not targets:
+                return
+
+        for circuit in sharing.live_copies():
+            circuit._unshare_instructions(targets)
+        if instructions is None:
+            # the copies no longer borrow any instruction in data
+            sharing.copies = []
+
+        if not sharing.borrowed:
+            return
+        target_ids = {id(instr) for instr in targets}
+        borrowed_ids = {id(instr) for instr in sharing.borrowed}
+        if target_ids.isdisjoint(borrowed_ids):
+            return
+        target_ids &= borrowed_ids
+
+        # an instruction may appear several times in data, all appearances get the same copy
+        copies = {}
+        for index, (instr, qargs, cargs) in enumerate(self._data):
+            if id(instr) in target_ids:
+                instr_copy = copies.get(id(instr))
+                if instr_copy is None:
+                    instr_copy = copies[id(instr)] = instr.copy()
+                self._data[index] = (instr_copy, qargs.copy(), cargs.copy())
+        self._metrics.invalidate()
+
+        affected_parameters = set()
+        for instr_copy in copies.values():
+            for param in instr_copy.params:
+                if isinstance(param, ParameterExpression):
+                    affected_parameters.update(param.parameters)
+
+        for parameter in affected_parameters:
+            if parameter in self._parameter_table:
+                self._parameter_table[parameter] = [
+                    (copies.get(id(instr), instr), param_index)
+                    for instr, param_index in self._parameter_table[parameter]
+                ]
+
+        sharing.borrowed = [instr for instr in sharing.borrowed if id(instr) not in target_ids]
+
     def _create_creg(self, length, name):
         """Creates a creg, checking if ClassicalRegister with same name exists"""
         if name in [creg.name for creg in self.cregs]:
@@ -2090,6 +2199,7 @@ class QuantumCircuit:
         Args:
             angle (float, ParameterExpression): radians
         """
+        self._metrics.invalidate_parameters()
         if isinstance(angle, ParameterExpression) and angle.parameters:
             self._global_phase = angle
         else:
@@ -2105,8 +2215,12 @@ class QuantumCircuit:
         """Convenience function to get the parameters defined in the parameter table."""
         # parameters from gates
         if self._parameters is None:
-            unsorted = self._unsorted_parameters()
-            self._parameters = sorted(unsorted, key=functools.cmp_to_key(_compare_parameters))
+            parameters = self._parameter_table.get_sorted_keys()
+            if isinstance(self.global_phase, ParameterExpression):
+                phase_parameters = self.global_phase.parameters
+                if any(parameter not in self._parameter_table for parameter in phase_parameters):
+                    parameters = _sort_parameters(set(parameters) | phase_parameters)
+            self._parameters = parameters
 
         # return as parameter view, which implements the set and list interface
         return ParameterView(self._parameters)
@@ -2114,7 +2228,12 @@ class QuantumCircuit:
     @property
     def num_parameters(self):
         """Convenience function to get the number of parameter objects in the circuit."""
-        return len(self._unsorted_parameters())
+        num_parameters = len(self._parameter_table)
+        if isinstance(self.global_phase, ParameterExpression):
+            num_parameters += sum(
+                parameter not in self._parameter_table for parameter in self.global_phase.parameters
+            )
+        return num_parameters
 
     def _unsorted_parameters(self):
         """Efficiently get all parameters in the circuit, without any sorting overhead."""
@@ -2221,17 +2340,23 @@ class QuantumCircuit:
                     )
                 )
 
-            # replace the parameters with a new Parameter ("substitute") or numeric value ("bind")
-            for parameter, value in unrolled_param_dict.items():
-                bound_circuit._assign_parameter(parameter, value)
         else:
             if len(parameters) != self.num_parameters:
                 raise ValueError(
                     "Mismatching number of values and parameters. For partial binding "
                     "please pass a dictionary of {parameter: value} pairs."
                 )
-            for i, value in enumerate(parameters):
-                bound_circuit._assign_parameter(self.parameters[i], value)
+            unrolled_param_dict = dict(zip(self.parameters, parameters))
+
+        # copy all shared instructions that are about to be rebound in a single pass
+        bound_circuit._unshare_parameterized_instructions(unrolled_param_dict)
+
+        if all(isinstance(value, numbers.Real) for value in unrolled_param_dict.values()):
+            bound_circuit._bind_parameter_values(unrolled_param_dict)
+        else:
+            # replace the parameters with a new Parameter ("substitute") or numeric value ("bind")
+            for parameter, value in unrolled_param_dict.items():
+                bound_circuit._assign_parameter(parameter, value)
         return None if inplace else bound_circuit
 
     @deprecate_arguments({"value_dict": "values"})
@@ -2265,6 +2390,103 @@ class QuantumCircuit:
                 )
             return self.assign_parameters(values)
 
+    def bind_parameters_batch(self, values):
+        """Assign many sets of numeric values to the parameters, yielding one circuit per set.
+
+        Every parameter expression in the circuit is compiled to a numeric function (see
+        :meth:`.ParameterExpression.compile`) and evaluated on all sets of values at once. The
+        returned circuits share all instructions which do not depend on the parameters with
+        this circuit.
+
+        Args:
+            values (np.ndarray): array of shape ``(N, num_parameters)``, where row ``i`` contains
+                the values of the ``i``-th binding, ordered as :attr:`parameters`.
+
+        Raises:
+            ValueError: If values is not a two-dimensional array with one column per parameter.
+            ZeroDivisionError: If binding the values requires division by zero.
+
+        Returns:
+            list[QuantumCircuit]: the ``N`` circuits with bound parameters.
+        """
+        values = np.asarray(values)
+        parameters = self.parameters
+        if values.ndim != 2 or values.shape[1] != len(parameters):
+            raise ValueError(
+                "Expected an array of shape (N, {}) for the {} parameters of the circuit, "
+                "got shape {}.".format(len(parameters), len(parameters), values.shape)
+            )
+        columns = {parameter: column for column, parameter in enumerate(parameters)}
+
+        # the values of every distinct expression for all bindings, computed once
+        expression_values = {}
+
+        def evaluate(expression):
+            if expression not in expression_values:
+                expr_parameters = sorted(expression.parameters, key=lambda p: p.name)
+                function = expression.compile(expr_parameters)
+                result = function(values[:, [columns[p] for p in expr_parameters]])
+                if np.any(np.isinf(result)):
+                    raise ZeroDivisionError(
+                        "Binding provided for expression results in division by zero "
+                        "(Expression: {}).".format(expression)
+                    )
+                expression_values[expression] = result.tolist()
+            return expression_values[expression]
+
+        # parameterized instructions, by id, with their parameter slots and values
+        parameterized = {}
+        for parameter in self._parameter_table:
+            for instr, param_index in self._parameter_table[parameter]:
+                slots = parameterized.setdefault(id(instr), (instr, {}))[1]
+                if param_index not in slots:
+                    slots[param_index] = evaluate(instr.params[param_index])
+        positions = [
+            index for index, (instr, _, _) in enumerate(self._data) if id(instr) in parameterized
+        ]
+
+        global_phase = self.global_phase
+        if isinstance(global_phase, ParameterExpression) and global_phase.parameters:
+            global_phase = evaluate(global_phase)
+        else:
+            global_phase = None
+
+        bound_circuits = []
+        for row in range(values.shape[0]):
+            bound_circuit = self.copy()
+            self._increment_instances()
+            bound_circuit._name_update()
+            bound_circuit._parameter_table = ParameterTable()
+            bound_circuit._parameters = None
+
+            copies = {}
+            for key, (instr, slots) in parameterized.items():
+                instr_copy = copies[key] = instr.copy()
+                for param_index, param_values in slots.items():
+                    instr_copy.params[param_index] = instr_copy.validate_parameter(
+                        ParameterExpression._from_number(param_values[row])
+                    )
+                if instr_copy._definition:
+                    for parameter in _instruction_parameters(instr):
+                        bound_circuit._rebind_definition(
+                            instr_copy, parameter, values[row, columns[parameter]].item()
+                        )
+            for index in positions:
+                instr, qargs, cargs = bound_circuit._data[index]
+                bound_circuit._data[index] = (copies[id(instr)], qargs.copy(), cargs.copy())
+            bound_circuit._metrics.invalidate_parameters()
+
+            if global_phase is not None:
+                bound_circuit.global_phase = global_phase[row]
+            if self._calibrations:
+                for parameter, column in columns.items():
+                    bound_circuit._assign_calibration_parameters(
+                        parameter, values[row, column].item()
+                    )
+            bound_circuits.append(bound_circuit)
+
+        return bound_circuits
+
     def _unroll_param_dict(self, value_dict):
         unrolled_value_dict = {}
         for (param, value) in value_dict.items():
@@ -2281,6 +2503,16 @@ class QuantumCircuit:
                 unrolled_value_dict[param] = value
         return unrolled_value_dict
 
+    def _unshare_parameterized_instructions(self, parameters):
+        """Copy the shared instructions which depend on any of ``parameters``."""
+        if self._sharing.borrowed or self._sharing.copies:
+            self._unshare_instructions(
+                instr
+                for parameter in parameters
+                if parameter in self._parameter_table
+                for instr, _ in self._parameter_table[parameter]
+            )
+
     def _assign_parameter(self, parameter, value):
         """Update this circuit where instances of ``parameter`` are replaced by ``value``, which
         can be either a numeric value or a new parameter expression.
@@ -2292,6 +2524,8 @@ class QuantumCircuit:
         """
         # parameter might be in global phase only
         if parameter in self._parameter_table.keys():
+            self._unshare_parameterized_instructions([parameter])
+            self._metrics.invalidate_parameters()
             for instr, param_index in self._parameter_table[parameter]:
                 new_param = instr.params[param_index].assign(parameter, value)
                 # if fully bound, validate
@@ -2322,6 +2556,65 @@ class QuantumCircuit:
         self._parameters = None
         self._assign_calibration_parameters(parameter, value)
 
+    def _bind_parameter_values(self, parameter_values):
+        """Update this circuit where instances of the parameters are replaced by real values.
+
+        Unlike calling :meth:`_assign_parameter` for each parameter, every parameter expression
+        is bound only once to the values of all its parameters, which lets fully bound
+        expressions be evaluated by their compiled numeric function (see
+        :meth:`.ParameterExpression.compile`).
+
+        Args:
+            parameter_values (dict): Mapping of the parameters to bind to real values.
+        """
+        slots = {}
+        for parameter in parameter_values:
+            if parameter in self._parameter_table:
+                for instr, param_index in self._parameter_table[parameter]:
+                    slots[(id(instr), param_index)] = (instr, param_index)
+
+        if slots:
+            self._metrics.invalidate_parameters()
+        rebound_definitions = set()
+        for instr, param_index in slots.values():
+            expression = instr.params[param_index]
+            new_param = expression.bind(
+                {
+                    parameter: parameter_values[parameter]
+                    for parameter in sorted(expression.parameters, key=lambda p: p.name)
+                    if parameter in parameter_values
+                }
+            )
+            if new_param.parameters:
+                instr.params[param_index] = new_param
+            else:
+                instr.params[param_index] = instr.validate_parameter(new_param)
+
+            if instr._definition:
+                for parameter in expression.parameters & parameter_values.keys():
+                    if (id(instr), parameter) not in rebound_definitions:
+                        rebound_definitions.add((id(instr), parameter))
+                        self._rebind_definition(instr, parameter, parameter_values[parameter])
+
+        for parameter in parameter_values:
+            if parameter in self._parameter_table:
+                del self._parameter_table[parameter]
+
+        if isinstance(self.global_phase, ParameterExpression):
+            phase_values = {
+                parameter: value
+                for parameter, value in parameter_values.items()
+                if parameter in self.global_phase.parameters
+            }
+            if phase_values:
+                self.global_phase = self.global_phase.bind(phase_values)
+
+        # clear parameter cache
+        self._parameters = None
+        if self._calibrations:
+            for parameter, value in parameter_values.items():
+                self._assign_calibration_parameters(parameter, value)
+
     def _assign_calibration_parameters(self, parameter, value):
         """Update parameterized pulse gate calibrations, if there are any which contain
         ``parameter``. This updates the calibration mapping as well as the gate definition
@@ -3010,12 +3303,30 @@ def _circuit_from_qasm(qasm):
     # pylint: disable=cyclic-import
     from qiskit.converters import ast_to_dag
     from qiskit.converters import dag_to_circuit
+    from qiskit.qasm.fastparser import circuit_from_qasm
+
+    # programs only using qelib1.inc gates are converted without building an AST
+    data = qasm.return_data()
+    circuit = circuit_from_qasm(data)
+    if circuit is not None:
+        return circuit
 
-    ast = qasm.parse()
+    # parse the data read already rather than reading the file again
+    ast = Qasm(data=data).parse()
     dag = ast_to_dag(ast)
     return dag_to_circuit(dag)
 
 
+def _instruction_parameters(instruction):
+    """Return the unbound parameters of the parameter expressions of ``instruction``."""
+    return {
+        parameter
+        for param in instruction.params
+        if isinstance(param, ParameterExpression)
+        for parameter in param.parameters
+    }
+
+
 def _standard_compare(value1, value2):
     if value1 < value2:
         return -1
@@ -3032,3 +3343,38 @@ def _compare_parameters(param1, param2):
 
     # else sort by name
     return _standard_compare(param1.name, param2.name)
+
+
+class _InstructionSharing:
+    """The instructions a circuit shares with other circuits through :meth:`.QuantumCircuit.copy`.
+
+    The instruction objects are owned by the circuit which created them: a copy borrows them and
+    replaces them by private copies before they are mutated, by either circuit. Sharing is not
+    preserved by pickling and deep copies, which copy all instructions anyway.
+    """
+
+    __slots__ = ("borrowed", "copies")
+
+    def __init__(self, borrowed=()):
+        # instructions in data which are owned by the circuit copied from (strong references,
+        # so that their ids can not be reused while they are borrowed)
+        self.borrowed = list(borrowed)
+        # weak references to the circuits copied from this circuit, which may borrow
+        # instructions in its data
+        self.copies = []
+
+    def add_copy(self, circuit):
+        """Register a circuit copied from the circuit."""
+        self.copies = [ref for ref in self.copies if ref() is not None]
+        self.copies.append(weakref.ref(circuit))
+
+    def live_copies(self):
+        """Return the circuits copied from the circuit which are still alive."""
+        circuits = [ref() for ref in self.copies]
+        return [circuit for circuit in circuits if circuit is not None]
+
+    def __reduce__(self):
+        return (_InstructionSharing, ())
+
+    def __deepcopy__(self, memo):
+        return _InstructionSharing()
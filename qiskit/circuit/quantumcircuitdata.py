@@ -27,6 +27,10 @@ class QuantumCircuitData(MutableSequence):
         self._circuit = circuit
 
     def __getitem__(self, i):
+        # the caller may mutate the returned instructions, so stop sharing them and
+        # recompute the cached metrics afterwards
+        self._circuit._unshare_instructions()
+        self._circuit._metrics.invalidate()
         return self._circuit._data[i]
 
     def __setitem__(self, key, value):
@@ -55,6 +59,7 @@ class QuantumCircuitData(MutableSequence):
         self._circuit._check_cargs(cargs)
 
         self._circuit._data[key] = (instruction, qargs, cargs)
+        self._circuit._metrics.invalidate()
 
         self._circuit._update_parameter_table(instruction)
 
@@ -64,6 +69,7 @@ class QuantumCircuitData(MutableSequence):
 
     def __delitem__(self, i):
         del self._circuit._data[i]
+        self._circuit._metrics.invalidate()
 
     def __len__(self):
         return len(self._circuit._data)
@@ -90,21 +96,32 @@ class QuantumCircuitData(MutableSequence):
         return self._circuit._data >= self.__cast(other)
 
     def __add__(self, other):
+        self._circuit._unshare_instructions()
+        self._circuit._metrics.invalidate()
         return self._circuit._data + self.__cast(other)
 
     def __radd__(self, other):
+        self._circuit._unshare_instructions()
+        self._circuit._metrics.invalidate()
         return self.__cast(other) + self._circuit._data
 
     def __mul__(self, n):
+        self._circuit._unshare_instructions()
+        self._circuit._metrics.invalidate()
         return self._circuit._data * n
 
     def __rmul__(self, n):
+        self._circuit._unshare_instructions()
+        self._circuit._metrics.invalidate()
         return n * self._circuit._data
 
     def sort(self, *args, **kwargs):
         """In-place stable sort. Accepts arguments of list.sort."""
         self._circuit._data.sort(*args, **kwargs)
+        self._circuit._metrics.invalidate()
 
     def copy(self):
         """Returns a shallow copy of instruction list."""
+        self._circuit._unshare_instructions()
+        self._circuit._metrics.invalidate()
         return self._circuit._data.copy()
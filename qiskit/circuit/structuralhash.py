@@ -0,0 +1,211 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""
+Canonical encoding of instructions and circuits for structural hashing.
+
+Instructions are encoded as strings made of their class, name, dimensions, parameters and
+other attributes, and circuits as the encodings of their instructions together with the
+indices of the bits they act on. Unbound parameters are encoded by their names and UUIDs.
+The encodings do not depend on object identities or on the Python hash seed, so the resulting
+digests are stable across processes and sessions.
+"""
+
+import hashlib
+import itertools
+import numbers
+
+import numpy
+
+from .classicalregister import Clbit
+from .controlledgate import ControlledGate
+from .gate import Gate
+from .instruction import Instruction
+from .parameterexpression import ParameterExpression
+
+# digest size in bytes of the structural hashes
+DIGEST_SIZE = 16
+
+# attributes which are not part of the structure of an instruction, or are encoded separately
+_IGNORED_ATTRIBUTES = frozenset(
+    [
+        "_definition",
+        "condition",
+        "_label",
+        "_duration",
+        "_unit",
+        "_params",
+        "name",
+        "_name",
+        "num_qubits",
+        "num_clbits",
+    ]
+)
+
+# instruction classes whose instances are only defined through a set definition
+_PLAIN_TYPES = (Gate, Instruction, ControlledGate)
+
+
+def new_hash():
+    """Return a new hash object for structural hashes."""
+    return hashlib.blake2b(digest_size=DIGEST_SIZE)
+
+
+def instruction_hash(instruction, parameters=True):
+    """Return the structural hash of an instruction.
+
+    Args:
+        instruction (Instruction): the instruction.
+        parameters (bool): include the values of the parameters in the hash.
+
+    Returns:
+        str: the hexadecimal digest of the structural hash.
+    """
+    hash_obj = new_hash()
+    hash_obj.update(instruction_token(instruction, parameters).encode("utf8"))
+    return hash_obj.hexdigest()
+
+
+def instruction_token(instruction, parameters, bit_indices=None):
+    """Return the canonical encoding of an instruction.
+
+    Args:
+        instruction (Instruction): the instruction.
+        parameters (bool): include the values of the parameters.
+        bit_indices (dict): indices of the bits of the circuit containing the instruction,
+            used to encode a condition on a classical bit.
+
+    Returns:
+        str: the encoding of ``instruction``.
+    """
+    cls = type(instruction)
+    tokens = [
+        "%s.%s" % (cls.__module__, cls.__qualname__),
+        repr(instruction.name),
+        str(instruction.num_qubits),
+        str(instruction.num_clbits),
+    ]
+    if parameters:
+        tokens.append(_value_token(instruction.params, parameters))
+    else:
+        tokens.append(str(len(instruction.params)))
+
+    for name, value in sorted(vars(instruction).items()):
+        if name not in _IGNORED_ATTRIBUTES:
+            tokens.append("%s=%s" % (name, _value_token(value, parameters)))
+
+    if instruction.condition:
+        classical, value = instruction.condition
+        if isinstance(classical, Clbit):
+            if bit_indices is not None and classical in bit_indices:
+                classical = "clbit[%d]" % bit_indices[classical]
+            else:
+                classical = repr(classical)
+        else:
+            classical = "%s[%d]" % (classical.name, classical.size)
+        tokens.append("if(%s==%d)" % (classical, value))
+
+    if cls in _PLAIN_TYPES and instruction._definition is not None:
+        tokens.append("def=" + instruction._definition.structural_hash(parameters))
+
+    return "(%s)" % ",".join(tokens)
+
+
+def circuit_hash(circuit, parameters=True):
+    """Return the structural hash of a circuit.
+
+    Args:
+        circuit (QuantumCircuit): the circuit.
+        parameters (bool): include the values of the parameters in the hash.
+
+    Returns:
+        str: the hexadecimal digest of the structural hash.
+    """
+    bit_indices = {
+        bit: index for bits in (circuit.qubits, circuit.clbits) for index, bit in enumerate(bits)
+    }
+
+    hash_obj = new_hash()
+    for instruction, qargs, cargs in circuit._data:
+        token = "%s%s%s;" % (
+            instruction_token(instruction, parameters, bit_indices),
+            [bit_indices[qubit] for qubit in qargs],
+            [bit_indices[clbit] for clbit in cargs],
+        )
+        hash_obj.update(token.encode("utf8"))
+    header = [str(circuit.num_qubits), str(circuit.num_clbits)]
+    header.extend(
+        "%s:%s%s" % (type(register).__name__, register.name, [bit_indices[bit] for bit in register])
+        for register in itertools.chain(circuit.qregs, circuit.cregs)
+    )
+    if parameters:
+        header.append(_value_token(circuit.global_phase, parameters))
+    hash_obj.update(("|%s" % ",".join(header)).encode("utf8"))
+    return hash_obj.hexdigest()
+
+
+def _value_token(value, parameters):
+    if isinstance(value, ParameterExpression):
+        if value.parameters:
+            # parameters with equal names are distinct objects unless their UUIDs are equal
+            return "expr(%s;%s)" % (
+                value,
+                ",".join(
+                    "%s=%s" % (parameter.name, parameter._uuid)
+                    for parameter in sorted(value.parameters, key=_parameter_sort_key)
+                ),
+            )
+        value = complex(value)
+        if not value.imag:
+            value = value.real
+    if isinstance(value, numpy.generic):
+        value = value.item()
+    for types, encode in _VALUE_ENCODINGS:
+        if isinstance(value, types):
+            return encode(value, parameters)
+    if hasattr(value, "structural_hash"):
+        return value.structural_hash(parameters)
+    return repr(value)
+
+
+def _parameter_sort_key(parameter):
+    return parameter.name, str(parameter._uuid)
+
+
+def _array_token(value, _):
+    return "array(%s,%s,%s)" % (value.shape, value.dtype.str, _bytes_digest(value.tobytes()))
+
+
+def _sequence_token(value, parameters):
+    return "[%s]" % ",".join(_value_token(item, parameters) for item in value)
+
+
+def _dict_token(value, parameters):
+    return "{%s}" % ",".join(
+        "%s:%s" % (_value_token(key, parameters), _value_token(item, parameters))
+        for key, item in sorted(value.items(), key=lambda kv: repr(kv[0]))
+    )
+
+
+# encodings of attribute values by type, the first matching type is used
+_VALUE_ENCODINGS = (
+    ((type(None), bool, numbers.Number, str, bytes), lambda value, _: repr(value)),
+    (numpy.ndarray, _array_token),
+    ((list, tuple), _sequence_token),
+    (dict, _dict_token),
+    (Instruction, instruction_token),
+)
+
+
+def _bytes_digest(data):
+    hash_obj = new_hash()
+    hash_obj.update(data)
+    return hash_obj.hexdigest()
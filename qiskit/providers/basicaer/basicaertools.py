@@ -14,6 +14,7 @@
 
 """
 
+from functools import lru_cache
 from string import ascii_uppercase, ascii_lowercase
 from typing import List, Optional
 
@@ -120,6 +121,13 @@ def einsum_vecmul_index(gate_indices, number_of_qubits):
         str: An indices string for the Numpy.einsum function.
     """
 
+    return _einsum_vecmul_index(tuple(gate_indices), number_of_qubits)
+
+
+@lru_cache(maxsize=1024)
+def _einsum_vecmul_index(gate_indices, number_of_qubits):
+    """Cached implementation of :func:`einsum_vecmul_index` for a tuple of indices."""
+
     mat_l, mat_r, tens_lin, tens_lout = _einsum_matmul_index_helper(gate_indices, number_of_qubits)
 
     # Combine indices into matrix multiplication string format
@@ -129,6 +137,41 @@ def einsum_vecmul_index(gate_indices, number_of_qubits):
     )
 
 
+def compose_gate_matrix(block_qubits, block_matrix, gate_qubits, gate_matrix):
+    """Return the matrix of a gate applied after a block of fused gates.
+
+    The block acts on ``block_qubits`` and is extended with identities on the
+    qubits of the gate it does not act on yet, which are appended to the block
+    qubits. As for the other matrices of the simulators, the first qubit of a list
+    is the least significant one.
+
+    Args:
+        block_qubits (list[int]): the qubits of the block.
+        block_matrix (np.ndarray): the matrix of the block.
+        gate_qubits (list[int]): the qubits of the gate.
+        gate_matrix (matrix_like): the matrix of the gate.
+
+    Returns:
+        tuple: (qubits, matrix) the qubits and matrix of the block followed by the gate.
+    """
+    new_qubits = [qubit for qubit in gate_qubits if qubit not in block_qubits]
+    if new_qubits:
+        block_matrix = np.kron(np.eye(2 ** len(new_qubits), dtype=complex), block_matrix)
+        block_qubits = list(block_qubits) + new_qubits
+    num_qubits = len(block_qubits)
+    positions = [block_qubits.index(qubit) for qubit in gate_qubits]
+    gate_tensor = np.reshape(np.array(gate_matrix, dtype=complex), len(gate_qubits) * [2, 2])
+    block_tensor = np.reshape(block_matrix, 2 * num_qubits * [2])
+    matrix = np.einsum(
+        einsum_matmul_index(positions, num_qubits),
+        gate_tensor,
+        block_tensor,
+        dtype=complex,
+        casting="no",
+    )
+    return block_qubits, np.reshape(matrix, (2 ** num_qubits, 2 ** num_qubits))
+
+
 def _einsum_matmul_index_helper(gate_indices, number_of_qubits):
     """Return the index string for Numpy.einsum matrix multiplication.
 
@@ -28,19 +28,22 @@ later be queried for the Result object. The result will contain a 'memory' data
 field, which is a result of measurements for each shot.
 """
 
+import copy
 import uuid
 import time
 import logging
 import warnings
 
+from concurrent.futures import ThreadPoolExecutor
 from math import log2
-from collections import Counter
 import numpy as np
 
 from qiskit.circuit.quantumcircuit import QuantumCircuit
 from qiskit.utils.multiprocessing import local_hardware_info
 from qiskit.providers.models import QasmBackendConfiguration
+from qiskit.qobj import QasmQobj
 from qiskit.result import Result
+from qiskit.result.memory_array import MemoryArray
 from qiskit.providers.backend import BackendV1
 from qiskit.providers.options import Options
 from qiskit.providers.basicaer.basicaerjob import BasicAerJob
@@ -49,6 +52,7 @@ from .basicaertools import single_gate_matrix
 from .basicaertools import SINGLE_QUBIT_GATES
 from .basicaertools import cx_gate_matrix
 from .basicaertools import einsum_vecmul_index
+from .basicaertools import compose_gate_matrix
 
 logger = logging.getLogger(__name__)
 
@@ -107,6 +111,13 @@ class QasmSimulatorPy(BackendV1):
     # This should be set to True for the statevector simulator
     SHOW_FINAL_STATE = False
 
+    # Consecutive gates are fused into a single unitary while they act on at most
+    # this many qubits
+    FUSION_MAX_QUBITS = 2
+    # Gates are only fused in experiments on at least this many qubits, smaller
+    # statevectors are cheaper to update gate by gate than to fuse the gates
+    FUSION_THRESHOLD = 10
+
     def __init__(self, configuration=None, provider=None, **fields):
         super().__init__(
             configuration=(
@@ -127,6 +138,8 @@ class QasmSimulatorPy(BackendV1):
         self._initial_statevector = self.options.get("initial_statevector")
         self._chop_threshold = self.options.get("chop_threashold")
         self._qobj_config = None
+        self._max_parallel_experiments = self.options.get("max_parallel_experiments")
+        self._max_prefix_memory_mb = self.options.get("max_prefix_memory_mb")
         # TEMP
         self._sample_measure = False
 
@@ -140,6 +153,8 @@ class QasmSimulatorPy(BackendV1):
             allow_sample_measuring=True,
             seed_simulator=None,
             parameter_binds=None,
+            max_parallel_experiments=1,
+            max_prefix_memory_mb=1024,
         )
 
     def _add_unitary(self, gate, qubits):
@@ -149,13 +164,27 @@ class QasmSimulatorPy(BackendV1):
             gate (matrix_like): an N-qubit unitary matrix
             qubits (list): the list of N-qubits.
         """
-        # Get the number of qubits
-        num_qubits = len(qubits)
-        # Compute einsum index string for 1-qubit matrix multiplication
+        self._apply_gate_tensor(*self._gate_tensor(qubits, gate))
+
+    def _gate_tensor(self, qubits, gate):
+        """Return the einsum index string and the tensor to apply a unitary matrix.
+
+        Args:
+            qubits (list): the list of N-qubits.
+            gate (matrix_like): an N-qubit unitary matrix
+
+        Returns:
+            tuple: (indexes, gate_tensor) the einsum index string and the complex
+            rank-2N tensor of the matrix.
+        """
+        # Compute einsum index string for N-qubit matrix multiplication
         indexes = einsum_vecmul_index(qubits, self._number_of_qubits)
         # Convert to complex rank-2N tensor
-        gate_tensor = np.reshape(np.array(gate, dtype=complex), num_qubits * [2, 2])
-        # Apply matrix multiplication
+        gate_tensor = np.reshape(np.array(gate, dtype=complex), len(qubits) * [2, 2])
+        return indexes, gate_tensor
+
+    def _apply_gate_tensor(self, indexes, gate_tensor):
+        """Apply a gate tensor returned by :meth:`_gate_tensor` to the statevector."""
         self._statevector = np.einsum(
             indexes, gate_tensor, self._statevector, dtype=complex, casting="no"
         )
@@ -190,7 +219,7 @@ class QasmSimulatorPy(BackendV1):
             num_samples (int): The number of memory samples to generate.
 
         Returns:
-            list: A list of memory values in hex format.
+            np.ndarray: The memory value of each sample.
         """
         # Get unique qubits that are actually measured and sort in
         # ascending order
@@ -210,18 +239,22 @@ class QasmSimulatorPy(BackendV1):
         # Generate samples on measured qubits as ints with qubit
         # position in the bit-string for each int given by the qubit
         # position in the sorted measured_qubits list
-        samples = self._local_random.choice(range(2 ** num_measured), num_samples, p=probabilities)
-        # Convert the ints to bitstrings
-        memory = []
-        for sample in samples:
-            classical_memory = self._classical_memory
-            for qubit, cmembit in measure_params:
-                pos = measured_qubits.index(qubit)
-                qubit_outcome = int((sample & (1 << pos)) >> pos)
-                membit = 1 << cmembit
-                classical_memory = (classical_memory & (~membit)) | (qubit_outcome << cmembit)
-            value = bin(classical_memory)[2:]
-            memory.append(hex(int(value, 2)))
+        samples = self._local_random.choice(2 ** num_measured, num_samples, p=probabilities)
+        # Write the outcome of each measured qubit into the memory value of every
+        # sample at once, as uint64 unless the memory is wider than 64 bits
+        if self._number_of_cmembits <= 64:
+            memory = np.full(num_samples, self._classical_memory, dtype=np.uint64)
+            to_memory_type = np.uint64
+        else:
+            memory = np.empty(num_samples, dtype=object)
+            memory[:] = [self._classical_memory] * num_samples
+            to_memory_type = int
+        all_membits = (1 << max(self._number_of_cmembits, 1)) - 1
+        for qubit, cmembit in measure_params:
+            pos = measured_qubits.index(qubit)
+            qubit_outcomes = ((samples >> pos) & 1).astype(memory.dtype)
+            keep = to_memory_type(all_membits & ~(1 << cmembit))
+            memory = (memory & keep) | (qubit_outcomes << to_memory_type(cmembit))
         return memory
 
     def _add_qasm_measure(self, qubit, cmembit, cregbit=None):
@@ -291,6 +324,8 @@ class QasmSimulatorPy(BackendV1):
         # Reset default options
         self._initial_statevector = self.options.get("initial_statevector")
         self._chop_threshold = self.options.get("chop_threshold")
+        self._max_parallel_experiments = self.options.get("max_parallel_experiments")
+        self._max_prefix_memory_mb = self.options.get("max_prefix_memory_mb")
         if "backend_options" in backend_options and backend_options["backend_options"]:
             backend_options = backend_options["backend_options"]
 
@@ -315,6 +350,30 @@ class QasmSimulatorPy(BackendV1):
             self._chop_threshold = backend_options["chop_threshold"]
         elif hasattr(qobj_config, "chop_threshold"):
             self._chop_threshold = qobj_config.chop_threshold
+        # Check for the maximum number of experiments run at the same time
+        if "max_parallel_experiments" in backend_options:
+            self._max_parallel_experiments = backend_options["max_parallel_experiments"]
+        elif hasattr(qobj_config, "max_parallel_experiments"):
+            self._max_parallel_experiments = qobj_config.max_parallel_experiments
+        if self._max_parallel_experiments is None:
+            self._max_parallel_experiments = 1
+        if self._max_parallel_experiments < 0:
+            raise BasicAerError(
+                "max_parallel_experiments must be non-negative: "
+                + "{} < 0".format(self._max_parallel_experiments)
+            )
+        # Check for the memory available to the statevectors of shared prefixes
+        if "max_prefix_memory_mb" in backend_options:
+            self._max_prefix_memory_mb = backend_options["max_prefix_memory_mb"]
+        elif hasattr(qobj_config, "max_prefix_memory_mb"):
+            self._max_prefix_memory_mb = qobj_config.max_prefix_memory_mb
+        if self._max_prefix_memory_mb is None:
+            self._max_prefix_memory_mb = 0
+        if self._max_prefix_memory_mb < 0:
+            raise BasicAerError(
+                "max_prefix_memory_mb must be non-negative: "
+                + "{} < 0".format(self._max_prefix_memory_mb)
+            )
 
     def _initialize_statevector(self):
         """Set the initial statevector for simulation"""
@@ -333,11 +392,176 @@ class QasmSimulatorPy(BackendV1):
         vec[abs(vec) < self._chop_threshold] = 0.0
         return vec
 
-    def _validate_measure_sampling(self, experiment):
+    def _compile_instructions(self, instructions, touched_qubits=()):
+        """Prepare the instructions of an experiment for simulation.
+
+        The matrix and einsum index string of each gate are computed once per
+        experiment instead of once per shot, runs of consecutive unconditional gates
+        acting on at most ``FUSION_MAX_QUBITS`` qubits are fused into a single
+        unitary in experiments on at least ``FUSION_THRESHOLD`` qubits, and
+        operations without effect on the simulation are dropped.
+
+        Args:
+            instructions (list): the qobj instructions of an experiment.
+            touched_qubits (iterable): the qubits already acted on by the
+                instructions simulated before ``instructions``.
+
+        Returns:
+            list: a list of ``(operation, qubits, gate)`` tuples where ``gate`` is the
+            ``(indexes, gate_tensor)`` pair of a gate, or ``None`` for other
+            operations. ``operation`` is ``None`` for fused gates.
+        """
+        program = []
+        fuse = self._number_of_qubits >= self.FUSION_THRESHOLD
+        # Qubits and matrix of the gates being fused
+        block = None
+        touched_qubits = set(touched_qubits)
+        for operation in instructions:
+            if operation.name in ("id", "u0", "barrier"):
+                continue
+            qubits = list(getattr(operation, "qubits", []))
+            # Resetting a qubit still in the initial |0> state does nothing
+            if (
+                operation.name == "reset"
+                and self._initial_statevector is None
+                and not touched_qubits.intersection(qubits)
+            ):
+                continue
+            touched_qubits.update(qubits)
+            matrix = self._gate_matrix(operation)
+            if fuse and matrix is not None and getattr(operation, "conditional", None) is None:
+                if block and len(set(block[0]).union(qubits)) <= self.FUSION_MAX_QUBITS:
+                    block = compose_gate_matrix(block[0], block[1], qubits, matrix)
+                else:
+                    self._add_fused_gate(program, block)
+                    block = (qubits, matrix)
+                continue
+            self._add_fused_gate(program, block)
+            block = None
+            gate = self._gate_tensor(qubits, matrix) if matrix is not None else None
+            program.append((operation, qubits, gate))
+        self._add_fused_gate(program, block)
+        return program
+
+    def _add_fused_gate(self, program, block):
+        """Append a block of fused gates, if any, to a compiled program."""
+        if block is not None:
+            program.append((None, block[0], self._gate_tensor(*block)))
+
+    @staticmethod
+    def _gate_matrix(operation):
+        """Return the matrix of a gate instruction, or ``None`` for other instructions."""
+        if operation.name == "unitary":
+            return operation.params[0]
+        if operation.name in SINGLE_QUBIT_GATES:
+            return single_gate_matrix(operation.name, getattr(operation, "params", None))
+        if operation.name in ("CX", "cx"):
+            return cx_gate_matrix()
+        return None
+
+    @staticmethod
+    def _instruction_key(operation):
+        """Return a hashable key identifying an unconditional gate instruction, or
+        ``None`` for other instructions."""
+        if getattr(operation, "conditional", None) is not None:
+            return None
+        name = operation.name
+        if name == "unitary":
+            params = np.asarray(operation.params[0], dtype=complex).tobytes()
+        elif name in SINGLE_QUBIT_GATES or name in ("CX", "cx", "id", "u0", "barrier"):
+            params = tuple(getattr(operation, "params", ()))
+        else:
+            return None
+        return (name, tuple(getattr(operation, "qubits", ())), params)
+
+    def _gate_prefix(self, experiment):
+        """Return the keys of the unconditional gates an experiment starts with."""
+        keys = []
+        for operation in experiment.instructions:
+            key = self._instruction_key(operation)
+            if key is None:
+                break
+            keys.append(key)
+        return keys
+
+    def _prefix_trees(self, experiments):
+        """Arrange experiments in trees of the unconditional gates they start with.
+
+        Experiments starting with the same gates on the same number of qubits, such
+        as the bound copies of a parameterized circuit or the circuits of a
+        tomography experiment, share the path from the root of their tree to the
+        node where their gates differ.
+
+        Args:
+            experiments (list): the experiments of a qobj.
+
+        Returns:
+            list[_PrefixNode]: the nodes which can be run independently of each
+            other, i.e. the children of the roots of the trees and a leaf for each
+            experiment which does not start with a gate.
+        """
+        # Only build the trees if at least two experiments start with the same gate
+        first_gates = set()
+        for experiment in experiments:
+            key = experiment.instructions and self._instruction_key(experiment.instructions[0])
+            if key:
+                key = (experiment.config.n_qubits, key)
+                if key in first_gates:
+                    break
+                first_gates.add(key)
+        else:
+            return [
+                _PrefixNode.leaf(index, experiment) for index, experiment in enumerate(experiments)
+            ]
+
+        roots = {}
+        for index, experiment in enumerate(experiments):
+            num_qubits = experiment.config.n_qubits
+            if num_qubits not in roots:
+                roots[num_qubits] = _PrefixNode(0, experiment)
+            node = roots[num_qubits]
+            for key in self._gate_prefix(experiment):
+                child = node.children.get(key)
+                if child is None:
+                    child = node.children[key] = _PrefixNode(node.depth + 1, experiment)
+                node = child
+            node.experiments.append(index)
+        nodes = []
+        for root in roots.values():
+            for index in root.experiments:
+                nodes.append(_PrefixNode.leaf(index, experiments[index]))
+            nodes.extend(root.children.values())
+        return nodes
+
+    def _simulate_prefix(self, experiment, length, prefix=None):
+        """Return the statevector after the first ``length`` instructions of an
+        experiment, which must all be unconditional gates.
+
+        Args:
+            experiment (QobjExperiment): a qobj experiment.
+            length (int): the number of instructions to simulate.
+            prefix (tuple): an optional ``(length, statevector)`` pair of the state
+                after fewer instructions, from which the simulation starts.
+
+        Returns:
+            np.ndarray: the statevector, as a rank-N tensor.
+        """
+        self._number_of_qubits = experiment.config.n_qubits
+        start, self._statevector = prefix or (0, None)
+        if self._statevector is None:
+            self._validate_initial_statevector()
+            self._initialize_statevector()
+        for _, _, gate in self._compile_instructions(experiment.instructions[start:length]):
+            self._apply_gate_tensor(*gate)
+        return self._statevector
+
+    def _validate_measure_sampling(self, experiment, program):
         """Determine if measure sampling is allowed for an experiment
 
         Args:
             experiment (QobjExperiment): a qobj experiment.
+            program (list): the experiment instructions returned by
+                :meth:`_compile_instructions`.
         """
         # If shots=1 we should disable measure sampling.
         # This is also required for statevector simulator to return the
@@ -349,26 +573,25 @@ class QasmSimulatorPy(BackendV1):
         # Check for config flag
         if hasattr(experiment.config, "allows_measure_sampling"):
             self._sample_measure = experiment.config.allows_measure_sampling
-        # If flag isn't found do a simple test to see if a circuit contains
-        # no reset instructions, and no gates instructions after
-        # the first measure.
+        # If flag isn't found check that every measurement can be deferred to the
+        # end of the circuit: no gate acts on a measured qubit after its
+        # measurement, no operation depends on a measurement outcome and the
+        # circuit contains no reset of a qubit which may not be in the |0> state.
         else:
-            measure_flag = False
-            for instruction in experiment.instructions:
-                # If circuit contains reset operations we cannot sample
-                if instruction.name == "reset":
+            measured_qubits = set()
+            for operation, qubits, gate in program:
+                if measured_qubits and getattr(operation, "conditional", None) is not None:
                     self._sample_measure = False
                     return
-                # If circuit contains a measure option then we can
-                # sample only if all following operations are measures
-                if measure_flag:
-                    # If we find a non-measure instruction
-                    # we cannot do measure sampling
-                    if instruction.name not in ["measure", "barrier", "id", "u0"]:
+                if gate is not None:
+                    if measured_qubits.intersection(qubits):
                         self._sample_measure = False
                         return
-                elif instruction.name == "measure":
-                    measure_flag = True
+                elif operation.name == "measure":
+                    measured_qubits.update(qubits)
+                elif operation.name != "bfunc" or measured_qubits:
+                    self._sample_measure = False
+                    return
             # If we made it to the end of the circuit without returning
             # measure sampling is allowed
             self._sample_measure = True
@@ -377,7 +600,8 @@ class QasmSimulatorPy(BackendV1):
         """Run qobj asynchronously.
 
         Args:
-            qobj (Qobj): payload of the experiment
+            qobj (Qobj or bytes): payload of the experiment, or its binary representation
+                as returned by :meth:`.QasmQobj.to_binary`
             backend_options (dict): backend options
 
         Returns:
@@ -386,18 +610,38 @@ class QasmSimulatorPy(BackendV1):
         Additional Information:
             backend_options: Is a dict of options for the backend. It may contain
                 * "initial_statevector": vector_like
+                * "max_parallel_experiments": int
+                * "max_prefix_memory_mb": int
 
             The "initial_statevector" option specifies a custom initial
             initial statevector for the simulator to be used instead of the all
             zero state. This size of this vector must be correct for the number
             of qubits in all experiments in the qobj.
 
+            The "max_parallel_experiments" option sets the maximum number of
+            experiments of the qobj simulated at the same time, each in its own
+            thread. The default of 1 runs the experiments one after another,
+            and 0 uses as many threads as there are CPUs. The number of threads
+            is also limited so that the statevectors of all experiments run at
+            the same time fit in the memory.
+
+            Experiments starting with the same gates, such as the bound copies
+            of a parameterized circuit or circuits which only differ by their
+            final basis changes, share the simulation of these gates. The
+            "max_prefix_memory_mb" option sets the memory in MB available to
+            the statevectors cached for this purpose, 1024 by default. Setting
+            it to 0 simulates every experiment from the initial state.
+
             Example::
 
                 backend_options = {
                     "initial_statevector": np.array([1, 0, 0, 1j]) / np.sqrt(2),
+                    "max_parallel_experiments": 4,
+                    "max_prefix_memory_mb": 256,
                 }
         """
+        if isinstance(qobj, (bytes, bytearray, memoryview)):
+            qobj = QasmQobj.from_binary(qobj)
         if isinstance(qobj, (QuantumCircuit, list)):
             from qiskit.compiler import assemble
 
@@ -439,8 +683,20 @@ class QasmSimulatorPy(BackendV1):
         self._memory = getattr(qobj.config, "memory", False)
         self._qobj_config = qobj.config
         start = time.time()
-        for experiment in qobj.experiments:
-            result_list.append(self.run_experiment(experiment))
+        nodes = self._prefix_trees(qobj.experiments)
+        parallel_experiments = self._parallel_experiments(qobj, len(nodes))
+        # The memory for shared prefixes is split between the threads
+        prefix_memory = self._max_prefix_memory_mb * (1024 ** 2) / parallel_experiments
+        tasks = [(node, qobj.experiments, prefix_memory) for node in nodes]
+        results = {}
+        if parallel_experiments > 1:
+            with ThreadPoolExecutor(max_workers=parallel_experiments) as executor:
+                for node_results in executor.map(self._run_prefix_tree_copy, tasks):
+                    results.update(node_results)
+        else:
+            for task in tasks:
+                results.update(self._run_prefix_tree(*task))
+        result_list = [results[index] for index in range(len(qobj.experiments))]
         end = time.time()
         result = {
             "backend_name": self.name(),
@@ -452,15 +708,78 @@ class QasmSimulatorPy(BackendV1):
             "success": True,
             "time_taken": (end - start),
             "header": qobj.header.to_dict(),
+            "metadata": {"parallel_experiments": parallel_experiments},
         }
 
         return Result.from_dict(result)
 
-    def run_experiment(self, experiment):
+    def _parallel_experiments(self, qobj, num_tasks):
+        """Return the number of independent prefix trees of a qobj to run at the
+        same time."""
+        hardware_info = local_hardware_info()
+        max_parallel = self._max_parallel_experiments or hardware_info["cpus"]
+        # Every tree run at the same time holds the statevector of the running
+        # experiment and at least one statevector of a shared prefix
+        statevector_size = 2 * 16 * 2 ** qobj.config.n_qubits
+        max_in_memory = int(hardware_info["memory"] * (1024 ** 3) // statevector_size)
+        return max(1, min(max_parallel, max_in_memory, num_tasks))
+
+    def _run_prefix_tree(self, node, experiments, prefix_memory):
+        """Run the experiments of a tree returned by :meth:`_prefix_trees`.
+
+        The tree is traversed depth first. The statevector at each node where
+        experiments branch is simulated once and cached for the experiments below
+        it, as long as the statevectors cached on the path from the root fit in
+        ``prefix_memory`` bytes. Otherwise the experiments start from the deepest
+        cached statevector.
+
+        Args:
+            node (_PrefixNode): the tree.
+            experiments (list): the experiments of the qobj.
+            prefix_memory (float): the memory available to cached statevectors.
+
+        Returns:
+            dict: the result of each experiment of the tree, by index.
+        """
+        statevector_size = 16 * 2 ** node.experiment.config.n_qubits
+        results = {}
+        stack = [(node, None, int(prefix_memory // statevector_size))]
+        while stack:
+            node, prefix, cache_size = stack.pop()
+            # Skip the nodes where experiments do not branch
+            while len(node.children) == 1 and not node.experiments:
+                node = next(iter(node.children.values()))
+            if cache_size and len(node.children) + len(node.experiments) > 1:
+                start = time.time()
+                prefix = (node.depth, self._simulate_prefix(node.experiment, node.depth, prefix))
+                prefix_time = time.time() - start
+                cache_size -= 1
+            else:
+                prefix_time = 0
+            for index in node.experiments:
+                results[index] = self.run_experiment(experiments[index], prefix=prefix)
+                results[index]["time_taken"] += prefix_time
+                prefix_time = 0
+            for child in reversed(list(node.children.values())):
+                stack.append((child, prefix, cache_size))
+        return results
+
+    def _run_prefix_tree_copy(self, task):
+        """Run a prefix tree on a copy of the simulator, so that trees can run in
+        parallel threads without sharing their simulation state."""
+        simulator = copy.copy(self)
+        simulator._local_random = np.random.RandomState()
+        return simulator._run_prefix_tree(*task)
+
+    def run_experiment(self, experiment, prefix=None):
         """Run an experiment (circuit) and return a single experiment result.
 
         Args:
             experiment (QobjExperiment): experiment from qobj experiments list
+            prefix (tuple): an optional ``(length, statevector)`` pair, where
+                ``statevector`` is the state after the first ``length``
+                instructions of the experiment, which are then not simulated
+                again. These instructions must all be unconditional gates.
 
         Returns:
              dict: A result dictionary which looks something like::
@@ -502,8 +821,17 @@ class QasmSimulatorPy(BackendV1):
             seed_simulator = np.random.randint(2147483647, dtype="int32")
 
         self._local_random.seed(seed=seed_simulator)
+        prefix_length, prefix_state = prefix or (0, None)
+        touched_qubits = {
+            qubit
+            for operation in experiment.instructions[:prefix_length]
+            for qubit in getattr(operation, "qubits", [])
+        }
+        program = self._compile_instructions(
+            experiment.instructions[prefix_length:], touched_qubits
+        )
         # Check if measure sampling is supported for current circuit
-        self._validate_measure_sampling(experiment)
+        self._validate_measure_sampling(experiment, program)
 
         # List of final counts for all shots
         memory = []
@@ -517,13 +845,16 @@ class QasmSimulatorPy(BackendV1):
         else:
             shots = self._shots
         for _ in range(shots):
-            self._initialize_statevector()
+            if prefix_state is None:
+                self._initialize_statevector()
+            else:
+                self._statevector = prefix_state.copy()
             # apply global_phase
             self._statevector *= np.exp(1j * global_phase)
             # Initialize classical memory to all 0
             self._classical_memory = 0
             self._classical_register = 0
-            for operation in experiment.instructions:
+            for operation, _, gate in program:
                 conditional = getattr(operation, "conditional", None)
                 if isinstance(conditional, int):
                     conditional_bit_set = (self._classical_register >> conditional) & 1
@@ -539,31 +870,13 @@ class QasmSimulatorPy(BackendV1):
                         if value != int(operation.conditional.val, 16):
                             continue
 
-                # Check if single  gate
-                if operation.name == "unitary":
-                    qubits = operation.qubits
-                    gate = operation.params[0]
-                    self._add_unitary(gate, qubits)
-                elif operation.name in SINGLE_QUBIT_GATES:
-                    params = getattr(operation, "params", None)
-                    qubit = operation.qubits[0]
-                    gate = single_gate_matrix(operation.name, params)
-                    self._add_unitary(gate, [qubit])
-                # Check if CX gate
-                elif operation.name in ("id", "u0"):
-                    pass
-                elif operation.name in ("CX", "cx"):
-                    qubit0 = operation.qubits[0]
-                    qubit1 = operation.qubits[1]
-                    gate = cx_gate_matrix()
-                    self._add_unitary(gate, [qubit0, qubit1])
+                # Check if gate, possibly fused
+                if gate is not None:
+                    self._apply_gate_tensor(*gate)
                 # Check if reset
                 elif operation.name == "reset":
                     qubit = operation.qubits[0]
                     self._add_qasm_reset(qubit)
-                # Check if barrier
-                elif operation.name == "barrier":
-                    pass
                 # Check if measure
                 elif operation.name == "measure":
                     qubit = operation.qubits[0]
@@ -623,12 +936,11 @@ class QasmSimulatorPy(BackendV1):
                     # If sampling we generate all shot samples from the final statevector
                     memory = self._add_sample_measure(measure_sample_ops, self._shots)
                 else:
-                    # Turn classical_memory (int) into bit string and pad zero for unused cmembits
-                    outcome = bin(self._classical_memory)[2:]
-                    memory.append(hex(int(outcome, 2)))
+                    memory.append(self._classical_memory)
 
         # Add data
-        data = {"counts": dict(Counter(memory))}
+        memory = MemoryArray.from_ints(memory, self._number_of_cmembits)
+        data = {"counts": memory.counts().hex_outcomes()}
         # Optionally add memory list
         if self._memory:
             data["memory"] = memory
@@ -673,3 +985,29 @@ class QasmSimulatorPy(BackendV1):
                     'No measurements in circuit "%s", ' "classical register will remain all zeros.",
                     name,
                 )
+
+
+class _PrefixNode:
+    """A node of a tree of the unconditional gates experiments start with.
+
+    The node at depth ``d`` stands for the state after the first ``d``
+    instructions of the experiments below it.
+    """
+
+    __slots__ = ("depth", "experiment", "children", "experiments")
+
+    def __init__(self, depth, experiment):
+        self.depth = depth
+        # An experiment starting with the instructions of the node
+        self.experiment = experiment
+        # The child nodes by the key of their last instruction
+        self.children = {}
+        # The indexes of the experiments whose gate prefix ends at this node
+        self.experiments = []
+
+    @classmethod
+    def leaf(cls, index, experiment):
+        """Return a node running an experiment from its initial state."""
+        node = cls(0, experiment)
+        node.experiments.append(index)
+        return node
@@ -37,6 +37,7 @@ import numpy as np
 from qiskit.circuit.quantumcircuit import QuantumCircuit
 from qiskit.utils.multiprocessing import local_hardware_info
 from qiskit.providers.models import QasmBackendConfiguration
+from qiskit.qobj import QasmQobj
 from qiskit.providers.backend import BackendV1
 from qiskit.providers.options import Options
 from qiskit.providers.basicaer.basicaerjob import BasicAerJob
@@ -210,7 +211,8 @@ class UnitarySimulatorPy(BackendV1):
         """Run qobj asynchronously.
 
         Args:
-            qobj (Qobj): payload of the experiment
+            qobj (Qobj or bytes): payload of the experiment, or its binary representation
+                as returned by :meth:`.QasmQobj.to_binary`
             backend_options (dict): backend options
 
         Returns:
@@ -241,6 +243,8 @@ class UnitarySimulatorPy(BackendV1):
                     "chop_threshold": 1e-15
                 }
         """
+        if isinstance(qobj, (bytes, bytearray, memoryview)):
+            qobj = QasmQobj.from_binary(qobj)
         if isinstance(qobj, (QuantumCircuit, list)):
             from qiskit.compiler import assemble
 
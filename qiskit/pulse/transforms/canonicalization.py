@@ -11,9 +11,11 @@
 # that they have been altered from the originals.
 """Basic rescheduling functions which take schedule or instructions and return new schedules."""
 
+import itertools
+import math
 import warnings
 from collections import defaultdict
-from typing import List, Optional, Iterable, Union
+from typing import List, Optional, Iterable, Tuple, Union
 
 import numpy as np
 
@@ -22,6 +24,7 @@ from qiskit.pulse.exceptions import PulseError
 from qiskit.pulse.exceptions import UnassignedDurationError
 from qiskit.pulse.instruction_schedule_map import InstructionScheduleMap
 from qiskit.pulse.instructions import directives
+from qiskit.pulse.library import Pulse, Waveform
 from qiskit.pulse.schedule import Schedule, ScheduleBlock, ScheduleComponent
 
 
@@ -85,7 +88,7 @@ def compress_pulses(schedules: List[Schedule]) -> List[Schedule]:
     Returns:
         Compressed schedules.
     """
-    existing_pulses = []
+    existing_pulses = _PulseIndex()
     new_schedules = []
 
     for schedule in schedules:
@@ -93,16 +96,15 @@ def compress_pulses(schedules: List[Schedule]) -> List[Schedule]:
 
         for time, inst in schedule.instructions:
             if isinstance(inst, instructions.Play):
-                if inst.pulse in existing_pulses:
-                    idx = existing_pulses.index(inst.pulse)
-                    identical_pulse = existing_pulses[idx]
+                identical_pulse = existing_pulses.find(inst.pulse)
+                if identical_pulse is not None:
                     new_schedule.insert(
                         time,
                         instructions.Play(identical_pulse, inst.channel, inst.name),
                         inplace=True,
                     )
                 else:
-                    existing_pulses.append(inst.pulse)
+                    existing_pulses.add(inst.pulse)
                     new_schedule.insert(time, inst, inplace=True)
             else:
                 new_schedule.insert(time, inst, inplace=True)
@@ -112,6 +114,81 @@ def compress_pulses(schedules: List[Schedule]) -> List[Schedule]:
     return new_schedules
 
 
+class _PulseIndex:
+    """Index of pulses finding the first added pulse which is equal to a given pulse.
+
+    The result is the same as a linear search of the pulses in a list, but only few pulses are
+    compared: waveforms are compared to the waveforms of the same shape whose sums of samples
+    are close enough for the waveforms to be equal within the ``epsilon`` of the added waveform,
+    and other pulses are looked up by their hash.
+    """
+
+    def __init__(self):
+        self._count = 0
+        # waveforms by group (type, shape, epsilon) and by cell of the sum of their samples
+        self._waveforms = defaultdict(lambda: defaultdict(list))
+        self._hashed = {}
+        # pulses which can neither be hashed nor located by the sum of their samples
+        self._others = []
+
+    def find(self, pulse: Pulse) -> Optional[Pulse]:
+        """Return the first added pulse equal to ``pulse``, or None if there is none."""
+        candidates = list(self._others)
+        if isinstance(pulse, Waveform):
+            total = pulse.samples.sum()
+            if np.isfinite(total):
+                for (pulse_type, shape, epsilon), cells in self._waveforms.items():
+                    if shape != pulse.samples.shape or not isinstance(pulse, pulse_type):
+                        continue
+                    real, imag = _sum_cell(total, shape, epsilon)
+                    for cell in itertools.product(
+                        (real - 1, real, real + 1), (imag - 1, imag, imag + 1)
+                    ):
+                        candidates.extend(cells.get(cell, ()))
+        else:
+            try:
+                hashed = self._hashed.get(pulse)
+            except TypeError:
+                hashed = None
+            if hashed is not None:
+                candidates.append(hashed)
+
+        for _, existing in sorted(candidates, key=lambda candidate: candidate[0]):
+            if existing == pulse:
+                return existing
+        return None
+
+    def add(self, pulse: Pulse):
+        """Add a pulse to the index."""
+        entry = (self._count, pulse)
+        self._count += 1
+        if isinstance(pulse, Waveform):
+            total = pulse.samples.sum()
+            if np.isfinite(total):
+                shape = pulse.samples.shape
+                cells = self._waveforms[(type(pulse), shape, pulse.epsilon)]
+                cells[_sum_cell(total, shape, pulse.epsilon)].append(entry)
+                return
+        else:
+            try:
+                self._hashed.setdefault(pulse, entry)
+                return
+            except TypeError:
+                pass
+        self._others.append(entry)
+
+
+def _sum_cell(total: complex, shape: Tuple[int, ...], epsilon: float) -> Tuple[int, int]:
+    """Return the cell of the sum of the samples of a waveform.
+
+    The sums of the samples of two waveforms which are equal within ``epsilon`` differ by at
+    most ``size * epsilon`` in their real and imaginary parts, so that they are in the same or
+    in neighbouring cells.
+    """
+    width = 2 * int(np.prod(shape)) * epsilon or 1.0
+    return math.floor(total.real / width), math.floor(total.imag / width)
+
+
 def flatten(program: Schedule) -> Schedule:
     """Flatten (inline) any called nodes into a Schedule tree with no nested children.
 
@@ -0,0 +1,401 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+Fast OPENQASM 2.0 to QuantumCircuit converter for programs using qelib1.inc.
+
+The PLY based :class:`~qiskit.qasm.Qasm` parser builds a node tree of the whole
+program, which is then interpreted into a DAG. For large programs which only
+declare registers and apply the standard gates of ``qelib1.inc``, this module
+tokenizes the program with a single regular expression and appends the
+instructions straight to a :class:`~qiskit.circuit.QuantumCircuit`.
+
+Programs using anything else (gate or opaque definitions, other includes, ...),
+and invalid programs, are not handled here, so that they are parsed by the
+PLY parser, which also reports the errors.
+"""
+
+import operator
+import re
+
+import numpy as np
+
+from qiskit.circuit import QuantumCircuit, QuantumRegister, ClassicalRegister
+from qiskit.circuit.barrier import Barrier
+from qiskit.circuit.measure import Measure
+from qiskit.circuit.reset import Reset
+from qiskit.circuit.library import standard_gates
+
+# name: (gate class, number of parameters, number of qubits) of the gates of qelib1.inc
+# which are converted to standard gates, see ``AstInterpreter.standard_extension``
+QELIB1_GATES = {
+    "u3": (standard_gates.U3Gate, 3, 1),
+    "u2": (standard_gates.U2Gate, 2, 1),
+    "u1": (standard_gates.U1Gate, 1, 1),
+    "cx": (standard_gates.CXGate, 0, 2),
+    "id": (standard_gates.IGate, 0, 1),
+    "u": (standard_gates.UGate, 3, 1),
+    "p": (standard_gates.PhaseGate, 1, 1),
+    "x": (standard_gates.XGate, 0, 1),
+    "y": (standard_gates.YGate, 0, 1),
+    "z": (standard_gates.ZGate, 0, 1),
+    "h": (standard_gates.HGate, 0, 1),
+    "s": (standard_gates.SGate, 0, 1),
+    "sdg": (standard_gates.SdgGate, 0, 1),
+    "t": (standard_gates.TGate, 0, 1),
+    "tdg": (standard_gates.TdgGate, 0, 1),
+    "rx": (standard_gates.RXGate, 1, 1),
+    "ry": (standard_gates.RYGate, 1, 1),
+    "rz": (standard_gates.RZGate, 1, 1),
+    "sx": (standard_gates.SXGate, 0, 1),
+    "sxdg": (standard_gates.SXdgGate, 0, 1),
+    "cz": (standard_gates.CZGate, 0, 2),
+    "cy": (standard_gates.CYGate, 0, 2),
+    "swap": (standard_gates.SwapGate, 0, 2),
+    "ch": (standard_gates.CHGate, 0, 2),
+    "ccx": (standard_gates.CCXGate, 0, 3),
+    "cswap": (standard_gates.CSwapGate, 0, 3),
+    "crx": (standard_gates.CRXGate, 1, 2),
+    "cry": (standard_gates.CRYGate, 1, 2),
+    "crz": (standard_gates.CRZGate, 1, 2),
+    "cu1": (standard_gates.CU1Gate, 1, 2),
+    "cp": (standard_gates.CPhaseGate, 1, 2),
+    "cu3": (standard_gates.CU3Gate, 3, 2),
+    "csx": (standard_gates.CSXGate, 0, 2),
+    "cu": (standard_gates.CUGate, 4, 2),
+    "rxx": (standard_gates.RXXGate, 1, 2),
+    "rzz": (standard_gates.RZZGate, 1, 2),
+}
+
+# the names of all gates defined in qelib1.inc, which can not be used as register names
+QELIB1_NAMES = set(QELIB1_GATES) | {"u0", "rccx", "rc3x", "c3x", "c3sqrtx", "c4x"}
+
+KEYWORDS = {"barrier", "creg", "gate", "if", "measure", "opaque", "qreg", "pi", "reset"}
+
+# same functions as used by qiskit.qasm.node.External, for the same results
+EXTERNAL_FUNCTIONS = {
+    "sin": np.sin,
+    "cos": np.cos,
+    "tan": np.tan,
+    "asin": np.arcsin,
+    "acos": np.arccos,
+    "atan": np.arctan,
+    "exp": np.exp,
+    "ln": np.log,
+    "sqrt": np.sqrt,
+}
+
+BINARY_OPERATORS = {
+    "+": (1, operator.add),
+    "-": (1, operator.sub),
+    "*": (2, operator.mul),
+    "/": (2, operator.truediv),
+}
+
+# Tokens are matched in order. Anything which is not matched here, such as
+# integers with leading zeros, makes the program unsupported.
+TOKEN_REGEX = re.compile(
+    r"(?P<skip>[ \t\r\n]+|//[^\n]*)"
+    r"|(?P<real>(?:[0-9]+|[0-9]*\.[0-9]+|[0-9]+\.)[eE][+-]?[0-9]+|[0-9]*\.[0-9]+|[0-9]+\.)"
+    r"|(?P<int>[1-9][0-9]*|0(?![0-9]))"
+    r"|(?P<format>OPENQASM[ \t\r\n]+[0-9]+\.[0-9]+)"
+    r"|(?P<id>[a-z][a-zA-Z0-9_]*|U(?![a-zA-Z0-9_])|CX(?![a-zA-Z0-9_]))"
+    r'|(?P<string>"[^"\\\n]*")'
+    r"|(?P<symbol>->|==|[-+*/^()\[\],;])"
+)
+
+END = ("end", None)
+
+
+class UnsupportedQasm(Exception):
+    """Raised for programs which are not converted by this module."""
+
+
+def circuit_from_qasm(data):
+    """Convert an OPENQASM 2.0 program to a :class:`~qiskit.circuit.QuantumCircuit`.
+
+    Args:
+        data (str): the OPENQASM 2.0 program.
+
+    Returns:
+        QuantumCircuit: the circuit of the program, or ``None`` if the program
+        is invalid or uses constructs which are not supported by this module,
+        in which case it has to be parsed with :class:`~qiskit.qasm.Qasm`.
+    """
+    if not isinstance(data, str):
+        return None
+    try:
+        return _FastQasmParser(data).parse()
+    except UnsupportedQasm:
+        return None
+
+
+def _tokenize(data):
+    tokens = []
+    append = tokens.append
+    position = 0
+    for match in TOKEN_REGEX.finditer(data):
+        if match.start() != position:
+            raise UnsupportedQasm()
+        position = match.end()
+        kind = match.lastgroup
+        if kind == "skip":
+            continue
+        if kind == "id":
+            value = match.group()
+            append(("keyword" if value in KEYWORDS else "id", value))
+        elif kind == "symbol":
+            value = match.group()
+            append((value, value))
+        else:
+            append((kind, match.group()))
+    if position != len(data):
+        raise UnsupportedQasm()
+    append(END)
+    return tokens
+
+
+class _FastQasmParser:
+    """Recursive descent parser for the supported subset of OPENQASM 2.0."""
+
+    def __init__(self, data):
+        self.tokens = _tokenize(data)
+        self.position = 0
+        self.qregs = {}
+        self.cregs = {}
+        # register name: index of its first bit in the circuit
+        self.qubit_offsets = {}
+        self.clbit_offsets = {}
+        self.num_qubits = 0
+        self.num_clbits = 0
+        self.included = False
+        self.instructions = []
+
+    def next(self):
+        """Consume the next token and return it."""
+        token = self.tokens[self.position]
+        self.position += 1
+        return token
+
+    def peek(self):
+        """Return the kind of the next token without consuming it."""
+        return self.tokens[self.position][0]
+
+    def expect(self, kind):
+        """Consume a token of the given kind and return its value."""
+        token = self.next()
+        if token[0] != kind:
+            raise UnsupportedQasm()
+        return token[1]
+
+    def accept(self, kind):
+        """Consume the next token if it has the given kind and return whether it did."""
+        if self.tokens[self.position][0] == kind:
+            self.position += 1
+            return True
+        return False
+
+    def parse(self):
+        """Parse the program and return its circuit."""
+        if self.expect("format").split()[1] != "2.0":
+            raise UnsupportedQasm()
+        self.expect(";")
+        while self.peek() != "end":
+            self.parse_statement()
+
+        circuit = QuantumCircuit(*self.qregs.values(), *self.cregs.values())
+        # all arguments were checked while parsing
+        circuit.extend_trusted(self.instructions)
+        return circuit
+
+    def parse_statement(self):
+        """Parse a statement of the program."""
+        kind, value = self.next()
+        if kind == "id" and value == "include":
+            if self.expect("string") != '"qelib1.inc"' or self.included:
+                raise UnsupportedQasm()
+            self.expect(";")
+            self.included = True
+        elif kind == "keyword" and value in ("qreg", "creg"):
+            self.parse_register(value)
+        elif kind == "keyword" and value == "if":
+            self.expect("(")
+            name = self.expect("id")
+            if name not in self.cregs:
+                raise UnsupportedQasm()
+            self.expect("==")
+            condition = (self.cregs[name], int(self.expect("int")))
+            self.expect(")")
+            kind, value = self.next()
+            if kind == "keyword" and value == "barrier":
+                raise UnsupportedQasm()
+            self.parse_operation(kind, value, condition)
+        else:
+            self.parse_operation(kind, value, None)
+
+    def parse_register(self, register_type):
+        """Parse the declaration of a quantum or classical register."""
+        name = self.expect("id")
+        if name in self.qregs or name in self.cregs or name in QELIB1_NAMES:
+            raise UnsupportedQasm()
+        self.expect("[")
+        size = int(self.expect("int"))
+        self.expect("]")
+        self.expect(";")
+        if register_type == "qreg":
+            self.qregs[name] = QuantumRegister(size, name)
+            self.qubit_offsets[name] = self.num_qubits
+            self.num_qubits += size
+        else:
+            self.cregs[name] = ClassicalRegister(size, name)
+            self.clbit_offsets[name] = self.num_clbits
+            self.num_clbits += size
+
+    def parse_operation(self, kind, value, condition):
+        """Parse a measure, reset, barrier or gate application."""
+        if kind == "keyword" and value == "measure":
+            qubits = self.parse_argument(self.qregs, self.qubit_offsets)
+            self.expect("->")
+            clbits = self.parse_argument(self.cregs, self.clbit_offsets)
+            self.expect(";")
+            if len(qubits) != len(clbits):
+                raise UnsupportedQasm()
+            for qubit, clbit in zip(qubits, clbits):
+                self.add_instruction(Measure(), [qubit], [clbit], condition)
+        elif kind == "keyword" and value == "reset":
+            qubits = self.parse_argument(self.qregs, self.qubit_offsets)
+            self.expect(";")
+            for qubit in qubits:
+                self.add_instruction(Reset(), [qubit], [], condition)
+        elif kind == "keyword" and value == "barrier":
+            arguments = self.parse_argument_list()
+            qubits = [qubit for argument in arguments for qubit in argument]
+            if len(set(qubits)) != len(qubits):
+                raise UnsupportedQasm()
+            self.instructions.append((Barrier(len(qubits)), qubits, []))
+        elif kind == "id":
+            self.parse_gate(value, condition)
+        else:
+            raise UnsupportedQasm()
+
+    def parse_gate(self, name, condition):
+        """Parse the application of a qelib1 gate, broadcast over its register arguments."""
+        if name == "U":
+            name = "u"
+        elif name == "CX":
+            name = "cx"
+        elif name not in QELIB1_GATES:
+            raise UnsupportedQasm()
+        if not self.included:
+            raise UnsupportedQasm()
+        gate_class, num_params, num_qubits = QELIB1_GATES[name]
+
+        params = []
+        if self.accept("("):
+            if not self.accept(")"):
+                params.append(self.parse_expression(0))
+                while self.accept(","):
+                    params.append(self.parse_expression(0))
+                self.expect(")")
+        arguments = self.parse_argument_list()
+        if len(params) != num_params or len(arguments) != num_qubits:
+            raise UnsupportedQasm()
+
+        all_qubits = [qubit for argument in arguments for qubit in argument]
+        if len(set(all_qubits)) != len(all_qubits):
+            raise UnsupportedQasm()
+        sizes = {len(argument) for argument in arguments if len(argument) != 1}
+        if len(sizes) > 1 or 0 in sizes:
+            raise UnsupportedQasm()
+        if not sizes:
+            self.add_instruction(gate_class(*params), all_qubits, [], condition)
+            return
+        for index in range(sizes.pop()):
+            qubits = [
+                argument[index] if len(argument) > 1 else argument[0] for argument in arguments
+            ]
+            self.add_instruction(gate_class(*params), qubits, [], condition)
+
+    def add_instruction(self, instruction, qubits, clbits, condition):
+        """Append an instruction, with an optional classical condition."""
+        if condition is not None:
+            instruction.condition = condition
+        self.instructions.append((instruction, qubits, clbits))
+
+    def parse_argument_list(self):
+        """Parse the quantum arguments of a statement up to its semicolon."""
+        arguments = [self.parse_argument(self.qregs, self.qubit_offsets)]
+        while self.accept(","):
+            arguments.append(self.parse_argument(self.qregs, self.qubit_offsets))
+        self.expect(";")
+        return arguments
+
+    def parse_argument(self, registers, offsets):
+        """Parse a register or a bit of a register and return the circuit indices of its bits."""
+        name = self.expect("id")
+        if name not in registers:
+            raise UnsupportedQasm()
+        offset = offsets[name]
+        if self.accept("["):
+            index = int(self.expect("int"))
+            self.expect("]")
+            if index >= registers[name].size:
+                raise UnsupportedQasm()
+            return [offset + index]
+        return list(range(offset, offset + registers[name].size))
+
+    def parse_expression(self, min_precedence):
+        """Parse an expression with precedence climbing and return its value."""
+        value = self.parse_unary()
+        while True:
+            kind = self.peek()
+            if kind not in BINARY_OPERATORS:
+                return value
+            precedence, function = BINARY_OPERATORS[kind]
+            if precedence <= min_precedence:
+                return value
+            self.position += 1
+            value = function(value, self.parse_expression(precedence))
+
+    def parse_unary(self):
+        """Parse an expression with optional unary signs and return its value."""
+        kind, value = self.next()
+        if kind == "-":
+            return -self.parse_unary()
+        if kind == "+":
+            return self.parse_unary()
+        return self.parse_power(kind, value)
+
+    def parse_power(self, kind, value):
+        """Parse a power expression starting at the given token and return its value."""
+        base = self.parse_primary(kind, value)
+        if self.accept("^"):
+            # right associative and binding tighter than the unary operators
+            return base ** self.parse_unary()
+        return base
+
+    def parse_primary(self, kind, value):
+        """Parse a number, pi, parenthesized expression or function call and return its value."""
+        if kind in ("int", "real"):
+            return float(value)
+        if kind == "keyword" and value == "pi":
+            return np.pi
+        if kind == "(":
+            result = self.parse_expression(0)
+            self.expect(")")
+            return result
+        if kind == "id" and value in EXTERNAL_FUNCTIONS:
+            self.expect("(")
+            argument = self.parse_expression(0)
+            self.expect(")")
+            return EXTERNAL_FUNCTIONS[value](argument)
+        raise UnsupportedQasm()
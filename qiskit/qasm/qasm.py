@@ -33,6 +33,13 @@ class Qasm:
         """Return the filename."""
         return self._filename
 
+    def return_data(self):
+        """Return the data, reading it from the file if a filename was given."""
+        if self._filename:
+            with open(self._filename) as ifile:
+                self._data = ifile.read()
+        return self._data
+
     def generate_tokens(self):
         """Returns a generator of the tokens."""
         if self._filename:
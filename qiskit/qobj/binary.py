@@ -0,0 +1,385 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+Compact binary serialization of :class:`~.QasmQobj` and :class:`~.PulseQobj` objects.
+
+The binary payload is an alternative to the JSON encoding of :meth:`.QasmQobj.to_dict`
+which avoids building the nested dictionaries of the instructions, stores every string only
+once and stores numeric arrays, such as the samples of a pulse library, as raw data.
+
+Format
+======
+
+A payload starts with the 5 byte string ``QOBJB`` followed by the header
+
+.. code-block:: c
+
+    struct {
+        unsigned char version;
+        char type;
+        uint32_t num_strings;
+    }
+
+where ``type`` is ``'q'`` for a :class:`~.QasmQobj` and ``'p'`` for a :class:`~.PulseQobj`.
+All values use network byte order (big endian). The header is followed by the STRING_TABLE
+containing ``num_strings`` strings, each of which is a ``uint32_t`` size followed by that many
+bytes of utf8 data. All strings of the payload, including the attribute names, refer to
+strings in the table by their ``uint32_t`` position.
+
+The STRING_TABLE is followed by a VALUE for the dictionary of the ``qobj_id``, ``header``
+and ``config`` of the qobj, and a ``uint64_t`` number of experiments. Each experiment is a
+VALUE for the dictionary of its ``header`` and ``config``, followed by a ``uint64_t`` number
+of instructions. Each instruction is a ``uint16_t`` number of attributes, each of which is a
+``uint32_t`` position of the attribute name in the STRING_TABLE followed by a VALUE.
+
+A VALUE starts with a type character which determines the data following it:
+
+* ``'z'``: None, no data.
+* ``'b'``: a bool, as an ``unsigned char``.
+* ``'i'``: an ``int64_t``. Integers out of range are stored as ``'L'``, a string position
+  of their decimal representation.
+* ``'f'``: a double.
+* ``'c'``: a complex, as two doubles.
+* ``'s'``: a ``uint32_t`` string position.
+* ``'l'`` and ``'u'``: a list or a tuple, as a ``uint32_t`` length followed by the VALUEs of
+  the items.
+* ``'d'``: a dictionary, as a ``uint32_t`` length followed by the VALUEs of each key and
+  item.
+* ``'I'``, ``'F'`` and ``'C'``: a list of integers, doubles or complex numbers, as a
+  ``uint32_t`` length followed by a packed ``int64_t``, double or complex double array.
+* ``'a'``: a NumPy array, as a ``uint32_t`` string position of its dtype, an
+  ``unsigned char`` number of dimensions, a ``uint64_t`` array of its shape and its data
+  in C order.
+* ``'m'``: a :class:`~.QobjMeasurementOption`, as a VALUE for its dictionary.
+"""
+
+import functools
+import io
+import numbers
+import struct
+
+import numpy as np
+
+from qiskit.circuit.parameterexpression import ParameterExpression
+from qiskit.exceptions import QiskitError
+from qiskit.qobj.pulse_qobj import (
+    PulseQobj,
+    PulseQobjConfig,
+    PulseQobjExperiment,
+    PulseQobjInstruction,
+    QobjMeasurementOption,
+)
+from qiskit.qobj.qasm_qobj import (
+    QasmQobj,
+    QasmQobjConfig,
+    QasmQobjExperiment,
+    QasmQobjInstruction,
+)
+from qiskit.qobj.common import QobjHeader
+
+FORMAT_VERSION = 1
+
+_MAGIC = b"QOBJB"
+_HEADER = struct.Struct("!BcI")
+_UINT8 = struct.Struct("!B")
+_UINT16 = struct.Struct("!H")
+_UINT32 = struct.Struct("!I")
+_UINT64 = struct.Struct("!Q")
+_INT64 = struct.Struct("!q")
+_DOUBLE = struct.Struct("!d")
+_COMPLEX = struct.Struct("!dd")
+_INT64_MIN = -(2 ** 63)
+_INT64_MAX = 2 ** 63 - 1
+
+# type characters of the qobj classes, and the classes of their parts
+_QOBJ_TYPES = {QasmQobj: b"q", PulseQobj: b"p"}
+_QOBJ_CLASSES = {
+    b"q": (QasmQobj, QasmQobjConfig, QasmQobjExperiment, QasmQobjInstruction),
+    b"p": (PulseQobj, PulseQobjConfig, PulseQobjExperiment, PulseQobjInstruction),
+}
+
+
+def qobj_to_binary(qobj):
+    """Serialize a qobj to the compact binary format.
+
+    Args:
+        qobj (QasmQobj or PulseQobj): the qobj to serialize.
+
+    Returns:
+        bytes: the binary payload.
+
+    Raises:
+        QiskitError: if the qobj contains values which can not be serialized.
+    """
+    type_char = _QOBJ_TYPES[type(qobj)]
+    writer = _Writer()
+    writer.write_value(
+        {"qobj_id": qobj.qobj_id, "header": qobj.header.to_dict(), "config": qobj.config.to_dict()}
+    )
+    writer.write(_UINT64.pack(len(qobj.experiments)))
+    for experiment in qobj.experiments:
+        metadata = {}
+        if hasattr(experiment, "config"):
+            metadata["config"] = experiment.config.to_dict()
+        if hasattr(experiment, "header"):
+            metadata["header"] = experiment.header.to_dict()
+        writer.write_value(metadata)
+        writer.write(_UINT64.pack(len(experiment.instructions)))
+        for instruction in experiment.instructions:
+            writer.write_instruction(instruction)
+
+    strings = [string.encode("utf8") for string in writer.strings]
+    out = io.BytesIO()
+    out.write(_MAGIC)
+    out.write(_HEADER.pack(FORMAT_VERSION, type_char, len(strings)))
+    for string in strings:
+        out.write(_UINT32.pack(len(string)))
+        out.write(string)
+    out.write(writer.getvalue())
+    return out.getvalue()
+
+
+def qobj_from_binary(data):
+    """Deserialize a qobj from the compact binary format.
+
+    Args:
+        data (bytes): the binary payload, as returned by :func:`qobj_to_binary`.
+
+    Returns:
+        QasmQobj or PulseQobj: the deserialized qobj.
+
+    Raises:
+        QiskitError: if ``data`` is not a valid payload.
+    """
+    data = memoryview(data)
+    if bytes(data[: len(_MAGIC)]) != _MAGIC:
+        raise QiskitError("Invalid binary qobj payload.")
+    reader = _Reader(data, len(_MAGIC))
+    version, type_char, num_strings = reader.read_struct(_HEADER)
+    if version > FORMAT_VERSION:
+        raise QiskitError(
+            "The binary qobj payload has version %s, which is newer than the supported version %s."
+            % (version, FORMAT_VERSION)
+        )
+    if type_char not in _QOBJ_CLASSES:
+        raise QiskitError("Invalid binary qobj type %s." % type_char)
+    qobj_type, config_type, experiment_type, instruction_type = _QOBJ_CLASSES[type_char]
+
+    reader.strings = [
+        str(reader.read_bytes(reader.read(_UINT32)), "utf8") for _ in range(num_strings)
+    ]
+
+    metadata = reader.read_value()
+    experiments = []
+    for _ in range(reader.read(_UINT64)):
+        experiment = experiment_type.from_dict(reader.read_value())
+        experiment.instructions = [
+            reader.read_instruction(instruction_type) for _ in range(reader.read(_UINT64))
+        ]
+        experiments.append(experiment)
+
+    return qobj_type(
+        qobj_id=metadata["qobj_id"],
+        config=config_type.from_dict(metadata["config"]),
+        experiments=experiments,
+        header=QobjHeader.from_dict(metadata["header"]),
+    )
+
+
+class _Writer(io.BytesIO):
+    """Buffer for the body of a payload, collecting the strings in a table."""
+
+    def __init__(self):
+        super().__init__()
+        self.strings = {}
+
+    def string_index(self, string):
+        """Return the position of a string in the string table."""
+        index = self.strings.get(string)
+        if index is None:
+            index = self.strings[string] = len(self.strings)
+        return index
+
+    def write_instruction(self, instruction):
+        """Write the attributes of an instruction."""
+        attributes = vars(instruction)
+        self.write(_UINT16.pack(len(attributes)))
+        for name, value in attributes.items():
+            self.write(_UINT32.pack(self.string_index(name)))
+            self.write_value(value)
+
+    def write_value(self, value):
+        """Write a typed value."""
+        if isinstance(value, np.generic):
+            value = value.item()
+        elif isinstance(value, ParameterExpression):
+            # as in QasmQobjInstruction.to_dict
+            value = float(value)
+
+        if value is None:
+            self.write(b"z")
+        elif isinstance(value, bool):
+            self.write(b"b" + _UINT8.pack(value))
+        elif isinstance(value, numbers.Integral):
+            if _INT64_MIN <= value <= _INT64_MAX:
+                self.write(b"i" + _INT64.pack(value))
+            else:
+                self.write(b"L" + _UINT32.pack(self.string_index(str(value))))
+        elif isinstance(value, float):
+            self.write(b"f" + _DOUBLE.pack(value))
+        elif isinstance(value, complex):
+            self.write(b"c" + _COMPLEX.pack(value.real, value.imag))
+        elif isinstance(value, str):
+            self.write(b"s" + _UINT32.pack(self.string_index(value)))
+        elif isinstance(value, list):
+            self._write_list(value)
+        elif isinstance(value, tuple):
+            self.write(b"u" + _UINT32.pack(len(value)))
+            for item in value:
+                self.write_value(item)
+        elif isinstance(value, dict):
+            self.write(b"d" + _UINT32.pack(len(value)))
+            for key, item in value.items():
+                self.write_value(key)
+                self.write_value(item)
+        elif isinstance(value, np.ndarray):
+            if value.dtype.hasobject:
+                self._write_list(value.tolist())
+                return
+            self.write(b"a" + _UINT32.pack(self.string_index(value.dtype.str)))
+            self.write(_UINT8.pack(value.ndim))
+            self.write(struct.pack("!%dQ" % value.ndim, *value.shape))
+            self.write(np.ascontiguousarray(value).tobytes())
+        elif isinstance(value, QobjMeasurementOption):
+            self.write(b"m")
+            self.write_value(value.to_dict())
+        else:
+            raise QiskitError(
+                "Unable to serialize value of type %s in binary qobj." % type(value).__name__
+            )
+
+    def _write_list(self, value):
+        item_types = set(map(type, value))
+        if item_types == {int} and all(_INT64_MIN <= item <= _INT64_MAX for item in value):
+            self.write(b"I" + _UINT32.pack(len(value)))
+            self.write(np.array(value, dtype=">i8").tobytes())
+        elif item_types == {float}:
+            self.write(b"F" + _UINT32.pack(len(value)))
+            self.write(np.array(value, dtype=">f8").tobytes())
+        elif item_types == {complex}:
+            self.write(b"C" + _UINT32.pack(len(value)))
+            self.write(np.array(value, dtype=">c16").tobytes())
+        else:
+            self.write(b"l" + _UINT32.pack(len(value)))
+            for item in value:
+                self.write_value(item)
+
+
+class _Reader:
+    """Reader of the values in a payload."""
+
+    def __init__(self, data, offset):
+        self.data = data
+        self.offset = offset
+        self.strings = []
+
+    def read(self, struct_type):
+        """Read a single value of a struct type."""
+        (value,) = self.read_struct(struct_type)
+        return value
+
+    def read_struct(self, struct_type):
+        """Read all the values of a struct type."""
+        start = self.offset
+        self.offset += struct_type.size
+        if self.offset > len(self.data):
+            raise QiskitError("Truncated binary qobj payload.")
+        return struct_type.unpack_from(self.data, start)
+
+    def read_bytes(self, size):
+        """Read raw bytes."""
+        start = self.offset
+        self.offset += size
+        if self.offset > len(self.data):
+            raise QiskitError("Truncated binary qobj payload.")
+        return self.data[start : self.offset]
+
+    def read_string(self):
+        """Read a reference into the string table."""
+        index = self.read(_UINT32)
+        if index >= len(self.strings):
+            raise QiskitError("Invalid string index %s in binary qobj payload." % index)
+        return self.strings[index]
+
+    def read_instruction(self, instruction_type):
+        """Read an instruction."""
+        instruction = instruction_type.__new__(instruction_type)
+        for _ in range(self.read(_UINT16)):
+            name = self.read_string()
+            setattr(instruction, name, self.read_value())
+        return instruction
+
+    def read_value(self):
+        """Read a typed value."""
+        type_char = self.read_bytes(1).tobytes()
+        read_function = _VALUE_READERS.get(type_char)
+        if read_function is None:
+            raise QiskitError("Invalid value type %s in binary qobj payload." % type_char)
+        return read_function(self)
+
+    def read_list(self):
+        """Read a list of typed values."""
+        return [self.read_value() for _ in range(self.read(_UINT32))]
+
+    def read_dict(self):
+        """Read a dictionary of typed keys and values."""
+        out = {}
+        for _ in range(self.read(_UINT32)):
+            key = self.read_value()
+            out[key] = self.read_value()
+        return out
+
+    def read_packed_list(self, dtype):
+        """Read a list of numbers packed with a single dtype."""
+        size = self.read(_UINT32)
+        return np.frombuffer(self.read_bytes(size * dtype.itemsize), dtype=dtype).tolist()
+
+    def read_array(self):
+        """Read a numpy array."""
+        dtype = np.dtype(self.read_string())
+        ndim = self.read(_UINT8)
+        shape = self.read_struct(struct.Struct("!%dQ" % ndim))
+        size = int(np.prod(shape, dtype=np.int64)) * dtype.itemsize
+        return np.frombuffer(self.read_bytes(size), dtype=dtype).reshape(shape).copy()
+
+
+_ARRAY_TYPES = {b"I": np.dtype(">i8"), b"F": np.dtype(">f8"), b"C": np.dtype(">c16")}
+
+_VALUE_READERS = {
+    b"z": lambda reader: None,
+    b"b": lambda reader: bool(reader.read(_UINT8)),
+    b"i": lambda reader: reader.read(_INT64),
+    b"L": lambda reader: int(reader.read_string()),
+    b"f": lambda reader: reader.read(_DOUBLE),
+    b"c": lambda reader: complex(*reader.read_struct(_COMPLEX)),
+    b"s": _Reader.read_string,
+    b"l": _Reader.read_list,
+    b"u": lambda reader: tuple(reader.read_list()),
+    b"d": _Reader.read_dict,
+    b"a": _Reader.read_array,
+    b"m": lambda reader: QobjMeasurementOption.from_dict(reader.read_value()),
+    **{
+        type_char: functools.partial(_Reader.read_packed_list, dtype=dtype)
+        for type_char, dtype in _ARRAY_TYPES.items()
+    },
+}
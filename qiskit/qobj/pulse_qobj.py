@@ -23,6 +23,7 @@ import warnings
 
 import numpy
 
+from qiskit.exceptions import QiskitError
 from qiskit.qobj.common import QobjDictField
 from qiskit.qobj.common import QobjHeader
 from qiskit.qobj.common import QobjExperimentHeader
@@ -497,7 +498,8 @@ class PulseLibraryItem:
         """
         self.name = name
         if isinstance(samples[0], list):
-            self.samples = numpy.array([complex(sample[0], sample[1]) for sample in samples])
+            samples = numpy.asarray(samples, dtype=float)
+            self.samples = samples[:, 0] + 1j * samples[:, 1]
         else:
             self.samples = samples
 
@@ -673,6 +675,39 @@ class PulseQobj:
             qobj_id=data.get("qobj_id"), config=config, experiments=experiments, header=header
         )
 
+    def to_binary(self):
+        """Return the compact binary representation of the PulseQobj.
+
+        The binary payload is smaller and faster to produce and parse than the JSON
+        encoding of :meth:`to_dict`, see :mod:`qiskit.qobj.binary` for its format.
+
+        Returns:
+            bytes: The binary payload.
+        """
+        from qiskit.qobj.binary import qobj_to_binary  # pylint: disable=cyclic-import
+
+        return qobj_to_binary(self)
+
+    @classmethod
+    def from_binary(cls, data):
+        """Create a new PulseQobj object from its binary representation.
+
+        Args:
+            data (bytes): A payload as returned by :meth:`to_binary`.
+
+        Returns:
+            PulseQobj: The PulseQobj from the payload.
+
+        Raises:
+            QiskitError: If ``data`` is not the binary payload of a PulseQobj.
+        """
+        from qiskit.qobj.binary import qobj_from_binary  # pylint: disable=cyclic-import
+
+        qobj = qobj_from_binary(data)
+        if not isinstance(qobj, cls):
+            raise QiskitError("The payload is not the binary payload of a PulseQobj.")
+        return qobj
+
     def __eq__(self, other):
         if isinstance(other, PulseQobj):
             if self.to_dict() == other.to_dict():
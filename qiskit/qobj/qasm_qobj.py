@@ -23,6 +23,7 @@ import warnings
 import numpy
 
 from qiskit.circuit.parameterexpression import ParameterExpression
+from qiskit.exceptions import QiskitError
 from qiskit.qobj.pulse_qobj import PulseQobjInstruction, PulseLibraryItem
 from qiskit.qobj.common import QobjDictField, QobjHeader, validator
 
@@ -691,6 +692,39 @@ class QasmQobj:
             qobj_id=data.get("qobj_id"), config=config, experiments=experiments, header=header
         )
 
+    def to_binary(self):
+        """Return the compact binary representation of the QasmQobj.
+
+        The binary payload is smaller and faster to produce and parse than the JSON
+        encoding of :meth:`to_dict`, see :mod:`qiskit.qobj.binary` for its format.
+
+        Returns:
+            bytes: The binary payload.
+        """
+        from qiskit.qobj.binary import qobj_to_binary  # pylint: disable=cyclic-import
+
+        return qobj_to_binary(self)
+
+    @classmethod
+    def from_binary(cls, data):
+        """Create a new QasmQobj object from its binary representation.
+
+        Args:
+            data (bytes): A payload as returned by :meth:`to_binary`.
+
+        Returns:
+            QasmQobj: The QasmQobj from the payload.
+
+        Raises:
+            QiskitError: If ``data`` is not the binary payload of a QasmQobj.
+        """
+        from qiskit.qobj.binary import qobj_from_binary  # pylint: disable=cyclic-import
+
+        qobj = qobj_from_binary(data)
+        if not isinstance(qobj, cls):
+            raise QiskitError("The payload is not the binary payload of a QasmQobj.")
+        return qobj
+
     def __eq__(self, other):
         if isinstance(other, QasmQobj):
             if self.to_dict() == other.to_dict():
@@ -23,6 +23,8 @@ Experiment Results (:mod:`qiskit.result`)
    Result
    ResultError
    Counts
+   CountsArray
+   MemoryArray
    marginal_counts
 
 Distributions
@@ -40,6 +42,8 @@ from .result import Result
 from .exceptions import ResultError
 from .utils import marginal_counts
 from .counts import Counts
+from .counts_array import CountsArray
+from .memory_array import MemoryArray
 
 from .distributions.probability import ProbDistribution
 from .distributions.quasi import QuasiDistribution
@@ -0,0 +1,238 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Counts stored as arrays of integer outcomes, for vectorized post-processing."""
+
+import numpy as np
+
+from qiskit.exceptions import QiskitError
+
+# Outcomes that fit in this many bits are stored in a ``uint64`` array, wider outcomes
+# fall back to an object array of Python integers.
+_MAX_NATIVE_BITS = 64
+
+
+class CountsArray:
+    """Measurement counts stored as parallel arrays of integer outcomes and counts.
+
+    Unlike :class:`~qiskit.result.Counts`, which keeps one formatted bitstring per
+    outcome, this class keeps the raw integer outcomes so that marginalization is
+    done by bit masking and the conversion to hexadecimal and binary keys is done
+    for all outcomes at once.
+    """
+
+    __slots__ = ("outcomes", "counts", "memory_slots", "creg_sizes")
+
+    def __init__(self, outcomes, counts, memory_slots=None, creg_sizes=None):
+        """Build a counts array.
+
+        Args:
+            outcomes (array_like): the integer value of each measured outcome.
+            counts (array_like): the number of shots of each outcome.
+            memory_slots (int): the number of memory slots of the experiment. If
+                ``None`` it is inferred from the largest outcome.
+            creg_sizes (list): a list of ``[name, size]`` pairs of the classical
+                registers, used to separate the registers of binary outcomes.
+
+        Raises:
+            QiskitError: if ``outcomes`` and ``counts`` have different lengths.
+        """
+        if not isinstance(outcomes, np.ndarray):
+            outcomes = list(outcomes)
+        counts = np.asarray(counts) if len(counts) else np.zeros(0, dtype=np.int64)
+        if len(outcomes) != len(counts):
+            raise QiskitError(
+                "Outcomes and counts have different lengths: %d != %d"
+                % (len(outcomes), len(counts))
+            )
+        if memory_slots is None:
+            largest = int(max(outcomes)) if len(outcomes) else 0
+            memory_slots = max(largest.bit_length(), 1)
+        self.outcomes = _outcome_array(outcomes, memory_slots)
+        self.counts = counts
+        self.memory_slots = memory_slots
+        self.creg_sizes = creg_sizes
+
+    @classmethod
+    def from_counts(cls, data, memory_slots=None, creg_sizes=None):
+        """Build a counts array from a counts dictionary.
+
+        Args:
+            data (dict): a counts dictionary with integer keys, hexadecimal keys such
+                as ``"0x4a"``, binary keys such as ``"0b1011"`` or bitstring keys
+                such as ``"00 10"``.
+            memory_slots (int): the number of memory slots of the experiment. If
+                ``None``, it is the length of the bitstring keys, or inferred from
+                the largest outcome for the other key formats.
+            creg_sizes (list): a list of ``[name, size]`` pairs of the classical
+                registers.
+
+        Returns:
+            CountsArray: the counts array.
+
+        Raises:
+            QiskitError: if a key is not a valid outcome, for example a dit string.
+        """
+        if not data:
+            return cls([], [], memory_slots=memory_slots or 1, creg_sizes=creg_sizes)
+        keys = list(data.keys())
+        first_key = keys[0]
+        try:
+            if isinstance(first_key, str) and not first_key.startswith("0x"):
+                if first_key.startswith("0b"):
+                    outcomes = [int(key, 0) for key in keys]
+                else:
+                    bitstrings = [key.replace(" ", "").replace("_", "") for key in keys]
+                    if memory_slots is None:
+                        memory_slots = len(bitstrings[0])
+                    outcomes = [int(key, 2) for key in bitstrings]
+            elif isinstance(first_key, str):
+                outcomes = [int(key, 16) for key in keys]
+            else:
+                outcomes = [int(key) for key in keys]
+        except (TypeError, ValueError) as ex:
+            raise QiskitError("Invalid counts key, expected integer outcomes: %s" % ex) from ex
+        return cls(outcomes, list(data.values()), memory_slots=memory_slots, creg_sizes=creg_sizes)
+
+    @classmethod
+    def aggregate(cls, arrays):
+        """Sum the counts of several counts arrays, for example across experiments.
+
+        Args:
+            arrays (list[CountsArray]): the counts arrays to sum.
+
+        Returns:
+            CountsArray: a counts array with the total counts of each outcome, in
+                the order each outcome first appears.
+
+        Raises:
+            QiskitError: if ``arrays`` is empty.
+        """
+        arrays = list(arrays)
+        if not arrays:
+            raise QiskitError("Can not aggregate an empty list of counts arrays.")
+        memory_slots = max(array.memory_slots for array in arrays)
+        outcomes = np.concatenate(
+            [_outcome_array(array.outcomes, memory_slots) for array in arrays]
+        )
+        counts = np.concatenate([array.counts for array in arrays])
+        outcomes, counts = _reduce_outcomes(outcomes, counts)
+        return cls(outcomes, counts, memory_slots=memory_slots, creg_sizes=arrays[0].creg_sizes)
+
+    def __len__(self):
+        return len(self.counts)
+
+    def shots(self):
+        """Return the total number of shots."""
+        return int(self.counts.sum())
+
+    def marginalize(self, indices):
+        """Marginalize the counts over the given bit positions.
+
+        Args:
+            indices (list[int]): the bit positions to keep. Bit ``indices[i]`` of
+                the sorted indices becomes bit ``i`` of the marginal outcomes.
+
+        Returns:
+            CountsArray: the marginal counts, in the order each marginal outcome
+                first appears. The classical registers are not kept.
+
+        Raises:
+            QiskitError: if the indices are empty or out of range.
+        """
+        if not indices or not set(indices).issubset(range(self.memory_slots)):
+            raise QiskitError("indices must be in range [0, {}].".format(self.memory_slots - 1))
+        indices = sorted(set(indices))
+        one = self.outcomes.dtype.type(1)
+        marginal = np.zeros_like(self.outcomes)
+        for position, index in enumerate(indices):
+            bits = (self.outcomes >> self.outcomes.dtype.type(index)) & one
+            marginal |= bits << self.outcomes.dtype.type(position)
+        outcomes, counts = _reduce_outcomes(marginal, self.counts)
+        return CountsArray(outcomes, counts, memory_slots=len(indices))
+
+    def int_outcomes(self):
+        """Return a counts dictionary with integer keys."""
+        return dict(zip(self.outcomes.tolist(), self.counts.tolist()))
+
+    def hex_outcomes(self):
+        """Return a counts dictionary with hexadecimal string keys."""
+        return dict(zip(map(hex, self.outcomes.tolist()), self.counts.tolist()))
+
+    def bin_outcomes(self):
+        """Return a counts dictionary with bitstring keys.
+
+        The keys are padded to ``memory_slots`` bits and, if ``creg_sizes`` is set,
+        separated by register, as in :class:`~qiskit.result.Counts`.
+        """
+        keys = format_bitstrings(self.outcomes, self.memory_slots, self.creg_sizes)
+        return dict(zip(keys, self.counts.tolist()))
+
+
+def format_bitstrings(outcomes, memory_slots, creg_sizes=None):
+    """Format integer outcomes as bitstrings, all at once.
+
+    Args:
+        outcomes (np.ndarray): the integer outcomes, all smaller than
+            ``2 ** memory_slots``.
+        memory_slots (int): the number of bits of each bitstring.
+        creg_sizes (list): a list of ``[name, size]`` pairs of the classical
+            registers whose sizes add up to ``memory_slots``. If given, the
+            registers are separated by spaces.
+
+    Returns:
+        list[str]: the bitstring of each outcome.
+    """
+    outcomes = _outcome_array(outcomes, memory_slots)
+    shift_type = outcomes.dtype.type
+    if outcomes.dtype == object:
+        shifts = np.array(range(memory_slots - 1, -1, -1), dtype=object)
+    else:
+        shifts = np.arange(memory_slots - 1, -1, -1, dtype=np.uint64)
+    bits = ((outcomes[:, None] >> shifts) & shift_type(1)).astype(np.uint8)
+    chars = bits + np.uint8(ord("0"))
+    if creg_sizes and len(creg_sizes) > 1:
+        width = memory_slots + len(creg_sizes) - 1
+        spaced = np.full((len(outcomes), width), ord(" "), dtype=np.uint8)
+        start = 0
+        for register, (_, size) in enumerate(reversed(creg_sizes)):
+            spaced[:, start + register : start + register + size] = chars[:, start : start + size]
+            start += size
+        chars = spaced
+    chars = np.ascontiguousarray(chars)
+    return [key.decode("ascii") for key in chars.view("S%d" % chars.shape[1]).ravel().tolist()]
+
+
+def _outcome_array(outcomes, memory_slots):
+    """Return the outcomes as an array of the dtype used for ``memory_slots`` bits."""
+    dtype = np.uint64 if memory_slots <= _MAX_NATIVE_BITS else object
+    if isinstance(outcomes, np.ndarray) and outcomes.dtype == dtype:
+        return outcomes
+    if dtype is object:
+        array = np.empty(len(outcomes), dtype=object)
+        array[:] = [int(value) for value in outcomes]
+        return array
+    return np.array(
+        outcomes.tolist() if isinstance(outcomes, np.ndarray) else outcomes, dtype=np.uint64
+    )
+
+
+def _reduce_outcomes(outcomes, counts):
+    """Sum the counts of repeated outcomes, keeping the order of first appearance."""
+    if len(outcomes) == 0:
+        return outcomes, counts
+    order = np.argsort(outcomes, kind="stable")
+    sorted_outcomes = outcomes[order]
+    starts = np.flatnonzero(np.concatenate(([True], sorted_outcomes[1:] != sorted_outcomes[:-1])))
+    totals = np.add.reduceat(counts[order], starts)
+    first_seen = np.argsort(order[starts], kind="stable")
+    return sorted_outcomes[starts][first_seen], totals[first_seen]
@@ -0,0 +1,194 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Per-shot memory stored as packed integer arrays."""
+
+import numpy as np
+
+from qiskit.exceptions import QiskitError
+from qiskit.result.counts_array import CountsArray, format_bitstrings
+
+_WORD_BITS = 64
+_WORD_MASK = (1 << _WORD_BITS) - 1
+
+
+class MemoryArray:
+    """The classified memory of every shot of an experiment, stored as packed integers.
+
+    Experiments with up to 64 memory slots are stored with one element of the
+    smallest unsigned integer type that fits per shot. Wider experiments are
+    stored as ``uint64`` words, with word ``i`` holding memory slots ``64 * i``
+    to ``64 * i + 63``.
+
+    The memory is formatted to hexadecimal strings only when requested. A memory
+    array also behaves as the read-only list of hexadecimal strings it replaces.
+    """
+
+    __slots__ = ("_words", "memory_slots")
+
+    def __init__(self, words, memory_slots):
+        """Build a memory array from packed words.
+
+        Args:
+            words (np.ndarray): the packed memory, an unsigned integer array of
+                shape ``(shots,)`` if ``memory_slots <= 64``, or a ``uint64``
+                array of shape ``(shots, ceil(memory_slots / 64))``.
+            memory_slots (int): the number of memory slots of the experiment.
+        """
+        self._words = words
+        self.memory_slots = memory_slots
+
+    @classmethod
+    def from_ints(cls, outcomes, memory_slots=None):
+        """Pack the integer memory value of each shot.
+
+        Args:
+            outcomes (list[int] or np.ndarray): the memory value of each shot.
+            memory_slots (int): the number of memory slots of the experiment. If
+                ``None`` it is inferred from the largest value.
+
+        Returns:
+            MemoryArray: the packed memory.
+        """
+        if isinstance(outcomes, np.ndarray) and outcomes.dtype != object:
+            largest = int(outcomes.max()) if len(outcomes) else 0
+        else:
+            outcomes = [int(value) for value in outcomes]
+            largest = max(outcomes, default=0)
+        if memory_slots is None:
+            memory_slots = max(largest.bit_length(), 1)
+        memory_slots = max(memory_slots, largest.bit_length())
+        if memory_slots <= _WORD_BITS:
+            return cls(np.array(outcomes, dtype=_word_dtype(memory_slots)), memory_slots)
+        values = np.empty(len(outcomes), dtype=object)
+        values[:] = [int(value) for value in outcomes]
+        num_words = -(-memory_slots // _WORD_BITS)
+        words = np.empty((len(values), num_words), dtype=np.uint64)
+        for word in range(num_words):
+            words[:, word] = ((values >> (_WORD_BITS * word)) & _WORD_MASK).astype(np.uint64)
+        return cls(words, memory_slots)
+
+    @classmethod
+    def from_hex(cls, memory, memory_slots=None):
+        """Pack a list of hexadecimal memory strings such as ``["0x0", "0x5"]``.
+
+        Args:
+            memory (list[str]): the hexadecimal memory of each shot.
+            memory_slots (int): the number of memory slots of the experiment. If
+                ``None`` it is inferred from the largest value.
+
+        Returns:
+            MemoryArray: the packed memory.
+
+        Raises:
+            QiskitError: if an element of ``memory`` is not a hexadecimal string.
+        """
+        try:
+            outcomes = [int(value, 16) for value in memory]
+        except (TypeError, ValueError) as ex:
+            raise QiskitError("Invalid hexadecimal memory: %s" % ex) from ex
+        return cls.from_ints(outcomes, memory_slots)
+
+    @property
+    def array(self):
+        """np.ndarray: a read-only view of the packed memory."""
+        view = self._words.view()
+        view.flags.writeable = False
+        return view
+
+    @property
+    def shots(self):
+        """int: the number of shots."""
+        return len(self._words)
+
+    def to_ints(self):
+        """Return the memory value of each shot.
+
+        Returns:
+            np.ndarray: the values, as ``uint64`` for up to 64 memory slots and as
+                Python integers in an object array otherwise.
+        """
+        if self._words.ndim == 1:
+            return self._words.astype(np.uint64, copy=False)
+        values = np.zeros(len(self._words), dtype=object)
+        for word in reversed(range(self._words.shape[1])):
+            values = (values << _WORD_BITS) | self._words[:, word].astype(object)
+        return values
+
+    def to_hex(self):
+        """Return the memory of each shot as a hexadecimal string."""
+        return [hex(value) for value in self.to_ints().tolist()]
+
+    def to_bitstrings(self, creg_sizes=None):
+        """Return the memory of each shot as a bitstring of ``memory_slots`` bits.
+
+        Args:
+            creg_sizes (list): a list of ``[name, size]`` pairs of the classical
+                registers whose sizes add up to ``memory_slots``. If given, the
+                registers are separated by spaces.
+
+        Returns:
+            list[str]: the bitstring of each shot.
+        """
+        return format_bitstrings(self.to_ints(), self.memory_slots, creg_sizes)
+
+    def counts(self):
+        """Return the counts of the memory values, in the order they first appear.
+
+        Returns:
+            CountsArray: the counts of the memory values.
+        """
+        outcomes = CountsArray(
+            self.to_ints(), np.ones(self.shots, dtype=np.int64), self.memory_slots
+        )
+        return CountsArray.aggregate([outcomes])
+
+    def __len__(self):
+        return self.shots
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.to_hex()[index]
+        if self._words.ndim == 1:
+            return hex(int(self._words[index]))
+        value = 0
+        for word in reversed(self._words[index].tolist()):
+            value = (value << _WORD_BITS) | word
+        return hex(value)
+
+    def __iter__(self):
+        return iter(self.to_hex())
+
+    def __eq__(self, other):
+        if isinstance(other, MemoryArray):
+            return self.memory_slots == other.memory_slots and np.array_equal(
+                self._words, other._words
+            )
+        if isinstance(other, (list, tuple)):
+            try:
+                return self.to_hex() == [hex(int(value, 16)) for value in other]
+            except (TypeError, ValueError):
+                return False
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return "MemoryArray(shots={}, memory_slots={})".format(self.shots, self.memory_slots)
+
+
+def _word_dtype(memory_slots):
+    """Return the smallest unsigned integer type holding ``memory_slots`` bits."""
+    for dtype in (np.uint8, np.uint16, np.uint32):
+        if memory_slots <= np.iinfo(dtype).bits:
+            return dtype
+    return np.uint64
@@ -17,11 +17,17 @@ import copy
 from qiskit.qobj.utils import MeasReturnType, MeasLevel
 from qiskit.qobj import QobjExperimentHeader
 from qiskit.exceptions import QiskitError
+from qiskit.result.memory_array import MemoryArray
 
 
 class ExperimentResultData:
     """Class representing experiment result data"""
 
+    # the memory list, or the packed memory of measurement level 2 experiments from which the
+    # list is built on first access
+    _memory = None
+    _packed_memory = None
+
     def __init__(
         self, counts=None, snapshots=None, memory=None, statevector=None, unitary=None, **kwargs
     ):
@@ -34,8 +40,10 @@ class ExperimentResultData:
             snapshots (dict): A dictionary where the key is the snapshot
                 slot and the value is a dictionary of the snapshots for
                 that slot.
-            memory (list): A list of results per shot if the run had
-                memory enabled
+            memory (list or MemoryArray): A list of results per shot if the
+                run had memory enabled. A list of hexadecimal strings, or a
+                :class:`~qiskit.result.MemoryArray`, is stored packed and only
+                converted to a list when the ``memory`` attribute is accessed.
             statevector (list or numpy.array): A list or numpy array of the
                 statevector result
             unitary (list or numpy.array): A list or numpy array of the
@@ -77,9 +85,38 @@ class ExperimentResultData:
         """
         out_dict = {}
         for field in self._data_attributes:
-            out_dict[field] = getattr(self, field)
+            if field == "memory" and self._packed_memory is not None:
+                out_dict[field] = self._packed_memory.to_hex()
+            else:
+                out_dict[field] = getattr(self, field)
         return out_dict
 
+    @property
+    def memory(self):
+        """list: The results per shot, hexadecimal strings for measurement level 2."""
+        if self._packed_memory is not None:
+            # the list may be modified, so it replaces the packed memory
+            self._memory = self._packed_memory.to_hex()
+            self._packed_memory = None
+        if self._memory is None:
+            raise AttributeError("'ExperimentResultData' object has no attribute 'memory'")
+        return self._memory
+
+    @memory.setter
+    def memory(self, memory):
+        if not isinstance(memory, MemoryArray):
+            memory = _pack_memory(memory)
+        if isinstance(memory, MemoryArray):
+            self._memory = None
+            self._packed_memory = memory
+        else:
+            self._memory = memory
+            self._packed_memory = None
+
+    def _memory_array(self):
+        """Return the packed memory, or None if the memory is not packed."""
+        return self._packed_memory
+
     @classmethod
     def from_dict(cls, data):
         """Create a new ExperimentResultData object from a dictionary.
@@ -96,6 +133,17 @@ class ExperimentResultData:
         return cls(**in_data)
 
 
+def _pack_memory(memory):
+    """Pack a list of hexadecimal shot memory, leaving any other memory untouched."""
+    if isinstance(memory, list) and memory and isinstance(memory[0], str):
+        if memory[0].startswith("0x"):
+            try:
+                return MemoryArray.from_hex(memory)
+            except QiskitError:
+                pass
+    return memory
+
+
 class ExperimentResult:
     """Class representing an Experiment Result.
 
@@ -15,6 +15,11 @@
 import numpy as np
 
 from qiskit.exceptions import QiskitError
+from qiskit.result.counts_array import format_bitstrings
+from qiskit.result.memory_array import MemoryArray
+
+# Counts with at least this many outcomes are formatted with numpy rather than key by key.
+_VECTORIZED_FORMAT_MIN_OUTCOMES = 16
 
 
 def _hex_to_bin(hexstring):
@@ -139,13 +144,20 @@ def format_level_2_memory(memory, header=None):
     """Format an experiment result memory object for measurement level 2.
 
     Args:
-        memory (list): Memory from experiment with `meas_level==2` and `memory==True`.
+        memory (list or MemoryArray): Memory from experiment with `meas_level==2` and
+            `memory==True`.
         header (dict): the experiment header dictionary containing
             useful information for postprocessing.
 
     Returns:
         list[str]: List of bitstrings
     """
+    if isinstance(memory, MemoryArray):
+        if header and len(memory):
+            memory_list = _format_outcomes(memory.to_ints(), header)
+            if memory_list is not None:
+                return memory_list
+        memory = memory.to_hex()
     memory_list = []
     for shot_memory in memory:
         memory_list.append(format_counts_memory(shot_memory, header))
@@ -164,6 +176,10 @@ def format_counts(counts, header=None):
     Returns:
         dict: a formatted counts
     """
+    if header and len(counts) >= _VECTORIZED_FORMAT_MIN_OUTCOMES:
+        keys = _format_hex_keys(list(counts), header)
+        if keys is not None:
+            return dict(zip(keys, counts.values()))
     counts_dict = {}
     for key, val in counts.items():
         key = format_counts_memory(key, header)
@@ -171,6 +187,38 @@ def format_counts(counts, header=None):
     return counts_dict
 
 
+def _format_hex_keys(keys, header):
+    """Format hexadecimal counts keys all at once, as :func:`format_counts_memory` does.
+
+    Returns ``None`` if the keys or the header are not supported, in which case the
+    keys must be formatted one by one.
+    """
+    try:
+        outcomes = [int(key, 16) for key in keys if key.startswith("0x")]
+    except (AttributeError, ValueError):
+        return None
+    if len(outcomes) != len(keys):
+        return None
+    return _format_outcomes(outcomes, header)
+
+
+def _format_outcomes(outcomes, header):
+    """Format non-empty integer outcomes all at once, as :func:`format_counts_memory` does.
+
+    Returns ``None`` if the header is not supported, in which case the outcomes must
+    be formatted one by one.
+    """
+    memory_slots = header.get("memory_slots", None)
+    creg_sizes = header.get("creg_sizes", None)
+    if not memory_slots:
+        return None
+    if creg_sizes and sum(size for _, size in creg_sizes) != memory_slots:
+        return None
+    if int(np.max(outcomes)) >> memory_slots:
+        return None
+    return format_bitstrings(outcomes, memory_slots, creg_sizes)
+
+
 def format_statevector(vec, decimals=None):
     """Format statevector coming from the backend to present to the Qiskit user.
 
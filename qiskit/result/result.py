@@ -12,7 +12,9 @@
 
 """Model for schema-conformant Results."""
 
+from collections.abc import MutableSequence
 import copy
+import operator
 import warnings
 
 from qiskit.circuit.quantumcircuit import QuantumCircuit
@@ -22,6 +24,7 @@ from qiskit.quantum_info.states import statevector
 from qiskit.result.models import ExperimentResult
 from qiskit.result import postprocess
 from qiskit.result.counts import Counts
+from qiskit.result.memory_array import MemoryArray
 from qiskit.qobj.utils import MeasLevel
 from qiskit.qobj import QobjHeader
 
@@ -41,6 +44,9 @@ class Result:
     """
 
     _metadata = {}
+    # snapshot of a list of experiment results and the positions of its experiments by header
+    # name, built on the first lookup by name
+    _name_index = None
 
     def __init__(
         self,
@@ -128,20 +134,27 @@ class Result:
             raise AttributeError(f"Attribute {name} is not defined") from ex
 
     @classmethod
-    def from_dict(cls, data):
+    def from_dict(cls, data, lazy=False):
         """Create a new ExperimentResultData object from a dictionary.
 
         Args:
             data (dict): A dictionary representing the Result to create. It
                          will be in the same format as output by
                          :meth:`to_dict`.
+            lazy (bool): If True, the experiment results are only built from
+                         their dictionaries when they are first accessed. This
+                         makes loading large results much faster when only some
+                         of their experiments are used.
         Returns:
             Result: The ``Result`` object from the input dictionary.
 
         """
 
         in_data = copy.copy(data)
-        in_data["results"] = [ExperimentResult.from_dict(x) for x in in_data.pop("results")]
+        if lazy:
+            in_data["results"] = _LazyExperimentResults(in_data.pop("results"))
+        else:
+            in_data["results"] = [ExperimentResult.from_dict(x) for x in in_data.pop("results")]
         if "header" in in_data:
             in_data["header"] = QobjHeader.from_dict(in_data.pop("header"))
         return cls(**in_data)
@@ -234,7 +247,10 @@ class Result:
 
             meas_level = exp_result.meas_level
 
-            memory = self.data(experiment)["memory"]
+            # the packed memory is formatted without building the list of the data
+            memory = exp_result.data._memory_array()  # pylint: disable=protected-access
+            if memory is None:
+                memory = exp_result.data.memory
 
             if meas_level == MeasLevel.CLASSIFIED:
                 return postprocess.format_level_2_memory(memory, header)
@@ -245,7 +261,7 @@ class Result:
             else:
                 raise QiskitError("Measurement level {} is not supported".format(meas_level))
 
-        except KeyError as ex:
+        except (KeyError, AttributeError) as ex:
             raise QiskitError(
                 'No memory for experiment "{}". '
                 "Please verify that you either ran a measurement level 2 job "
@@ -253,6 +269,42 @@ class Result:
                 "or a measurement level 0/1 job.".format(repr(experiment))
             ) from ex
 
+    def get_memory_array(self, experiment=None):
+        """Get the packed memory of each shot of a measurement level 2 experiment.
+
+        Unlike :meth:`get_memory`, no string is built for each shot, so this is the
+        cheapest way to process the memory of experiments with many shots. For example
+        ``result.get_memory_array(0).array`` is a NumPy array with the memory value
+        of each shot.
+
+        Args:
+            experiment (str or QuantumCircuit or Schedule or int or None): the index of the
+                experiment, as specified by ``data()``.
+
+        Returns:
+            MemoryArray: the packed memory of the experiment.
+
+        Raises:
+            QiskitError: if there is no measurement level 2 memory for the experiment.
+        """
+        exp_result = self._get_experiment(experiment)
+        memory = exp_result.data._memory_array()  # pylint: disable=protected-access
+        if memory is None:
+            memory = getattr(exp_result.data, "memory", None)
+        if exp_result.meas_level != MeasLevel.CLASSIFIED or memory is None:
+            raise QiskitError(
+                'No measurement level 2 memory for experiment "{}". Please verify '
+                'that you ran the job with the memory flag set, eg., "memory=True".'.format(
+                    repr(experiment)
+                )
+            )
+        if not isinstance(memory, MemoryArray):
+            memory = MemoryArray.from_hex(memory)
+        memory_slots = getattr(getattr(exp_result, "header", None), "memory_slots", None)
+        if memory_slots and memory_slots > memory.memory_slots:
+            memory = MemoryArray(memory.array, memory_slots)
+        return memory
+
     def get_counts(self, experiment=None):
         """Get the histogram data of an experiment.
 
@@ -382,23 +434,16 @@ class Result:
                 raise QiskitError(f'Result for experiment "{key}" could not be found.') from ex
         else:
             # Look into `result[x].header.name` for the names.
-            exp = [
-                result
-                for result in self.results
-                if getattr(getattr(result, "header", None), "name", "") == key
-            ]
-
-            if len(exp) == 0:
+            positions = self._positions(key)
+            if len(positions) == 0:
                 raise QiskitError('Data for experiment "%s" could not be found.' % key)
-            if len(exp) == 1:
-                exp = exp[0]
-            else:
+            if len(positions) > 1:
                 warnings.warn(
                     'Result object contained multiple results matching name "%s", '
                     "only first match will be returned. Use an integer index to "
                     "retrieve results for all entries." % key
                 )
-                exp = exp[0]
+            exp = self.results[positions[0]]
 
         # Check that the retrieved experiment was successful
         if getattr(exp, "success", False):
@@ -407,3 +452,102 @@ class Result:
         result_status = getattr(self, "status", "Result was not successful")
         exp_status = getattr(exp, "status", "Experiment was not successful")
         raise QiskitError(result_status, ", ", exp_status)
+
+    def _positions(self, name):
+        """Return the positions of the experiments with the header name ``name``."""
+        results = self.results
+        if isinstance(results, _LazyExperimentResults):
+            return results.positions(name)
+        try:
+            hash(name)
+        except TypeError:
+            return [position for position, result in enumerate(results) if _name(result) == name]
+        index = self._name_index
+        # the index is valid as long as the list holds the same experiments, which may have
+        # been renamed since
+        if (
+            index is not None
+            and index[0] is results
+            and len(index[1]) == len(results)
+            and all(map(operator.is_, index[1], results))
+        ):
+            positions = index[2].get(name)
+            if positions and all(_name(results[position]) == name for position in positions):
+                return positions
+        names = {}
+        for position, result in enumerate(results):
+            names.setdefault(_name(result), []).append(position)
+        self._name_index = (results, list(results), names)
+        return names.get(name, [])
+
+
+def _name(result):
+    """Return the header name of an experiment result."""
+    return getattr(getattr(result, "header", None), "name", "")
+
+
+class _LazyExperimentResults(MutableSequence):
+    """A list of experiment results which are built from their dictionaries on access."""
+
+    def __init__(self, results):
+        # Each item is either the dictionary of an experiment result not accessed yet
+        # or its ExperimentResult.
+        self._items = list(results)
+        # positions of the experiments by header name, built on the first lookup by name
+        # and discarded when the list is modified
+        self._name_index = None
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[position] for position in range(*index.indices(len(self._items)))]
+        item = self._items[index]
+        if isinstance(item, dict):
+            item = ExperimentResult.from_dict(item)
+            self._items[index] = item
+        return item
+
+    def __setitem__(self, index, value):
+        self._items[index] = value
+        self._name_index = None
+
+    def __delitem__(self, index):
+        del self._items[index]
+        self._name_index = None
+
+    def __len__(self):
+        return len(self._items)
+
+    def insert(self, index, value):
+        self._items.insert(index, value)
+        self._name_index = None
+
+    def name(self, index):
+        """Return the header name of an experiment without building it."""
+        item = self._items[index]
+        if isinstance(item, dict):
+            return (item.get("header") or {}).get("name", "")
+        return _name(item)
+
+    def positions(self, name):
+        """Return the positions of the experiments with the header name ``name``."""
+        try:
+            hash(name)
+        except TypeError:
+            return []
+        if self._name_index is not None:
+            positions = self._name_index.get(name)
+            # the experiments built already may have been renamed since, also to ``name``
+            if positions and all(self.name(position) == name for position in positions):
+                return positions
+        self._name_index = {}
+        for position in range(len(self._items)):
+            self._name_index.setdefault(self.name(position), []).append(position)
+        return self._name_index.get(name, [])
+
+    def __eq__(self, other):
+        if isinstance(other, (list, _LazyExperimentResults)):
+            return self[:] == other[:]
+        return NotImplemented
+
+    def __repr__(self):
+        return repr(self[:])
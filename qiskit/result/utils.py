@@ -17,7 +17,7 @@ from copy import deepcopy
 
 from qiskit.exceptions import QiskitError
 from qiskit.result.result import Result
-from qiskit.result.postprocess import _bin_to_hex
+from qiskit.result.counts_array import CountsArray
 
 
 def marginal_counts(result, indices=None, inplace=False, format_marginal=False):
@@ -47,12 +47,13 @@ def marginal_counts(result, indices=None, inplace=False, format_marginal=False):
         if not inplace:
             result = deepcopy(result)
         for i, experiment_result in enumerate(result.results):
-            counts = result.get_counts(i)
-            new_counts = _marginalize(counts, indices)
-            new_counts_hex = {}
-            for k, v in new_counts.items():
-                new_counts_hex[_bin_to_hex(k)] = v
-            experiment_result.data.counts = new_counts_hex
+            counts = getattr(experiment_result.data, "counts", None)
+            memory_slots = getattr(experiment_result.header, "memory_slots", None)
+            if counts is None:
+                counts = result.get_counts(i)
+                memory_slots = None
+            counts_array = CountsArray.from_counts(counts, memory_slots=memory_slots)
+            experiment_result.data.counts = counts_array.marginalize(indices).hex_outcomes()
             experiment_result.header.memory_slots = len(indices)
             csize = experiment_result.header.creg_sizes
             experiment_result.header.creg_sizes = _adjust_creg_sizes(csize, indices)
@@ -106,6 +107,15 @@ def _marginalize(counts, indices=None):
     if not indices or not set(indices).issubset(set(range(num_clbits))):
         raise QiskitError("indices must be in range [0, {}].".format(num_clbits - 1))
 
+    # Marginalize bitstrings by bit masking their integer values, dit strings
+    # fall back to picking the characters of each key
+    try:
+        counts_array = CountsArray.from_counts(counts, memory_slots=num_clbits)
+    except QiskitError:
+        pass
+    else:
+        return counts_array.marginalize(indices).bin_outcomes()
+
     # Sort the indices to keep in descending order
     # Since bitstrings have qubit-0 as least significant bit
     indices = sorted(indices, reverse=True)
@@ -15,6 +15,7 @@
 from typing import Type
 
 from qiskit.circuit.gate import Gate
+from qiskit.circuit.definitioncache import cached_definition
 from qiskit.transpiler.basepasses import TransformationPass
 from qiskit.dagcircuit.dagcircuit import DAGCircuit
 from qiskit.converters.circuit_to_dag import circuit_to_dag
@@ -41,19 +42,31 @@ class Decompose(TransformationPass):
         Returns:
             output dag where ``gate`` was expanded.
         """
+        # the decompositions of the definitions by id, equal gates share their definition
+        decompositions = {}
+
         # Walk through the DAG and expand each non-basis node
         for node in dag.op_nodes(self.gate):
+            definition = cached_definition(node.op)
             # opaque or built-in gates are not decomposable
-            if not node.op.definition:
+            if not definition:
                 continue
             # TODO: allow choosing among multiple decomposition rules
-            rule = node.op.definition.data
+            rule = definition.data
 
             if len(rule) == 1 and len(node.qargs) == len(rule[0][1]) == 1:
-                if node.op.definition.global_phase:
-                    dag.global_phase += node.op.definition.global_phase
-                dag.substitute_node(node, rule[0][0], inplace=True)
+                if definition.global_phase:
+                    dag.global_phase += definition.global_phase
+                # the definition is shared, and the condition of the node is set on the
+                # substituted gate
+                dag.substitute_node(node, rule[0][0].copy(), inplace=True)
             else:
-                decomposition = circuit_to_dag(node.op.definition)
+                if id(definition) not in decompositions:
+                    decompositions[id(definition)] = (definition, circuit_to_dag(definition))
+                decomposition = decompositions[id(definition)][1]
+                # the inserted nodes take the operations of the decomposition, which is inserted
+                # again for equal gates, so it gets copies of the operations every time
+                for op_node in decomposition.op_nodes():
+                    op_node.op = op_node.op.copy()
                 dag.substitute_node_with_dag(node, decomposition)
         return dag
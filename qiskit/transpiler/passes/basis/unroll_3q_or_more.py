@@ -14,6 +14,7 @@
 
 from qiskit.transpiler.basepasses import TransformationPass
 from qiskit.exceptions import QiskitError
+from qiskit.circuit.definitioncache import cached_definition
 from qiskit.converters.circuit_to_dag import circuit_to_dag
 
 
@@ -30,9 +31,24 @@ class Unroll3qOrMore(TransformationPass):
         Raises:
             QiskitError: if a 3q+ gate is not decomposable
         """
+        return self._unroll(dag, {})
+
+    def _unroll(self, dag, unrolled):
+        """Unroll the 3q+ gates of `dag` in place.
+
+        Args:
+            dag(DAGCircuit): input dag
+            unrolled(dict): the unrolled dags of the definitions already expanded, by id
+                of the definition.
+        Returns:
+            DAGCircuit: output dag with maximum node degrees of 2
+        Raises:
+            QiskitError: if a 3q+ gate is not decomposable
+        """
         for node in dag.multi_qubit_ops():
             # TODO: allow choosing other possible decompositions
-            rule = node.op.definition.data
+            definition = cached_definition(node.op)
+            rule = definition.data
             if not rule:
                 if rule == []:  # empty node
                     dag.remove_op_node(node)
@@ -41,7 +57,14 @@ class Unroll3qOrMore(TransformationPass):
                     "Cannot unroll all 3q or more gates. "
                     "No rule to expand instruction %s." % node.op.name
                 )
-            decomposition = circuit_to_dag(node.op.definition)
-            decomposition = self.run(decomposition)  # recursively unroll
+            if id(definition) not in unrolled:
+                decomposition = circuit_to_dag(definition)
+                decomposition = self._unroll(decomposition, unrolled)  # recursively unroll
+                unrolled[id(definition)] = (definition, decomposition)
+            decomposition = unrolled[id(definition)][1]
+            # the inserted nodes take the operations of the decomposition, which is inserted
+            # again for equal gates, so it gets copies of the operations every time
+            for op_node in decomposition.op_nodes():
+                op_node.op = op_node.op.copy()
             dag.substitute_node_with_dag(node, decomposition)
         return dag
@@ -15,6 +15,7 @@
 from qiskit.transpiler.basepasses import TransformationPass
 from qiskit.exceptions import QiskitError
 from qiskit.circuit import ControlledGate
+from qiskit.circuit.definitioncache import cached_definition
 from qiskit.converters.circuit_to_dag import circuit_to_dag
 
 
@@ -50,6 +51,20 @@ class Unroller(TransformationPass):
         """
         if self.basis is None:
             return dag
+        return self._unroll(dag, {})
+
+    def _unroll(self, dag, unrolled):
+        """Unroll `dag` in place.
+
+        Args:
+            dag (DAGCircuit): input dag
+            unrolled (dict): the unrolled dags of the definitions already expanded, by id
+                of the definition. Equal gates share their definition, which is only
+                unrolled once.
+
+        Returns:
+            DAGCircuit: output unrolled dag
+        """
         # Walk through the DAG and expand each non-basis node
         basic_insts = ["measure", "reset", "barrier", "snapshot", "delay"]
         for node in dag.op_nodes():
@@ -70,8 +85,9 @@ class Unroller(TransformationPass):
 
             # TODO: allow choosing other possible decompositions
             try:
-                phase = node.op.definition.global_phase
-                rule = node.op.definition.data
+                definition = cached_definition(node.op)
+                phase = definition.global_phase
+                rule = definition.data
             except (TypeError, AttributeError) as err:
                 raise QiskitError(
                     f"Error decomposing node of instruction '{node.name}': "
@@ -86,11 +102,14 @@ class Unroller(TransformationPass):
             while rule and len(rule) == 1 and len(node.qargs) == len(rule[0][1]) == 1:
                 if rule[0][0].name in self.basis:
                     dag.global_phase += phase
-                    dag.substitute_node(node, rule[0][0], inplace=True)
+                    # the definition is shared, and the condition of the node is set on the
+                    # substituted gate
+                    dag.substitute_node(node, rule[0][0].copy(), inplace=True)
                     break
                 try:
-                    phase += rule[0][0].definition.global_phase
-                    rule = rule[0][0].definition.data
+                    inner_definition = cached_definition(rule[0][0])
+                    phase += inner_definition.global_phase
+                    rule = inner_definition.data
                 except (TypeError, AttributeError) as err:
                     raise QiskitError(
                         f"Error decomposing node of instruction '{node.name}': "
@@ -109,7 +128,15 @@ class Unroller(TransformationPass):
                         "Cannot unroll the circuit to the given basis, %s. "
                         "No rule to expand instruction %s." % (str(self.basis), node.op.name)
                     )
-                decomposition = circuit_to_dag(node.op.definition)
-                unrolled_dag = self.run(decomposition)  # recursively unroll ops
-                dag.substitute_node_with_dag(node, unrolled_dag)
+                if id(definition) not in unrolled:
+                    decomposition = circuit_to_dag(definition)
+                    # recursively unroll ops
+                    unrolled_dag = self._unroll(decomposition, unrolled)
+                    unrolled[id(definition)] = (definition, unrolled_dag)
+                decomposition = unrolled[id(definition)][1]
+                # the inserted nodes take the operations of the decomposition, which is inserted
+                # again for equal gates, so it gets copies of the operations every time
+                for op_node in decomposition.op_nodes():
+                    op_node.op = op_node.op.copy()
+                dag.substitute_node_with_dag(node, decomposition)
         return dag
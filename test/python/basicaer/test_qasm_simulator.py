@@ -22,8 +22,9 @@ import numpy as np
 
 from qiskit import execute
 from qiskit import ClassicalRegister, QuantumCircuit, QuantumRegister
+from qiskit.circuit import Parameter
 from qiskit.compiler import transpile, assemble
-from qiskit.providers.basicaer import QasmSimulatorPy
+from qiskit.providers.basicaer import BasicAerError, QasmSimulatorPy
 from qiskit.test import providers
 
 
@@ -137,6 +138,49 @@ class TestBasicAerQasmSimulator(providers.BackendTestCase):
         counts = result.get_counts(0)
         self.assertEqual(counts, target)
 
+    def test_measure_sampler_gates_after_measure(self):
+        """Test measure sampler with gates on other qubits after a measurement."""
+        shots = 1000
+        qr = QuantumRegister(3, "qr")
+        cr = ClassicalRegister(3, "cr")
+        circuit = QuantumCircuit(qr, cr)
+        circuit.reset(qr)
+        circuit.h(qr[0])
+        circuit.measure(qr[0], cr[0])
+        circuit.x(qr[1])
+        circuit.measure(qr[1], cr[1])
+        circuit.cx(qr[1], qr[2]).c_if(cr, 0)
+        circuit.h(qr[2])
+        circuit.h(qr[2])
+        circuit.measure(qr[2], cr[2])
+        job = execute(circuit, backend=self.backend, shots=shots, seed_simulator=self.seed)
+        counts = job.result().get_counts(0)
+        self.assertFalse(self.backend._sample_measure)
+        self.assertEqual(set(counts), {"010", "011"})
+
+        # Without the conditional gate all measurements can be sampled
+        circuit.data.pop(7)
+        job = execute(circuit, backend=self.backend, shots=shots, seed_simulator=self.seed)
+        counts = job.result().get_counts(0)
+        self.assertTrue(self.backend._sample_measure)
+        self.assertEqual(set(counts), {"010", "011"})
+        self.assertDictAlmostEqual(counts, {"010": shots / 2, "011": shots / 2}, 0.05 * shots)
+
+    def test_measure_sampler_disabled(self):
+        """Test measure sampler is not used for gates on measured qubits."""
+        shots = 100
+        qr = QuantumRegister(2, "qr")
+        cr = ClassicalRegister(2, "cr")
+        circuit = QuantumCircuit(qr, cr)
+        circuit.h(qr[0])
+        circuit.measure(qr[0], cr[0])
+        circuit.cx(qr[0], qr[1])
+        circuit.measure(qr[1], cr[1])
+        job = execute(circuit, backend=self.backend, shots=shots, seed_simulator=self.seed)
+        counts = job.result().get_counts(0)
+        self.assertFalse(self.backend._sample_measure)
+        self.assertEqual(set(counts), {"00", "11"})
+
     def test_qasm_simulator(self):
         """Test data counts output for single circuit run against reference."""
         result = self.backend.run(self.qobj).result()
@@ -155,6 +199,63 @@ class TestBasicAerQasmSimulator(providers.BackendTestCase):
         }
         self.assertDictAlmostEqual(counts, target, threshold)
 
+    def test_qasm_simulator_binary_qobj(self):
+        """Test running the binary representation of a qobj gives the same counts."""
+        expected = self.backend.run(self.qobj).result().get_counts("test")
+        result = self.backend.run(self.qobj.to_binary()).result()
+        self.assertEqual(result.get_counts("test"), expected)
+
+    def test_parallel_experiments(self):
+        """Test experiments run in parallel threads give the same results as serially."""
+        circuits = []
+        for num_qubits in range(1, 5):
+            circuit = QuantumCircuit(num_qubits, num_qubits, name="ghz_%d" % num_qubits)
+            circuit.h(0)
+            for qubit in range(1, num_qubits):
+                circuit.cx(0, qubit)
+            circuit.measure(range(num_qubits), range(num_qubits))
+            circuits.append(circuit)
+        circuits = transpile(circuits, self.backend)
+        serial = self.backend.run(circuits, shots=100, seed_simulator=self.seed).result()
+        parallel = self.backend.run(
+            circuits, shots=100, seed_simulator=self.seed, max_parallel_experiments=2
+        ).result()
+        self.assertEqual(serial.metadata["parallel_experiments"], 1)
+        self.assertEqual(parallel.metadata["parallel_experiments"], 2)
+        self.assertEqual(parallel.get_counts(), serial.get_counts())
+        for experiment_result in parallel.results:
+            self.assertGreaterEqual(experiment_result.time_taken, 0)
+
+    def test_parallel_experiments_invalid(self):
+        """Test a negative number of parallel experiments raises."""
+        with self.assertRaises(BasicAerError):
+            self.backend.run(self.qobj, max_parallel_experiments=-1)
+
+    def test_parameter_sweep(self):
+        """Test a parameter sweep gives the same counts as the bound circuits."""
+        theta = Parameter("theta")
+        circuit = QuantumCircuit(3, 3)
+        circuit.h(0)
+        circuit.cx(0, 1)
+        circuit.ry(theta, 2)
+        circuit.measure([0, 1, 2], [0, 1, 2])
+        circuit = transpile(circuit, self.backend)
+        binds = [{theta: value} for value in np.linspace(0, np.pi, 4)]
+        shots = 1000
+        result = self.backend.run(
+            circuit, shots=shots, seed_simulator=self.seed, parameter_binds=binds
+        ).result()
+        self.assertEqual(len(result.results), len(binds))
+        for index, bind in enumerate(binds):
+            expected = (
+                self.backend.run(
+                    circuit.bind_parameters(bind), shots=shots, seed_simulator=self.seed
+                )
+                .result()
+                .get_counts()
+            )
+            self.assertDictAlmostEqual(result.get_counts(index), expected, 0.01 * shots)
+
     def test_if_statement(self):
         """Test if statements."""
         shots = 100
@@ -12,6 +12,7 @@
 """Test StateVectorSimulatorPy."""
 
 import unittest
+from unittest.mock import patch
 
 import numpy as np
 
@@ -19,8 +20,11 @@ from qiskit.providers.basicaer import StatevectorSimulatorPy
 from qiskit.test import ReferenceCircuits
 from qiskit.test import providers
 from qiskit import QuantumRegister, QuantumCircuit, execute
+from qiskit.circuit import Parameter
 from qiskit.quantum_info.random import random_unitary
-from qiskit.quantum_info import state_fidelity
+from qiskit.quantum_info import state_fidelity, Statevector
+from qiskit.circuit.random import random_circuit
+from qiskit.compiler import assemble, transpile
 
 
 class StatevectorSimulatorTest(providers.BackendTestCase):
@@ -58,6 +62,100 @@ class StatevectorSimulatorTest(providers.BackendTestCase):
         # state is 1/sqrt(2)|00> + 1/sqrt(2)|11>, up to a global phase
         self.assertTrue(success)
 
+    def test_fused_gates(self):
+        """Test that fusing consecutive gates gives the same final state vector."""
+        for seed in range(5):
+            circuit = random_circuit(4, 6, max_operands=2, seed=seed)
+            circuit = transpile(
+                circuit, basis_gates=["u1", "u2", "u3", "cx", "id"], seed_transpiler=seed
+            )
+            circuit.unitary(random_unitary(4, seed=seed), [3, 1])
+            circuit.x(2)
+            circuit.cx(0, 2)
+            for fusion_threshold in [0, 10]:
+                with self.subTest(seed=seed, fusion_threshold=fusion_threshold):
+                    with patch.object(self.backend, "FUSION_THRESHOLD", fusion_threshold):
+                        result = execute(circuit, self.backend).result()
+                    actual = result.get_statevector()
+                    self.assertAlmostEqual(state_fidelity(Statevector(circuit), actual), 1)
+
+    def test_fusion_threshold(self):
+        """Test that gates are only fused in experiments on enough qubits."""
+        circuit = QuantumCircuit(2)
+        circuit.sx(0)
+        circuit.cx(0, 1)
+        circuit.x(1)
+        instructions = assemble(circuit).experiments[0].instructions
+        for num_qubits, program_length in [(2, 3), (10, 1)]:
+            with self.subTest(num_qubits=num_qubits):
+                self.backend._number_of_qubits = num_qubits
+                program = self.backend._compile_instructions(instructions)
+                self.assertEqual(len(program), program_length)
+
+    def test_parameter_sweep(self):
+        """Test a parameter sweep simulates the gates before the parameters once."""
+        theta = Parameter("theta")
+        phi = Parameter("phi")
+        circuit = QuantumCircuit(3, global_phase=theta)
+        circuit.h(0)
+        circuit.cx(0, 1)
+        circuit.u3(0.3, 0.2, 0.1, 2)
+        circuit.ry(theta, 1)
+        circuit.cx(1, 2)
+        circuit.rz(phi, 2)
+        circuit = transpile(circuit, self.backend, seed_transpiler=88)
+        binds = [{theta: value, phi: 2 * value} for value in np.linspace(0, np.pi, 5)]
+        with patch.object(
+            self.backend, "_simulate_prefix", wraps=self.backend._simulate_prefix
+        ) as simulate_prefix:
+            result = self.backend.run(circuit, parameter_binds=binds).result()
+        self.assertEqual(simulate_prefix.call_count, 1)
+        self.assertEqual(len(result.results), len(binds))
+        for index, bind in enumerate(binds):
+            expected = Statevector(circuit.bind_parameters(bind))
+            self.assertTrue(np.allclose(result.get_statevector(index), expected.data))
+
+    def test_shared_prefixes(self):
+        """Test experiments starting with the same gates share their simulation."""
+        base = random_circuit(3, 4, max_operands=2, seed=42)
+        base = transpile(base, basis_gates=["u1", "u2", "u3", "cx"], seed_transpiler=42)
+        circuits = []
+        for first, second in [("h", "x"), ("s", "x"), ("h", "y"), ("s", "y"), ("h", None)]:
+            circuit = base.copy()
+            getattr(circuit, first)(0)
+            if second is not None:
+                getattr(circuit, second)(1)
+            circuits.append(transpile(circuit, self.backend, optimization_level=0))
+        circuits.append(transpile(QuantumCircuit(3), self.backend))
+        for max_prefix_memory_mb, num_prefixes in [(1, 3), (0, 0)]:
+            with patch.object(
+                self.backend, "_simulate_prefix", wraps=self.backend._simulate_prefix
+            ) as simulate_prefix:
+                result = self.backend.run(
+                    circuits, max_prefix_memory_mb=max_prefix_memory_mb
+                ).result()
+            self.assertEqual(simulate_prefix.call_count, num_prefixes)
+            for index, circuit in enumerate(circuits):
+                expected = Statevector(circuit)
+                self.assertTrue(np.allclose(result.get_statevector(index), expected.data))
+
+    def test_no_shared_prefixes(self):
+        """Test experiments starting with different gates are run without prefix trees."""
+        circuits = []
+        for gate in ["h", "x", "s"]:
+            circuit = QuantumCircuit(2)
+            getattr(circuit, gate)(0)
+            circuit.cx(0, 1)
+            circuits.append(transpile(circuit, self.backend, optimization_level=0))
+        nodes = self.backend._prefix_trees(assemble(circuits).experiments)
+        self.assertEqual(
+            [(node.depth, node.experiments) for node in nodes], [(0, [0]), (0, [1]), (0, [2])]
+        )
+        result = self.backend.run(circuits).result()
+        for index, circuit in enumerate(circuits):
+            expected = Statevector(circuit)
+            self.assertTrue(np.allclose(result.get_statevector(index), expected.data))
+
     def test_unitary(self):
         """Test unitary gate instruction"""
         num_trials = 10
@@ -528,6 +528,39 @@ class TestTwoLocal(QiskitTestCase):
         with self.subTest(msg="num_parameters_settable remained constant"):
             self.assertEqual(two.num_parameters_settable, len(ordered_params))
 
+    @data((2, 4), (4, 2), (3, 0), (0, 3))
+    @unpack
+    def test_changing_reps_reuses_built_layers(self, reps, new_reps):
+        """Test changing the repetitions of a built circuit keeps the layers of common reps."""
+        two = TwoLocal(3, ["ry", "rz"], "cz", "sca", reps=reps, insert_barriers=True)
+        first_instruction = two.data[0][0] if reps > 0 else None
+        two.reps = new_reps
+
+        expected = TwoLocal(3, ["ry", "rz"], "cz", "sca", reps=new_reps, insert_barriers=True)
+        expected.assign_parameters(two.ordered_parameters, inplace=True)
+
+        self.assertEqual(two, expected)
+        self.assertListEqual(list(two.parameters), two.ordered_parameters)
+        if first_instruction is not None and new_reps > 0:
+            self.assertIs(two.data[0][0], first_instruction)
+
+    def test_changing_reps_after_binding_rebuilds(self):
+        """Test the built layers are not reused if the parameters have been modified."""
+        two = RealAmplitudes(2, reps=1)
+        bound = two.assign_parameters([0.1, 0.2, 0.3, 0.4])
+        bound.reps = 2
+
+        self.assertEqual(bound.num_parameters, 6)
+        self.assertEqual(bound, RealAmplitudes(2, reps=2).assign_parameters(bound.parameters))
+
+    def test_changing_reps_after_replacing_instruction_rebuilds(self):
+        """Test the built layers are not reused if an instruction has been replaced in place."""
+        two = RealAmplitudes(2, reps=2)
+        two.data[0] = (XGate(), [two.qubits[0]], [])
+        two.reps = 1
+
+        self.assertEqual(two, RealAmplitudes(2, reps=1).assign_parameters(two.ordered_parameters))
+
     def test_compose_inplace_to_circuit(self):
         """Test adding a two-local to an existing circuit."""
         two = TwoLocal(3, ["ry", "rz"], "cz", "full", reps=1, insert_barriers=True)
@@ -14,6 +14,8 @@
 """Test cases for the circuit qasm_file and qasm_string method."""
 
 import os
+import tempfile
+from unittest.mock import call, patch
 
 from qiskit import QuantumCircuit, QuantumRegister, ClassicalRegister
 from qiskit.circuit import Gate, Parameter
@@ -21,6 +23,9 @@ from qiskit.exceptions import QiskitError
 from qiskit.test import QiskitTestCase
 from qiskit.transpiler.passes import Unroller
 from qiskit.converters.circuit_to_dag import circuit_to_dag
+from qiskit.converters import ast_to_dag, dag_to_circuit
+from qiskit.qasm import Qasm
+from qiskit.qasm.fastparser import circuit_from_qasm
 
 
 class LoadFromQasmTest(QiskitTestCase):
@@ -474,6 +479,71 @@ class LoadFromQasmTest(QiskitTestCase):
         expected.u(-0.5235987755982988, 6.283185307179586, 3.141592653589793, qr[0])
         self.assertEqualUnroll("u", circuit, expected)
 
+    def test_fast_parser_matches_ast(self):
+        """Test that the fast parser gives the same circuit as the AST interpreter."""
+        qasm_string = """OPENQASM 2.0;
+                         include "qelib1.inc";
+                         qreg q[3];
+                         qreg r[3];
+                         creg c[3];
+                         h q;
+                         cx q[0], r;
+                         cx q, r;
+                         CX q[1], q[2];
+                         U(sin(pi/2), -2^-1, 3 - 1 - 1) q[0];
+                         u3(1, 2.5e-1, .5) r[2];
+                         rz(-pi/2^2*3) q[1];
+                         cu(pi, 0, pi/4, ln(2)) q[0], r[1]; // comment
+                         if(c==2) x q[0];
+                         if(c==1) measure q[1] -> c[1];
+                         barrier q, r[0];
+                         reset r;
+                         measure q -> c;"""
+        circuit = circuit_from_qasm(qasm_string)
+        expected = dag_to_circuit(ast_to_dag(Qasm(data=qasm_string).parse()))
+        self.assertEqual(circuit, expected)
+        self.assertEqual(QuantumCircuit.from_qasm_str(qasm_string), expected)
+
+    def test_fast_parser_qasm_file(self):
+        """Test that the fast parser gives the same circuit for QASM files."""
+        for file_name in ["all_gates.qasm", "example.qasm", "random_n5_d5.qasm"]:
+            with self.subTest(file_name=file_name):
+                qasm = Qasm(filename=os.path.join(self.qasm_dir, file_name))
+                circuit = circuit_from_qasm(qasm.return_data())
+                self.assertIsNotNone(circuit)
+                self.assertEqual(circuit, dag_to_circuit(ast_to_dag(qasm.parse())))
+
+    def test_fast_parser_fallback(self):
+        """Test that the fast parser leaves unsupported and invalid programs to the AST parser."""
+        header = 'OPENQASM 2.0;\ninclude "qelib1.inc";\nqreg q[2];\n'
+        for body in [
+            "gate my_gate a { h a; }\nmy_gate q[0];",
+            "opaque my_gate a;\nmy_gate q[0];",
+            "c3x q[0], q[1], q[0], q[1];",
+            "cx q, q;",
+            "h q[2];",
+            "rz(01) q[0];",
+            "h q[0]",
+        ]:
+            with self.subTest(body=body):
+                self.assertIsNone(circuit_from_qasm(header + body))
+        self.assertIsNone(circuit_from_qasm("OPENQASM 2.0;\nqreg q[2];\nh q[0];"))
+
+    def test_fast_parser_fallback_reads_file_once(self):
+        """Test that a QASM file left to the AST parser is only read once."""
+        qasm_string = 'OPENQASM 2.0;\ninclude "qelib1.inc";\nqreg q[1];\nopaque my_gate a;\n'
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            qasm_filename = os.path.join(tmp_dir, "custom.qasm")
+            with open(qasm_filename, "w") as qasm_file:
+                qasm_file.write(qasm_string)
+            with patch("builtins.open", wraps=open) as mock_open:
+                circuit = QuantumCircuit.from_qasm_file(qasm_filename)
+        self.assertEqual(
+            [call for call in mock_open.call_args_list if call[0][0] == qasm_filename],
+            [call(qasm_filename)],
+        )
+        self.assertEqual(circuit, QuantumCircuit.from_qasm_str(qasm_string))
+
     def assertEqualUnroll(self, basis, circuit, expected):
         """Compares the dags after unrolling to basis"""
         circuit_dag = circuit_to_dag(circuit)
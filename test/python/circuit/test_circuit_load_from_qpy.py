@@ -14,16 +14,21 @@
 """Test cases for the circuit qasm_file and qasm_string method."""
 
 import io
+import os
+import struct
+import tempfile
 
 import numpy as np
 
 from qiskit import QuantumCircuit, QuantumRegister, ClassicalRegister
 from qiskit.circuit.random import random_circuit
+from qiskit.circuit.library import EfficientSU2
 from qiskit.circuit.gate import Gate
 from qiskit.circuit.instruction import Instruction
 from qiskit.circuit.parameter import Parameter
 from qiskit.test import QiskitTestCase
-from qiskit.circuit.qpy_serialization import dump, load
+from qiskit.exceptions import QiskitError
+from qiskit.circuit.qpy_serialization import dump, load, QpyReader, QpyWriter
 
 
 class TestLoadFromQPY(QiskitTestCase):
@@ -261,3 +266,252 @@ class TestLoadFromQPY(QiskitTestCase):
         qpy_file.seek(0)
         new_circs = load(qpy_file)
         self.assertEqual(circuits, new_circs)
+
+    def test_shared_parameter_expression(self):
+        """Test that an expression used by many instructions is stored once."""
+        theta = Parameter("theta")
+        expression = 2 * theta + 1
+        qc = QuantumCircuit(10)
+        for qubit in range(10):
+            qc.rx(expression, qubit)
+            qc.rz(theta, qubit)
+        qpy_file = io.BytesIO()
+        dump(qpy_file, qc)
+        qpy_file.seek(0)
+        new_circ = load(qpy_file)[0]
+        self.assertEqual(qc, new_circ)
+        self.assertEqual(new_circ.parameters, qc.parameters)
+        new_expressions = {id(inst.params[0]) for inst, _, _ in new_circ.data if inst.name == "rx"}
+        self.assertEqual(len(new_expressions), 1)
+
+    def test_efficient_su2(self):
+        """Test serialization of a large parameterized circuit."""
+        qc = EfficientSU2(20, reps=3, entanglement="circular", insert_barriers=True)
+        qc = qc.decompose()
+        qpy_file = io.BytesIO()
+        dump(qpy_file, qc)
+        qpy_file.seek(0)
+        new_circ = load(qpy_file)[0]
+        self.assertEqual(qc, new_circ)
+
+    def test_parameter_global_phase(self):
+        """Test serialization of a circuit with a parameter as global phase."""
+        theta = Parameter("theta")
+        qc = QuantumCircuit(2, global_phase=theta)
+        qc.rx(theta, 0)
+        qc.cx(0, 1)
+        qpy_file = io.BytesIO()
+        dump(qpy_file, qc)
+        qpy_file.seek(0)
+        new_circ = load(qpy_file)[0]
+        self.assertEqual(qc, new_circ)
+        self.assertEqual(new_circ.global_phase, theta)
+        self.assertEqual(new_circ.parameters, qc.parameters)
+        self.assertEqual(
+            qc.bind_parameters({theta: 0.5}),
+            new_circ.bind_parameters({list(new_circ.parameters)[0]: 0.5}),
+        )
+
+    def test_parameter_expression_global_phase(self):
+        """Test random access to circuits with a parameter expression as global phase."""
+        theta = Parameter("theta")
+        phi = Parameter("phi")
+        first = QuantumCircuit(1, global_phase=2 * theta + phi, name="first")
+        first.rz(phi, 0)
+        second = QuantumCircuit(1, global_phase=0.25, name="second")
+        second.h(0)
+        qpy_file = io.BytesIO()
+        dump(qpy_file, [first, second])
+        qpy_file.seek(0)
+        new_circs = load(qpy_file)
+        self.assertEqual(first, new_circs[0])
+        self.assertEqual(new_circs[0].global_phase, 2 * theta + phi)
+        self.assertEqual(second, new_circs[1])
+        qpy_file.seek(0)
+        self.assertEqual(QpyReader(qpy_file)["second"], second)
+
+    def test_load_version_2(self):
+        """Test that QPY data of format version 2 can be loaded."""
+        qc = QuantumCircuit(2, name="v2", global_phase=0.25)
+        qc.rx(0.5, 0)
+        qc.cx(0, 1)
+        payload = io.BytesIO()
+        payload.write(struct.pack("!6sBBBBQ", b"QISKIT", 2, 0, 17, 0, 1))
+        payload.write(struct.pack("!HdIIQIQ", 2, 0.25, 2, 0, 4, 1, 2))
+        payload.write(b"v2")
+        payload.write(b"null")
+        payload.write(struct.pack("!1cIH", b"q", 2, 1))
+        payload.write(b"q")
+        payload.write(struct.pack("2I", 0, 1))
+        payload.write(struct.pack("!Q", 0))
+        payload.write(struct.pack("!IH6sH6s", 2, 6, b"RXGate", 6, b"CXGate"))
+        payload.write(struct.pack("!Q", 0))
+        payload.write(struct.pack("!IHII?Iq", 0, 1, 1, 0, False, 0, 0))
+        payload.write(struct.pack("!I", 0))
+        payload.write(b"f")
+        payload.write(struct.pack("!d", 0.5))
+        payload.write(struct.pack("!IHII?Iq", 1, 0, 2, 0, False, 0, 0))
+        payload.write(struct.pack("!2I", 0, 1))
+        payload.seek(0)
+        self.assertEqual(load(payload)[0], qc)
+        payload.seek(0)
+        self.assertEqual(QpyReader(payload)["v2"], qc)
+
+    def test_load_version_1(self):
+        """Test that QPY data of format version 1 can be loaded."""
+        qc = QuantumCircuit(2, name="v1")
+        qc.rx(0.5, 0)
+        qc.cx(0, 1)
+        payload = io.BytesIO()
+        payload.write(struct.pack("!6sBBBBQ", b"QISKIT", 1, 0, 17, 0, 1))
+        payload.write(struct.pack("!HdIIQIQ", 2, 0.0, 2, 0, 4, 1, 2))
+        payload.write(b"v1")
+        payload.write(b"null")
+        payload.write(struct.pack("!1cIH", b"q", 2, 1))
+        payload.write(b"q")
+        payload.write(struct.pack("2I", 0, 1))
+        payload.write(struct.pack("!Q", 0))
+        payload.write(struct.pack("!HHII?Hq", 6, 1, 1, 0, False, 0, 0))
+        payload.write(b"RXGate")
+        payload.write(struct.pack("!1cI", b"q", 0))
+        payload.write(struct.pack("!1cQ", b"f", 8))
+        payload.write(struct.pack("<d", 0.5))
+        payload.write(struct.pack("!HHII?Hq", 6, 0, 2, 0, False, 0, 0))
+        payload.write(b"CXGate")
+        payload.write(struct.pack("!1cI", b"q", 0))
+        payload.write(struct.pack("!1cI", b"q", 1))
+        payload.seek(0)
+        new_circ = load(payload)[0]
+        self.assertEqual(qc, new_circ)
+        payload.seek(0)
+        self.assertEqual(QpyReader(payload)["v1"], qc)
+
+
+class TestQpyReader(QiskitTestCase):
+    """Test random access to QPY data with QpyReader."""
+
+    def setUp(self):
+        super().setUp()
+        self.circuits = []
+        for i in range(10):
+            circuit = random_circuit(5, 5, measure=True, conditional=True, seed=42 + i)
+            circuit.name = "circuit_%s" % i
+            self.circuits.append(circuit)
+        theta = Parameter("theta")
+        custom = QuantumCircuit(2, name="custom")
+        custom.rx(theta, 0)
+        custom.append(Gate("opaque", 2, []), [0, 1])
+        custom.append(Instruction("my_instruction", 1, 0, []), [1])
+        custom.rz(theta + 1, 1)
+        custom.unitary(np.eye(2), [0])
+        self.circuits.insert(3, custom)
+
+    def test_index(self):
+        """Test random access using the index."""
+        qpy_file = io.BytesIO()
+        dump(qpy_file, self.circuits)
+        qpy_file.seek(0)
+        reader = QpyReader(qpy_file)
+        self.assertEqual(len(reader), len(self.circuits))
+        self.assertEqual(reader.names, [circuit.name for circuit in self.circuits])
+        self.assertEqual(reader[9], self.circuits[9])
+        self.assertEqual(reader[-1], self.circuits[-1])
+        self.assertEqual(reader[3], self.circuits[3])
+        self.assertEqual(reader["circuit_5"], self.circuits[6])
+        self.assertEqual(reader[2:5], self.circuits[2:5])
+        self.assertEqual(list(reader), self.circuits)
+
+    def test_without_index(self):
+        """Test random access to QPY data written without an index."""
+        qpy_file = io.BytesIO()
+        dump(qpy_file, self.circuits, index=False)
+        qpy_file.seek(0)
+        reader = QpyReader(qpy_file)
+        self.assertEqual(len(reader), len(self.circuits))
+        self.assertEqual(reader.names, [circuit.name for circuit in self.circuits])
+        self.assertEqual(reader[8], self.circuits[8])
+        self.assertEqual(reader["custom"], self.circuits[3])
+
+    def test_load_ignores_index(self):
+        """Test that load reads the same circuits with and without an index."""
+        with_index = io.BytesIO()
+        dump(with_index, self.circuits)
+        without_index = io.BytesIO()
+        dump(without_index, self.circuits, index=False)
+        self.assertTrue(with_index.getvalue().startswith(without_index.getvalue()))
+        with_index.seek(0)
+        self.assertEqual(load(with_index), self.circuits)
+
+    def test_data_not_at_file_start(self):
+        """Test reading QPY data which does not start at the beginning of the file."""
+        qpy_file = io.BytesIO()
+        qpy_file.write(b"prefix")
+        dump(qpy_file, self.circuits)
+        qpy_file.seek(len(b"prefix"))
+        reader = QpyReader(qpy_file)
+        self.assertEqual(reader[7], self.circuits[7])
+
+    def test_missing_name(self):
+        """Test that accessing a circuit by an unknown name raises."""
+        qpy_file = io.BytesIO()
+        dump(qpy_file, self.circuits)
+        qpy_file.seek(0)
+        reader = QpyReader(qpy_file)
+        with self.assertRaises(KeyError):
+            reader["not_a_circuit"]  # pylint: disable=pointless-statement
+
+    def test_file_path(self):
+        """Test reading a QPY file from its path, with and without memory mapping."""
+        file_descriptor, path = tempfile.mkstemp(suffix=".qpy")
+        self.addCleanup(os.remove, path)
+        with os.fdopen(file_descriptor, "wb") as fd:
+            dump(fd, self.circuits)
+        for use_mmap in (True, False):
+            with self.subTest(use_mmap=use_mmap):
+                with QpyReader(path, use_mmap=use_mmap) as reader:
+                    self.assertEqual(len(reader), len(self.circuits))
+                    self.assertEqual(reader[10], self.circuits[10])
+                    self.assertEqual(reader["custom"], self.circuits[3])
+
+
+class TestQpyWriter(QiskitTestCase):
+    """Test incremental writing of QPY data with QpyWriter."""
+
+    def setUp(self):
+        super().setUp()
+        self.circuits = [
+            random_circuit(5, 5, measure=True, conditional=True, seed=42 + i) for i in range(5)
+        ]
+
+    def test_same_as_dump(self):
+        """Test that writing circuits one at a time gives the same data as dump."""
+        for index in (True, False):
+            with self.subTest(index=index):
+                expected = io.BytesIO()
+                dump(expected, self.circuits, index=index)
+                qpy_file = io.BytesIO()
+                with QpyWriter(qpy_file, index=index) as writer:
+                    writer.write(self.circuits[0])
+                    writer.write(self.circuits[1:])
+                    self.assertEqual(writer.num_circuits, len(self.circuits))
+                self.assertEqual(qpy_file.getvalue(), expected.getvalue())
+                qpy_file.seek(0)
+                self.assertEqual(load(qpy_file), self.circuits)
+
+    def test_file_path(self):
+        """Test writing a QPY file by its path and reading it back with QpyReader."""
+        file_descriptor, path = tempfile.mkstemp(suffix=".qpy")
+        os.close(file_descriptor)
+        self.addCleanup(os.remove, path)
+        with QpyWriter(path) as writer:
+            for circuit in self.circuits:
+                writer.write(circuit)
+        with QpyReader(path) as reader:
+            self.assertEqual(list(reader), self.circuits)
+
+    def test_write_after_close(self):
+        """Test that writing to a closed writer raises."""
+        writer = QpyWriter(io.BytesIO())
+        writer.close()
+        with self.assertRaises(QiskitError):
+            writer.write(self.circuits[0])
@@ -13,15 +13,18 @@
 
 """Test Qiskit's QuantumCircuit class."""
 
+from copy import deepcopy
+import pickle
+
 from ddt import ddt, data
 import numpy as np
 from qiskit import BasicAer
 from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
 from qiskit import execute
-from qiskit.circuit import Gate, Instruction, Parameter
+from qiskit.circuit import Gate, Instruction, Parameter, Measure
 from qiskit.circuit.exceptions import CircuitError
 from qiskit.test import QiskitTestCase
-from qiskit.circuit.library.standard_gates import SGate
+from qiskit.circuit.library.standard_gates import SGate, HGate, CXGate, RYGate, RZGate
 from qiskit.quantum_info import Operator
 
 
@@ -363,6 +366,93 @@ class TestCircuitOperations(QiskitTestCase):
         self.assertEqual(len(qc.cregs), 1)
         self.assertEqual(len(copied.cregs), 2)
 
+    def test_copy_shares_instructions_until_accessed(self):
+        """Test copy shares the instructions and copies them once they are handed out."""
+        qc = QuantumCircuit(2)
+        qc.h(0)
+        qc.cx(0, 1)
+        copied = qc.copy()
+
+        self.assertIs(qc._data[0][0], copied._data[0][0])
+
+        copied.data[0][0].label = "copied"
+        self.assertIsNone(qc.data[0][0].label)
+        self.assertIsNot(qc._data[1][0], copied._data[1][0])
+
+    def test_copy_shares_instruction_appended_twice(self):
+        """Test an instruction appearing twice in the circuit is copied to a single instance."""
+        gate = SGate()
+        qc = QuantumCircuit(2)
+        qc.append(gate, [0])
+        qc.append(gate, [1])
+        copied = qc.copy()
+
+        self.assertIs(copied.data[0][0], copied.data[1][0])
+        self.assertIsNot(copied.data[0][0], gate)
+        self.assertIs(qc.data[0][0], qc.data[1][0])
+        self.assertIs(qc.data[0][0], gate)
+
+    def test_c_if_after_copy_only_conditions_original(self):
+        """Test conditioning an instruction set after copying does not condition the copy."""
+        qc = QuantumCircuit(1, 1)
+        instructions = qc.x(0)
+        copied = qc.copy()
+        instructions.c_if(qc.cregs[0], 1)
+
+        self.assertEqual(qc.data[0][0].condition, (qc.cregs[0], 1))
+        self.assertIsNone(copied.data[0][0].condition)
+
+    def test_c_if_after_copy_and_data_access(self):
+        """Test an instruction set still conditions its circuit once the data was handed out."""
+        qc = QuantumCircuit(1, 1)
+        instructions = qc.x(0)
+        copied = qc.copy()
+        _ = qc.data[0]
+        instructions.c_if(qc.cregs[0], 1)
+
+        self.assertEqual(qc.data[0][0].condition, (qc.cregs[0], 1))
+        self.assertIsNone(copied.data[0][0].condition)
+
+    def test_c_if_after_copy_of_copy(self):
+        """Test conditioning instructions does not leak into copies of copies."""
+        qc = QuantumCircuit(1, 1)
+        instructions = qc.x(0)
+        copied = qc.copy()
+        copied_twice = copied.copy()
+        instructions.c_if(qc.cregs[0], 1)
+
+        self.assertIsNone(copied.data[0][0].condition)
+        self.assertIsNone(copied_twice.data[0][0].condition)
+
+    def test_pickle_and_deepcopy_copied_circuit(self):
+        """Test pickling and deep copying a circuit sharing instructions with its copy."""
+        theta = Parameter("theta")
+        qc = QuantumCircuit(1)
+        qc.rx(theta, 0)
+        copied = qc.copy()
+
+        for circuit in (qc, copied):
+            for other in (pickle.loads(pickle.dumps(circuit)), deepcopy(circuit)):
+                self.assertEqual(other, circuit)
+                other.assign_parameters({theta: 0.5}, inplace=True)
+                self.assertEqual(float(other.data[0][0].params[0]), 0.5)
+                self.assertEqual(circuit.data[0][0].params, [theta])
+
+    def test_assign_parameters_copies_only_rebound_instructions(self):
+        """Test binding a copy only copies the instructions depending on the parameters."""
+        theta = Parameter("theta")
+        qc = QuantumCircuit(1)
+        qc.h(0)
+        qc.rx(theta, 0)
+        bound = qc.assign_parameters({theta: 0.5})
+
+        self.assertIs(qc._data[0][0], bound._data[0][0])
+        self.assertIsNot(qc._data[1][0], bound._data[1][0])
+        self.assertEqual(qc.data[1][0].params, [theta])
+        self.assertEqual(float(bound.data[1][0].params[0]), 0.5)
+        self.assertEqual(len(qc._parameter_table[theta]), 1)
+        self.assertIs(qc._parameter_table[theta][0][0], qc._data[1][0])
+
     def test_measure_active(self):
         """Test measure_active
         Applies measurements only to non-idle qubits. Creates a ClassicalRegister of size equal to
@@ -858,3 +948,62 @@ class TestCircuitBuilding(QiskitTestCase):
 
     def test_append_dimension_mismatch(self):
         """Test appending to incompatible wires."""
+
+    def test_extend_trusted(self):
+        """Test extend_trusted gives the same circuit as append."""
+        qr = QuantumRegister(3, "q")
+        cr = ClassicalRegister(2, "c")
+        theta = Parameter("θ")
+
+        expected = QuantumCircuit(qr, cr)
+        expected.h(qr[0])
+        expected.cx(qr[0], qr[2])
+        expected.rz(theta, qr[1])
+        expected.measure(qr[2], cr[1])
+
+        circuit = QuantumCircuit(qr, cr)
+        circuit.extend_trusted(
+            [
+                (HGate(), [0], []),
+                (CXGate(), [0, 2], []),
+                (RZGate(theta), [1], []),
+                (Measure(), [2], [1]),
+            ]
+        )
+
+        self.assertEqual(circuit, expected)
+        self.assertEqual(circuit.parameters, {theta})
+        self.assertEqual(
+            circuit.bind_parameters({theta: 0.5}), expected.bind_parameters({theta: 0.5})
+        )
+
+    def test_extend_trusted_parameter_table(self):
+        """Test extend_trusted updates the parameter table for shared parameters."""
+        theta = Parameter("θ")
+        phi = Parameter("φ")
+        gate = RZGate(theta)
+
+        circuit = QuantumCircuit(2)
+        circuit.rx(theta, 0)
+        circuit.extend_trusted([(gate, [0], []), (gate, [1], []), (RYGate(theta + phi), [1], [])])
+
+        self.assertEqual(len(circuit._parameter_table[theta]), 3)
+        self.assertEqual(len(circuit._parameter_table[phi]), 1)
+        self.assertEqual(circuit.parameters, {phi, theta})
+
+    def test_extend_trusted_name_conflict(self):
+        """Test extend_trusted raises and appends nothing on a parameter name conflict."""
+        circuit = QuantumCircuit(1)
+        circuit.rx(Parameter("a"), 0)
+
+        with self.assertRaises(CircuitError):
+            circuit.extend_trusted([(HGate(), [0], []), (RZGate(Parameter("a")), [0], [])])
+        self.assertEqual(len(circuit), 1)
+
+    def test_extend_trusted_index_out_of_range(self):
+        """Test extend_trusted raises and appends nothing on an invalid qubit index."""
+        circuit = QuantumCircuit(2)
+
+        with self.assertRaises(IndexError):
+            circuit.extend_trusted([(HGate(), [0], []), (CXGate(), [0, 2], [])])
+        self.assertEqual(len(circuit), 0)
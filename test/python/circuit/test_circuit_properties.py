@@ -12,11 +12,14 @@
 
 """Test Qiskit's inverse gate operation."""
 
+import copy
+import pickle
 import unittest
+from unittest.mock import patch
 import numpy as np
 from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit, pulse
-from qiskit.circuit import Clbit
-from qiskit.circuit.library import RXGate, RYGate
+from qiskit.circuit import Clbit, Parameter, structuralhash
+from qiskit.circuit.library import RealAmplitudes, RXGate, RYGate, XGate
 from qiskit.test import QiskitTestCase
 from qiskit.circuit.exceptions import CircuitError
 from qiskit.extensions.simulator import Snapshot
@@ -731,6 +734,234 @@ class TestCircuitProperties(QiskitTestCase):
 
         self.assertEqual(qc1.metadata["a"], 0)
 
+    def test_metrics_updated_on_append(self):
+        """Test the circuit metrics are updated when instructions are appended after a query."""
+        qr = QuantumRegister(3, "q")
+        cr = ClassicalRegister(2, "c")
+        circ = QuantumCircuit(qr, cr)
+        circ.h(0)
+        self.assertEqual(circ.depth(), 1)
+        self.assertEqual(circ.size(), 1)
+        self.assertEqual(circ.num_unitary_factors(), 3)
+
+        circ.cx(0, 1)
+        circ.barrier()
+        circ.x(2).c_if(cr, 1)
+        self.assertEqual(circ.depth(), 3)
+        self.assertEqual(circ.size(), 3)
+        self.assertEqual(circ.count_ops(), {"h": 1, "cx": 1, "barrier": 1, "x": 1})
+        self.assertEqual(circ.num_nonlocal_gates(), 1)
+        self.assertEqual(circ.num_unitary_factors(), 2)
+        self.assertEqual(circ.num_connected_components(), 2)
+
+        circ.add_register(QuantumRegister(1, "r"))
+        self.assertEqual(circ.num_unitary_factors(), 3)
+
+    def test_metrics_updated_on_c_if(self):
+        """Test conditioning an instruction after a query updates the circuit depth."""
+        qr = QuantumRegister(2, "q")
+        cr = ClassicalRegister(2, "c")
+        circ = QuantumCircuit(qr, cr)
+        circ.measure(0, 0)
+        instructions = circ.x(1)
+        self.assertEqual(circ.depth(), 1)
+
+        instructions.c_if(cr, 1)
+        self.assertEqual(circ.depth(), 2)
+        self.assertEqual(circ.num_connected_components(), 1)
+
+    def test_metrics_updated_on_data_mutation(self):
+        """Test the circuit metrics follow modifications of the circuit data."""
+        circ = QuantumCircuit(2)
+        circ.h(0)
+        circ.cx(0, 1)
+        circ.h(1)
+        self.assertEqual(circ.depth(), 3)
+        self.assertEqual(circ.num_nonlocal_gates(), 1)
+
+        del circ.data[1]
+        self.assertEqual(circ.depth(), 1)
+        self.assertEqual(circ.num_nonlocal_gates(), 0)
+        self.assertEqual(circ.num_unitary_factors(), 2)
+
+        circ.data[0] = (RXGate(0.1), [1], [])
+        self.assertEqual(circ.depth(), 2)
+        self.assertEqual(circ.count_ops(), {"rx": 1, "h": 1})
+
+        circ.data = [(RYGate(0.2), [0], [])]
+        self.assertEqual(circ.depth(), 1)
+        self.assertEqual(circ.count_ops(), {"ry": 1})
+
+    def test_metrics_updated_on_instruction_mutation(self):
+        """Test the circuit metrics follow modifications of the appended instructions."""
+        qr = QuantumRegister(2, "q")
+        cr = ClassicalRegister(1, "c")
+        circ = QuantumCircuit(qr, cr)
+        instructions = circ.x(0)
+        circ.h(1)
+        self.assertEqual(circ.num_connected_components(), 3)
+
+        instructions.c_if(cr, 1)
+        self.assertEqual(circ.num_connected_components(), 2)
+
+        self.assertEqual(circ.count_ops(), {"x": 1, "h": 1})
+        circ.data[1] = (XGate(), [qr[0]], [])
+        self.assertEqual(circ.count_ops(), {"x": 2})
+        self.assertEqual(circ.depth(), 2)
+
+        copied = circ.copy()
+        self.assertEqual(copied.depth(), 2)
+        instruction, _, _ = circ.data[0]
+        instruction.name = "renamed"
+        self.assertEqual(circ.count_ops(), {"renamed": 1, "x": 1})
+        self.assertEqual(copied.count_ops(), {"x": 2})
+
+    def test_metrics_of_copy(self):
+        """Test the metrics of a circuit and its copy are updated independently."""
+        circ = QuantumCircuit(2)
+        circ.h(0)
+        self.assertEqual(circ.depth(), 1)
+
+        copied = circ.copy()
+        copied.cx(0, 1)
+        circ.h(1)
+        self.assertEqual(copied.depth(), 2)
+        self.assertEqual(copied.count_ops(), {"h": 1, "cx": 1})
+        self.assertEqual(circ.depth(), 1)
+        self.assertEqual(circ.count_ops(), {"h": 2})
+
+    def test_structural_hash_equal_circuits(self):
+        """Test equal circuits with different names have the same structural hash."""
+        circ1 = QuantumCircuit(2, 1, name="first")
+        circ1.h(0)
+        circ1.cx(0, 1)
+        circ1.measure(1, 0)
+        circ2 = QuantumCircuit(2, 1, name="second")
+        circ2.h(0)
+        circ2.cx(0, 1)
+        circ2.measure(1, 0)
+        self.assertEqual(circ1.structural_hash(), circ2.structural_hash())
+
+        circ3 = QuantumCircuit(2, 1)
+        circ3.h(0)
+        circ3.cx(1, 0)
+        circ3.measure(1, 0)
+        self.assertNotEqual(circ1.structural_hash(), circ3.structural_hash())
+
+    def test_structural_hash_parameters(self):
+        """Test the structural hash with and without parameter values."""
+        circ1 = QuantumCircuit(1)
+        circ1.rx(0.1, 0)
+        circ2 = QuantumCircuit(1)
+        circ2.rx(0.2, 0)
+        self.assertNotEqual(circ1.structural_hash(), circ2.structural_hash())
+        self.assertEqual(
+            circ1.structural_hash(parameters=False), circ2.structural_hash(parameters=False)
+        )
+        self.assertNotEqual(RXGate(0.1).structural_hash(), RXGate(0.2).structural_hash())
+        self.assertEqual(
+            RXGate(0.1).structural_hash(parameters=False),
+            RXGate(0.2).structural_hash(parameters=False),
+        )
+
+    def test_structural_hash_updated(self):
+        """Test the structural hash is updated when appending and binding parameters."""
+        theta = Parameter("theta")
+        circ = QuantumCircuit(1)
+        circ.rx(theta, 0)
+        hash_unbound = circ.structural_hash()
+        structure = circ.structural_hash(parameters=False)
+
+        circ.assign_parameters({theta: 0.1}, inplace=True)
+        self.assertNotEqual(circ.structural_hash(), hash_unbound)
+        self.assertEqual(circ.structural_hash(parameters=False), structure)
+
+        expected = QuantumCircuit(1)
+        expected.rx(0.1, 0)
+        expected.h(0)
+        circ.h(0)
+        self.assertEqual(circ.structural_hash(), expected.structural_hash())
+        self.assertEqual(circ.copy().structural_hash(), expected.structural_hash())
+
+    def test_structural_hash_instruction_mutation(self):
+        """Test the structural hash follows modifications of the circuit."""
+        cr = ClassicalRegister(1, "c")
+        circ = QuantumCircuit(1)
+        instructions = circ.rx(0.1, 0)
+        hashes = {circ.structural_hash()}
+
+        circ.data[0] = (RXGate(0.2), [0], [])
+        hashes.add(circ.structural_hash())
+        circ.add_register(cr)
+        hashes.add(circ.structural_hash())
+        circ.data[0][0].c_if(cr, 1)
+        hashes.add(circ.structural_hash())
+        instructions = circ.x(0)
+        hashes.add(circ.structural_hash())
+        instructions.c_if(cr, 0)
+        hashes.add(circ.structural_hash())
+        circ.global_phase = 1
+        hashes.add(circ.structural_hash())
+
+        self.assertEqual(len(hashes), 7)
+        self.assertEqual(circ.structural_hash(), pickle.loads(pickle.dumps(circ)).structural_hash())
+
+    def test_structural_hash_cached(self):
+        """Test the structural hash is only computed again after the circuit changed."""
+        circ = QuantumCircuit(2)
+        circ.h(0)
+        circ.cx(0, 1)
+        with patch(
+            "qiskit.circuit.structuralhash.circuit_hash", wraps=structuralhash.circuit_hash
+        ) as circuit_hash:
+            expected = circ.structural_hash()
+            self.assertEqual(circ.structural_hash(), expected)
+            self.assertEqual(circ.copy().structural_hash(), expected)
+            self.assertEqual(circuit_hash.call_count, 1)
+
+            circ.h(1)
+            self.assertNotEqual(circ.structural_hash(), expected)
+            self.assertEqual(circuit_hash.call_count, 2)
+
+            # computing the metrics keeps the hash, and the hash does not compute the metrics
+            circ.depth()
+            circ.structural_hash()
+            self.assertEqual(circuit_hash.call_count, 2)
+            circ.data[0] = (XGate(), [circ.qubits[0]], [])
+            with patch("qiskit.circuit.circuitmetrics.CircuitMetrics._add") as add:
+                circ.structural_hash()
+                add.assert_not_called()
+            self.assertEqual(circuit_hash.call_count, 3)
+
+    def test_structural_hash_parameter_identity(self):
+        """Test distinct parameters with equal names give different structural hashes."""
+        circ1 = QuantumCircuit(1)
+        circ1.rx(Parameter("theta"), 0)
+        circ2 = QuantumCircuit(1)
+        circ2.rx(Parameter("theta"), 0)
+        self.assertNotEqual(circ1.structural_hash(), circ2.structural_hash())
+        self.assertEqual(
+            circ1.structural_hash(parameters=False), circ2.structural_hash(parameters=False)
+        )
+        self.assertEqual(circ1.copy().structural_hash(), circ1.structural_hash())
+
+    def test_structural_hash_blueprint_circuit(self):
+        """Test the structural hash of a circuit which is built on demand."""
+        circ = RealAmplitudes(2, reps=1)
+        expected = QuantumCircuit(*circ.qregs)
+        expected.compose(RealAmplitudes(2, reps=1), inplace=True)
+        expected.assign_parameters(circ.ordered_parameters, inplace=True)
+        self.assertEqual(circ.structural_hash(), expected.structural_hash())
+
+    def test_structural_hash_pickle_deepcopy(self):
+        """Test circuits can be pickled and deep copied after computing their hash."""
+        circ = QuantumCircuit(2)
+        circ.h(0)
+        circ.cx(0, 1)
+        expected = circ.structural_hash()
+        self.assertEqual(pickle.loads(pickle.dumps(circ)).structural_hash(), expected)
+        self.assertEqual(copy.deepcopy(circ).structural_hash(), expected)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -12,6 +12,7 @@
 
 """Test Qiskit's QuantumCircuit class."""
 
+import io
 from math import pi
 
 from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
@@ -229,3 +230,55 @@ nG0(pi,pi/2) q[0],r[0];\n"""
         qc.ch(0, 1, ctrl_state=0)
         qasm_str = qc.qasm()
         self.assertEqual(Operator(qc), Operator(QuantumCircuit.from_qasm_str(qasm_str)))
+
+    def test_write_qasm_matches_qasm(self):
+        """Test write_qasm() streams the same program as qasm() without composite gates."""
+        qr = QuantumRegister(2, "qr")
+        cr = ClassicalRegister(2, "cr")
+        qc = QuantumCircuit(qr, cr)
+        qc.h(0)
+        qc.cx(0, 1)
+        qc.rz(pi / 4, 1)
+        qc.barrier()
+        qc.measure([0, 1], [0, 1])
+
+        stream = io.StringIO()
+        qc.write_qasm(stream)
+        self.assertEqual(stream.getvalue(), qc.qasm())
+
+    def test_write_qasm_with_composite_circuit(self):
+        """Test write_qasm() writes each composite definition once, before its first use."""
+        composite_circ = QuantumCircuit(2, name="composite_circ")
+        composite_circ.h(0)
+        composite_circ.x(1)
+        composite_circ.cx(0, 1)
+        composite_circ_instr = composite_circ.to_instruction()
+
+        qr = QuantumRegister(2, "qr")
+        qc = QuantumCircuit(qr)
+        qc.h(0)
+        qc.append(composite_circ_instr, [0, 1])
+        qc.append(composite_circ_instr, [1, 0])
+
+        expected_qasm = """OPENQASM 2.0;
+include "qelib1.inc";
+qreg qr[2];
+h qr[0];
+gate composite_circ q0,q1 { h q0; x q1; cx q0,q1; }
+composite_circ qr[0],qr[1];
+composite_circ qr[1],qr[0];\n"""
+        stream = io.StringIO()
+        qc.write_qasm(stream)
+        self.assertEqual(stream.getvalue(), expected_qasm)
+
+        qc_from_qasm = QuantumCircuit.from_qasm_str(stream.getvalue())
+        self.assertEqual(len(qc_from_qasm.data), 3)
+
+    def test_write_qasm_unbound_circuit_raises(self):
+        """Test write_qasm() with unbound parameters raises before writing."""
+        qc = QuantumCircuit(1)
+        qc.rz(Parameter("θ"), 0)
+        stream = io.StringIO()
+        with self.assertRaises(QasmError):
+            qc.write_qasm(stream)
+        self.assertEqual(stream.getvalue(), "")
@@ -1162,6 +1162,55 @@ class TestControlledGate(QiskitTestCase):
         target = _compute_control_matrix(base_mat, num_ctrl_qubits)
         self.assertEqual(Operator(ctrl_qc), Operator(target))
 
+    def test_control_equal_gates_reuses_definition(self):
+        """Test controlling equal gates gives equal but independent definitions."""
+        circ = QuantumCircuit(2)
+        circ.h(0)
+        circ.cry(0.3, 0, 1)
+        cgate1 = circ.to_gate().control(2)
+        cgate2 = circ.to_gate().control(2)
+
+        self.assertEqual(cgate1.definition, cgate2.definition)
+        self.assertIsNot(cgate1.definition, cgate2.definition)
+
+        open_cgate = circ.to_gate().control(2, ctrl_state=1)
+        self.assertEqual(open_cgate.ctrl_state, 1)
+        target = _compute_control_matrix(Operator(circ).data, 2, ctrl_state=1)
+        self.assertEqual(Operator(open_cgate), Operator(target))
+
+        cgate1.definition.x(0)
+        cgate3 = circ.to_gate().control(2)
+        self.assertEqual(cgate3.definition, cgate2.definition)
+
+    def test_control_gate_with_custom_definition(self):
+        """Test controlling a library gate with a custom definition does not reuse the
+        definition of the controlled library gate."""
+        definition = QuantumCircuit(1)
+        definition.h(0)
+        custom_gate = SXGate()
+        custom_gate.definition = definition
+
+        custom_cgate = custom_gate.control(2)
+        cgate = SXGate().control(2)
+        self.assertEqual(Operator(custom_cgate), Operator(HGate().control(2)))
+        self.assertEqual(
+            Operator(cgate), Operator(_compute_control_matrix(SXGate().to_matrix(), 2))
+        )
+
+    def test_control_parameterized_gate_twice(self):
+        """Test controlling gates with different parameters gives different definitions."""
+        theta, phi = Parameter("θ"), Parameter("φ")
+        cgate1 = RXGate(theta).control(3)
+        cgate2 = RXGate(phi).control(3)
+        self.assertEqual(cgate1.definition.parameters, {theta})
+        self.assertEqual(cgate2.definition.parameters, {phi})
+
+        qc = QuantumCircuit(4)
+        qc.append(cgate1, range(4))
+        bound = qc.bind_parameters({theta: 0.4})
+        self.assertEqual(Operator(bound), Operator(RXGate(0.4).control(3)))
+        self.assertEqual(cgate1.definition.parameters, {theta})
+
 
 @ddt
 class TestOpenControlledToMatrix(QiskitTestCase):
@@ -187,6 +187,53 @@ class TestParameters(QiskitTestCase):
                 bqc_list = getattr(qc, assign_fun)(param_dict)
                 self.assertEqual(bqc_anonymous, bqc_list)
 
+    def test_bind_parameters_batch(self):
+        """Test binding many sets of values at once matches binding them one by one."""
+        phase = Parameter("phase")
+        x = Parameter("x")
+        v = ParameterVector("v", 3)
+        qc = QuantumCircuit(2, global_phase=phase)
+        qc.h(0)
+        qc.rx(2 * x + v[0], 0)
+        qc.cry(x, 0, 1)
+        qc.u(*v, 1)
+        qc.rz(numpy.pi * x, 1)
+        values = numpy.arange(3 * qc.num_parameters).reshape(3, qc.num_parameters) / 10
+
+        bound_circuits = qc.bind_parameters_batch(values)
+
+        self.assertEqual(len(bound_circuits), 3)
+        for bound, row in zip(bound_circuits, values):
+            self.assertIs(bound._data[0][0], qc._data[0][0])
+            self.assertEqual(bound, qc.bind_parameters(row))
+            self.assertEqual(len(bound.parameters), 0)
+        raise_if_parameter_table_invalid(qc)
+        self.assertEqual(qc.num_parameters, 5)
+
+    def test_bind_parameters_batch_rebinds_definitions(self):
+        """Test binding many sets of values also binds the definitions of the instructions."""
+        theta = Parameter("theta")
+        inner = QuantumCircuit(1)
+        inner.rz(theta, 0)
+        qc = QuantumCircuit(1)
+        qc.append(inner.to_gate(), [0])
+
+        bound_circuits = qc.bind_parameters_batch([[0.1], [0.2]])
+
+        for bound, value in zip(bound_circuits, [0.1, 0.2]):
+            self.assertEqual(bound.decompose(), qc.bind_parameters([value]).decompose())
+
+    def test_bind_parameters_batch_raises_on_shape_mismatch(self):
+        """Test binding many sets of values raises if the shape does not match."""
+        qc = QuantumCircuit(1)
+        qc.rx(Parameter("x"), 0)
+        qc.ry(Parameter("y"), 0)
+
+        with self.assertRaises(ValueError):
+            qc.bind_parameters_batch([[0.1], [0.2]])
+        with self.assertRaises(ValueError):
+            qc.bind_parameters_batch([0.1, 0.2])
+
     def test_parameter_order(self):
         """Test the parameters are sorted by name but parameter vector order takes precedence.
 
@@ -220,6 +267,42 @@ class TestParameters(QiskitTestCase):
 
         self.assertListEqual(expected_order, list(actual_order))
 
+    def test_parameter_order_is_updated_incrementally(self):
+        """Test the cached parameter order is updated when adding and removing parameters."""
+        x = ParameterVector("x", 12)
+        a, y = Parameter("a"), Parameter("y")
+
+        qc = QuantumCircuit(1)
+        for x_i in x[:6]:
+            qc.rx(x_i, 0)
+        self.assertListEqual(list(qc.parameters), x[:6])
+
+        # appended after the existing parameters
+        for x_i in x[6:]:
+            qc.rx(x_i, 0)
+        qc.ry(y, 0)
+        self.assertListEqual(list(qc.parameters), x[:] + [y])
+        self.assertEqual(qc.num_parameters, 13)
+
+        # inserted in between
+        qc.rz(a, 0)
+        self.assertListEqual(list(qc.parameters), [a] + x[:] + [y])
+
+        # removed
+        qc.assign_parameters({x[3]: 0.1, x[10]: 0.2}, inplace=True)
+        self.assertListEqual(list(qc.parameters), [a] + x[:3] + x[4:10] + [x[11], y])
+        self.assertEqual(qc.num_parameters, 12)
+
+    def test_parameter_order_includes_global_phase(self):
+        """Test parameters only present in the global phase are sorted with the others."""
+        x = ParameterVector("x", 3)
+        qc = QuantumCircuit(1, global_phase=x[1] + x[0])
+        qc.rx(x[2], 0)
+        qc.ry(x[0], 0)
+
+        self.assertListEqual(list(qc.parameters), x[:])
+        self.assertEqual(qc.num_parameters, 3)
+
     @data(True, False)
     def test_parameter_order_compose(self, front):
         """Test the parameter order is correctly maintained upon composing circuits."""
@@ -1207,6 +1290,59 @@ class TestParameterExpressions(QiskitTestCase):
         with self.assertRaisesRegex(TypeError, "unbound parameters"):
             int(bound_expr)
 
+    def test_compile(self):
+        """Verify a compiled expression evaluates like binding the expression."""
+        x = Parameter("x")
+        y = Parameter("y")
+        expr = 2 * x + y.sin()
+
+        function = expr.compile([y, x])
+        values = numpy.array([[0.1, 0.2], [0.3, 0.4], [0.5, 0.6]])
+
+        numpy.testing.assert_allclose(
+            function(values), [float(expr.bind({x: vx, y: vy})) for vy, vx in values]
+        )
+        self.assertAlmostEqual(function([0.1, 0.2]).item(), 0.4 + numpy.sin(0.1))
+        self.assertIs(expr.compile([y, x]), function)
+
+    def test_compile_default_order(self):
+        """Verify a compiled expression takes the parameters sorted by name by default."""
+        x = Parameter("x")
+        y = Parameter("y")
+        expr = y - x
+
+        self.assertAlmostEqual(expr.compile()([1, 3]).item(), 2)
+        self.assertAlmostEqual(x.compile()([1.5]).item(), 1.5)
+
+    def test_compile_complex(self):
+        """Verify a compiled expression evaluates to complex numbers if needed."""
+        x = Parameter("x")
+
+        numpy.testing.assert_allclose((1j * x).compile()([[1], [2]]), [1j, 2j])
+
+    def test_compile_complex_for_some_values(self):
+        """Verify a compiled real expression evaluates to complex numbers for some values."""
+        x = Parameter("x")
+
+        numpy.testing.assert_allclose(x.log().compile()([[-1], [1]]), [numpy.pi * 1j, 0])
+
+    def test_bind_float_to_complex_value(self):
+        """Verify binding a float giving a complex value matches the symbolic binding."""
+        x = Parameter("x")
+
+        self.assertEqual(complex(x.log().bind({x: -1.0})), numpy.pi * 1j)
+        self.assertAlmostEqual(
+            complex((1 / x).log().bind({x: -2.0})), -numpy.log(2) + numpy.pi * 1j
+        )
+
+    def test_raise_if_compiling_without_all_parameters(self):
+        """Verify we raise if compiling without all parameters of the expression."""
+        x = Parameter("x")
+        y = Parameter("y")
+
+        with self.assertRaisesRegex(CircuitError, "without values"):
+            (x + y).compile([x])
+
     def test_raise_if_sub_unknown_parameters(self):
         """Verify we raise if asked to sub a parameter not in self."""
         x = Parameter("x")
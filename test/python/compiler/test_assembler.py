@@ -22,6 +22,7 @@ import numpy as np
 import qiskit.pulse as pulse
 from qiskit.circuit import Instruction, Gate, Parameter, ParameterVector
 from qiskit.circuit import QuantumRegister, ClassicalRegister, QuantumCircuit
+from qiskit.circuit.library import RYGate
 from qiskit.compiler.assembler import assemble
 from qiskit.exceptions import QiskitError
 from qiskit.pulse import Schedule, Acquire, Play
@@ -456,6 +457,63 @@ class TestCircuitAssembler(QiskitTestCase):
         self.assertEqual(_qobj_inst_params(7, 0), [1, 0, 0])
         self.assertEqual(_qobj_inst_params(8, 0), [2, 1, 0])
 
+    def test_assemble_circuits_sharing_structure(self):
+        """Test circuits with the same structure are assembled as if they were assembled
+        separately."""
+        theta = Parameter("theta")
+        qreg = QuantumRegister(2, "q")
+        creg = ClassicalRegister(2, "c")
+        template = QuantumCircuit(qreg, creg)
+        template.rx(theta, 0)
+        template.append(Gate("rxtheta", 1, [theta], label="labeled"), [1])
+        template.measure(0, 0)
+        template.x(1).c_if(creg, 1)
+        template.measure(1, 1)
+
+        circuits = template.bind_parameters_batch([[0.1], [0.2], [0.3]])
+        circuits[2].data[1][0].label = "relabeled"
+        other = template.assign_parameters({theta: 0.4})
+        other.global_phase = 0.5
+        circuits.append(other)
+        # circuits with the same size but other instructions or bits
+        swapped = QuantumCircuit(qreg, creg)
+        swapped.rx(0.5, 1)
+        swapped.append(Gate("rxtheta", 1, [0.5], label="labeled"), [0])
+        swapped.measure(0, 0)
+        swapped.x(1).c_if(creg, 1)
+        swapped.measure(1, 1)
+        circuits.append(swapped)
+        renamed = template.assign_parameters({theta: 0.6})
+        renamed.data[0] = (RYGate(0.6), [0], [])
+        circuits.append(renamed)
+        circuits.append(circuits[0].copy())
+
+        qobj = assemble(circuits)
+        validate_qobj_against_schema(qobj)
+        self.assertEqual(len(qobj.experiments), len(circuits))
+        for experiment, circuit in zip(qobj.experiments, circuits):
+            expected = assemble(circuit).experiments[0]
+            self.assertEqual(experiment.to_dict(), expected.to_dict())
+
+    def test_assemble_many_circuits(self):
+        """Test the experiments of many circuits are assembled in order."""
+        circuits = []
+        for index in range(100):
+            circuit = QuantumCircuit(1, 1, name="circuit%d" % index)
+            circuit.rx(index / 100, 0)
+            circuit.measure(0, 0)
+            circuits.append(circuit)
+
+        qobj = assemble(circuits)
+        self.assertEqual(
+            [experiment.header.name for experiment in qobj.experiments],
+            [circuit.name for circuit in circuits],
+        )
+        self.assertEqual(
+            [experiment.instructions[0].params for experiment in qobj.experiments],
+            [[index / 100] for index in range(100)],
+        )
+
     def test_init_qubits_default(self):
         """Check that the init_qubits=None assemble option is passed on to the qobj."""
         qobj = assemble(self.circ)
@@ -1233,6 +1291,37 @@ class TestPulseAssembler(QiskitTestCase):
         # two user pulses and one measurement pulse should be contained
         self.assertEqual(len(qobj.config.pulse_library), 3)
 
+    def test_pulse_library_of_sweep(self):
+        """Test the pulse library of a sweep contains each distinct waveform once, as an array
+        sharing the samples of the waveform."""
+        ch_d0 = pulse.DriveChannel(0)
+        waveforms = [
+            gaussian(duration=20, amp=0.01 * (index + 1), sigma=5, name="sweep%d" % index)
+            for index in range(10)
+        ]
+        schedules = []
+        for index in range(50):
+            sched = Schedule()
+            sched += Play(waveforms[index % 10], ch_d0)
+            sched += Play(pulse.Waveform(waveforms[index % 10].samples.copy(), name="copy"), ch_d0)
+            schedules.append(sched)
+
+        qobj = assemble(
+            schedules,
+            qubit_lo_freq=self.default_qubit_lo_freq,
+            meas_lo_freq=self.default_meas_lo_freq,
+            **self.config,
+        )
+
+        self.assertEqual(len(qobj.config.pulse_library), 10)
+        library = {item.name: item.samples for item in qobj.config.pulse_library}
+        for index, experiment in enumerate(qobj.experiments):
+            names = {instruction.name for instruction in experiment.instructions}
+            self.assertEqual(len(names), 1)
+            samples = library[names.pop()]
+            self.assertIsInstance(samples, np.ndarray)
+            np.testing.assert_array_equal(samples, waveforms[index % 10].samples)
+
     def test_assemble_with_delay(self):
         """Test that delay instruction is not ignored in assembly."""
         delay_schedule = pulse.Delay(10, self.backend_config.drive(0))
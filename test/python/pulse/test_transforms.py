@@ -484,6 +484,23 @@ class TestCompressTransform(QiskitTestCase):
         self.assertEqual(len(original_pulse_ids), 6)
         self.assertEqual(len(compressed_pulse_ids), 2)
 
+    def test_sweep_with_tolerance(self):
+        """Test a sweep where waveforms are equal to earlier waveforms within their tolerance."""
+        schedules = []
+        for amp in np.linspace(0.1, 0.5, 100):
+            schedule = Schedule()
+            drive_channel = DriveChannel(0)
+            schedule += Play(Waveform([0.0, amp, amp], epsilon=1e-3), drive_channel)
+            schedule += Play(Waveform([0.0, amp + 1e-4, amp - 1e-4]), drive_channel)
+            schedule += Play(Gaussian(duration=25, sigma=4, amp=amp), drive_channel)
+            schedules.append(schedule)
+
+        compressed_schedule = transforms.compress_pulses(schedules)
+        original_pulse_ids = get_pulse_ids(schedules)
+        compressed_pulse_ids = get_pulse_ids(compressed_schedule)
+        self.assertEqual(len(original_pulse_ids), 300)
+        self.assertEqual(len(compressed_pulse_ids), 200)
+
 
 class TestAlignSequential(QiskitTestCase):
     """Test sequential alignment transform."""
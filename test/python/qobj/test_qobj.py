@@ -19,6 +19,7 @@ import jsonschema
 
 from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
 from qiskit.compiler import assemble
+from qiskit.exceptions import QiskitError
 
 from qiskit.qobj import (
     QasmQobj,
@@ -32,6 +33,7 @@ from qiskit.qobj import (
     QasmQobjInstruction,
     QasmQobjExperiment,
     QasmQobjConfig,
+    QasmQobjExperimentConfig,
     QasmExperimentCalibrations,
     GateCalibration,
 )
@@ -273,6 +275,77 @@ class TestQASMQobj(QiskitTestCase):
         }
         self.assertEqual(expected_dict, res)
 
+    def test_binary_round_trip(self):
+        """Test the binary representation of a QasmQobj."""
+        self.assertEqual(QasmQobj.from_binary(self.valid_qobj.to_binary()), self.valid_qobj)
+
+        qr = QuantumRegister(2)
+        cr = ClassicalRegister(2)
+        circuit = QuantumCircuit(qr, cr)
+        circuit.h(qr[0])
+        circuit.measure(qr[0], cr[0])
+        circuit.x(qr[1]).c_if(cr, 1)
+        circuit.snapshot("final")
+        circuit.measure(qr, cr)
+        qobj = assemble([circuit, circuit.reverse_ops()], shots=100, memory=True)
+        self.assertEqual(QasmQobj.from_binary(qobj.to_binary()), qobj)
+
+    def test_binary_round_trip_calibrations(self):
+        """Test the binary representation of a QasmQobj with calibrations and a pulse library."""
+        qobj = QasmQobj(
+            qobj_id="12345",
+            header=QobjHeader(backend_name="test"),
+            config=QasmQobjConfig(
+                shots=1024,
+                memory_slots=2,
+                pulse_library=[PulseLibraryItem(name="test", samples=[1j, 0.5 + 0.5j])],
+            ),
+            experiments=[
+                QasmQobjExperiment(
+                    instructions=[QasmQobjInstruction(name="u1", qubits=[1], params=[0.4])],
+                    config=QasmQobjExperimentConfig(
+                        calibrations=QasmExperimentCalibrations(
+                            gates=[
+                                GateCalibration(
+                                    name="u1",
+                                    qubits=[1],
+                                    params=[0.4],
+                                    instructions=[PulseQobjInstruction(name="test", t0=0, ch="d1")],
+                                )
+                            ]
+                        )
+                    ),
+                )
+            ],
+        )
+        self.assertEqual(QasmQobj.from_binary(qobj.to_binary()), qobj)
+
+    def test_from_binary_invalid(self):
+        """Test an invalid payload or the payload of another qobj type is rejected."""
+        with self.assertRaises(QiskitError):
+            QasmQobj.from_binary(b"not a qobj")
+        pulse_qobj = PulseQobj(
+            qobj_id="1",
+            config=PulseQobjConfig(
+                meas_level=1,
+                meas_return="avg",
+                pulse_library=[],
+                qubit_lo_freq=[4.9],
+                meas_lo_freq=[6.9],
+            ),
+            experiments=[],
+        )
+        with self.assertRaises(QiskitError):
+            QasmQobj.from_binary(pulse_qobj.to_binary())
+
+    def test_from_binary_truncated(self):
+        """Test a truncated payload raises a QiskitError."""
+        data = self.valid_qobj.to_binary()
+        for size in (len(data) - 10, len(data) - 1, 8, 12):
+            with self.subTest(size=size):
+                with self.assertRaises(QiskitError):
+                    QasmQobj.from_binary(data[:size])
+
 
 class TestPulseQobj(QiskitTestCase):
     """Tests for PulseQobj."""
@@ -459,6 +532,10 @@ class TestPulseQobj(QiskitTestCase):
             with self.subTest(msg=str(qobj_class)):
                 self.assertEqual(qobj_item.to_dict(), expected_dict)
 
+    def test_binary_round_trip(self):
+        """Test the binary representation of a PulseQobj."""
+        self.assertEqual(PulseQobj.from_binary(self.valid_qobj.to_binary()), self.valid_qobj)
+
 
 def _nop():
     pass
@@ -0,0 +1,71 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+# pylint: disable=missing-class-docstring,missing-function-docstring
+
+"""Test CountsArray class."""
+
+import unittest
+
+from qiskit import exceptions
+from qiskit.result import Counts, CountsArray
+from qiskit.result import postprocess
+
+
+class TestCountsArray(unittest.TestCase):
+    def test_bin_outcomes_match_counts(self):
+        raw_counts = {"0x0": 4, "0x2": 10, "0x9": 3}
+        creg_sizes = [["c0", 2], ["c0", 1], ["c1", 1]]
+        counts_array = CountsArray.from_counts(raw_counts, memory_slots=4, creg_sizes=creg_sizes)
+        expected = Counts(raw_counts, creg_sizes=creg_sizes, memory_slots=4)
+        self.assertEqual(counts_array.bin_outcomes(), expected)
+
+    def test_marginalize(self):
+        raw_counts = {"0x0": 4, "0x1": 7, "0x2": 10, "0x6": 5, "0x9": 11, "0xD": 9, "0xE": 8}
+        counts_array = CountsArray.from_counts(raw_counts, memory_slots=4)
+        marginal = counts_array.marginalize([1, 0])
+        self.assertEqual(marginal.bin_outcomes(), {"00": 4, "01": 27, "10": 23})
+        self.assertEqual(marginal.hex_outcomes(), {"0x0": 4, "0x1": 27, "0x2": 23})
+        self.assertEqual(marginal.shots(), counts_array.shots())
+
+    def test_marginalize_wide_outcomes(self):
+        raw_counts = {2 ** 70 + 5: 3, 5: 2}
+        counts_array = CountsArray.from_counts(raw_counts, memory_slots=72)
+        self.assertEqual(counts_array.marginalize([0, 2, 70]).int_outcomes(), {7: 3, 3: 2})
+
+    def test_marginalize_invalid_indices(self):
+        counts_array = CountsArray.from_counts({"0x1": 3}, memory_slots=2)
+        with self.assertRaises(exceptions.QiskitError):
+            counts_array.marginalize([2])
+
+    def test_aggregate(self):
+        first = CountsArray.from_counts({"00": 1, "11": 2})
+        second = CountsArray.from_counts({"11": 3, "01": 4})
+        total = CountsArray.aggregate([first, second])
+        self.assertEqual(total.bin_outcomes(), {"00": 1, "11": 5, "01": 4})
+
+    def test_dit_strings_raise(self):
+        with self.assertRaises(exceptions.QiskitError):
+            CountsArray.from_counts({"02": 1, "12": 3})
+
+    def test_format_many_counts(self):
+        header = {"memory_slots": 6, "creg_sizes": [["c0", 2], ["c1", 4]]}
+        raw_counts = {hex(value): value + 1 for value in range(64)}
+        expected = {
+            postprocess.format_counts_memory(key, header): value
+            for key, value in raw_counts.items()
+        }
+        self.assertEqual(postprocess.format_counts(raw_counts, header), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
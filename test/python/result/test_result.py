@@ -12,12 +12,17 @@
 
 """Test Qiskit's Result class."""
 
+import json
+from unittest.mock import patch
+
 import numpy as np
 
 from qiskit.result import models
 from qiskit.result import marginal_counts
-from qiskit.result import Result
+from qiskit.result import Result, MemoryArray
+from qiskit.result import result as result_module
 from qiskit.qobj import QobjExperimentHeader
+from qiskit.exceptions import QiskitError
 from qiskit.test import QiskitTestCase
 
 
@@ -89,6 +94,115 @@ class TestResultOperations(QiskitTestCase):
         with self.assertWarnsRegex(UserWarning, r"multiple.*foo"):
             result.get_counts("foo")
 
+    def test_counts_by_name_after_rename(self):
+        """Test that counts by name follow experiments renamed after a lookup."""
+        results = []
+        for index in range(3):
+            data = models.ExperimentResultData(counts={hex(index): 10})
+            exp_result_header = QobjExperimentHeader(memory_slots=2, name="exp_%d" % index)
+            results.append(
+                models.ExperimentResult(
+                    shots=10, success=True, meas_level=2, data=data, header=exp_result_header
+                )
+            )
+        result = Result(results=results, **self.base_result_args)
+
+        self.assertEqual(result.get_counts("exp_2"), {"10": 10})
+        results[0].header.name = "renamed"
+        results[2].header.name = "exp_0"
+        self.assertEqual(result.get_counts("exp_0"), {"10": 10})
+        self.assertEqual(result.get_counts("renamed"), {"00": 10})
+
+    def test_counts_by_name_after_replacing_experiment(self):
+        """Test that counts by name follow experiments replaced after a lookup."""
+        results = []
+        for index, name in enumerate(["a", "b", "c"]):
+            data = models.ExperimentResultData(counts={hex(index): 10})
+            exp_result_header = QobjExperimentHeader(memory_slots=2, name=name)
+            results.append(
+                models.ExperimentResult(
+                    shots=10, success=True, meas_level=2, data=data, header=exp_result_header
+                )
+            )
+
+        for lazy in (False, True):
+            with self.subTest(lazy=lazy):
+                result = Result.from_dict(
+                    Result(results=results, **self.base_result_args).to_dict(), lazy=lazy
+                )
+                self.assertEqual(result.get_counts("b"), {"01": 10})
+                result.results[0] = result.results[2]
+                result.results[0].header.name = "b"
+                with self.assertWarnsRegex(UserWarning, r"multiple.*b"):
+                    self.assertEqual(result.get_counts("b"), {"10": 10})
+
+    def test_counts_by_name_after_rename_to_name(self):
+        """Test that counts by name find an experiment renamed to a name not found before."""
+        results = []
+        for index, name in enumerate(["a", "b"]):
+            data = models.ExperimentResultData(counts={hex(index): 10})
+            exp_result_header = QobjExperimentHeader(memory_slots=2, name=name)
+            results.append(
+                models.ExperimentResult(
+                    shots=10, success=True, meas_level=2, data=data, header=exp_result_header
+                )
+            )
+
+        for lazy in (False, True):
+            with self.subTest(lazy=lazy):
+                result = Result.from_dict(
+                    Result(results=results, **self.base_result_args).to_dict(), lazy=lazy
+                )
+                self.assertEqual(result.get_counts("a"), {"00": 10})
+                result.results[1].header.name = "c"
+                self.assertEqual(result.get_counts("c"), {"01": 10})
+                with self.assertRaises(QiskitError):
+                    result.get_counts("b")
+
+    def test_counts_by_name_uses_index(self):
+        """Test that lookups by name do not scan the experiments of an unchanged result."""
+        results = []
+        for index in range(4):
+            data = models.ExperimentResultData(counts={hex(index): 10})
+            exp_result_header = QobjExperimentHeader(memory_slots=2, name="exp_%d" % index)
+            results.append(
+                models.ExperimentResult(
+                    shots=10, success=True, meas_level=2, data=data, header=exp_result_header
+                )
+            )
+        result = Result(results=results, **self.base_result_args)
+        self.assertEqual(result.get_counts("exp_3"), {"11": 10})
+        with patch("qiskit.result.result._name", wraps=result_module._name) as name:
+            self.assertEqual(result.data("exp_2"), {"counts": {"0x2": 10}})
+        # only the experiment found is checked for a rename
+        self.assertEqual(name.call_count, 1)
+
+        result.results.append(result.results[0])
+        result.results[0] = results[3]
+        with self.assertWarnsRegex(UserWarning, r"multiple.*exp_3"):
+            self.assertEqual(result.get_counts("exp_3"), {"11": 10})
+
+    def test_lazy_from_dict(self):
+        """Test that a lazily loaded result only builds the experiments accessed."""
+        raw_results = []
+        for index in range(4):
+            data = models.ExperimentResultData(counts={hex(index): 10})
+            exp_result_header = QobjExperimentHeader(memory_slots=2, name="exp_%d" % index)
+            exp_result = models.ExperimentResult(
+                shots=10, success=True, meas_level=2, data=data, header=exp_result_header
+            )
+            raw_results.append(exp_result)
+        expected = Result(results=raw_results, **self.base_result_args)
+
+        result = Result.from_dict(expected.to_dict(), lazy=True)
+        self.assertEqual(result.get_counts("exp_2"), {"10": 10})
+        self.assertEqual(len(result.results), 4)
+        self.assertEqual(
+            [isinstance(item, dict) for item in result.results._items], [True, True, False, True]
+        )
+        self.assertEqual(result.get_counts(), expected.get_counts())
+        self.assertEqual(result.to_dict(), expected.to_dict())
+
     def test_result_repr(self):
         """Test that repr is contstructed correctly for a results object."""
         raw_counts = {"0x0": 4, "0x2": 10}
@@ -347,6 +461,53 @@ class TestResultOperations(QiskitTestCase):
 
         self.assertEqual(result.get_memory(0), no_header_processed_memory)
 
+    def test_memory_array(self):
+        """Test that memory is packed and only formatted when requested."""
+        raw_memory = ["0x0", "0x5", "0x2", "0x5"]
+        data = models.ExperimentResultData(memory=raw_memory)
+        exp_result_header = QobjExperimentHeader(creg_sizes=[["c0", 1], ["c1", 2]], memory_slots=3)
+        exp_result = models.ExperimentResult(
+            shots=4, success=True, meas_level=2, memory=True, data=data, header=exp_result_header
+        )
+        result = Result(results=[exp_result], **self.base_result_args)
+
+        memory_array = result.get_memory_array(0)
+        np.testing.assert_array_equal(memory_array.array, [0, 5, 2, 5])
+        self.assertEqual(memory_array.counts().hex_outcomes(), {"0x0": 1, "0x5": 2, "0x2": 1})
+        self.assertEqual(result.get_memory(0), ["00 0", "10 1", "01 0", "10 1"])
+        self.assertEqual(result.data(0)["memory"], raw_memory)
+
+    def test_memory_attribute_is_list(self):
+        """Test that the memory of the data is a list built from the packed memory."""
+        raw_memory = ["0x0", "0x5", "0x2", "0x5"]
+        data = models.ExperimentResultData(memory=raw_memory)
+        exp_result_header = QobjExperimentHeader(creg_sizes=[["c0", 3]], memory_slots=3)
+        exp_result = models.ExperimentResult(
+            shots=4, success=True, meas_level=2, memory=True, data=data, header=exp_result_header
+        )
+        result = Result(results=[exp_result], **self.base_result_args)
+
+        self.assertIsInstance(result.get_memory_array(0), MemoryArray)
+        self.assertIsInstance(data.memory, list)
+        self.assertEqual(json.loads(json.dumps(data.memory)), raw_memory)
+        data.memory.append("0x7")
+        self.assertEqual(result.get_memory(0), ["000", "101", "010", "101", "111"])
+        np.testing.assert_array_equal(result.get_memory_array(0).array, [0, 5, 2, 5, 7])
+
+    def test_memory_array_wide(self):
+        """Test that memory wider than 64 memory slots is packed into words."""
+        raw_memory = [hex(2 ** 70 + 1), "0x3"]
+        data = models.ExperimentResultData(memory=raw_memory)
+        exp_result_header = QobjExperimentHeader(creg_sizes=[["c0", 72]], memory_slots=72)
+        exp_result = models.ExperimentResult(
+            shots=2, success=True, meas_level=2, memory=True, data=data, header=exp_result_header
+        )
+        result = Result(results=[exp_result], **self.base_result_args)
+
+        memory_array = result.get_memory_array(0)
+        np.testing.assert_array_equal(memory_array.array, [[1, 64], [3, 0]])
+        self.assertEqual(result.get_memory(0), [format(int(mem, 16), "072b") for mem in raw_memory])
+
     def test_meas_level_1_avg(self):
         """Test measurement level 1 average result."""
         # 3 qubits
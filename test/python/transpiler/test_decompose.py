@@ -17,7 +17,19 @@ from numpy import pi
 from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
 from qiskit.transpiler.passes import Decompose
 from qiskit.converters import circuit_to_dag
-from qiskit.circuit.library import HGate, CCXGate, U2Gate
+from qiskit.circuit.library import (
+    HGate,
+    CCXGate,
+    U2Gate,
+    MCXGate,
+    RXGate,
+    CRXGate,
+    SXGate,
+    SGate,
+    SwapGate,
+)
+from qiskit.circuit.definitioncache import cached_definition, definition_key
+from qiskit.circuit import Parameter
 from qiskit.quantum_info.operators import Operator
 from qiskit.test import QiskitTestCase
 
@@ -141,3 +153,62 @@ class TestDecompose(QiskitTestCase):
         qc.append(v, [0])
         qcd = qc.decompose()
         self.assertEqual(Operator(qc), Operator(qcd))
+
+    def test_decompose_equal_gates_share_definition(self):
+        """Test equal gates are decomposed with a single definition."""
+        qc = QuantumCircuit(6)
+        for _ in range(4):
+            qc.append(MCXGate(4), [0, 1, 2, 3, 4])
+            qc.append(MCXGate(5), [0, 1, 2, 3, 4, 5])
+        qc.append(MCXGate(4, ctrl_state=3), [0, 1, 2, 3, 5])
+
+        definitions = {id(cached_definition(inst)) for inst, _, _ in qc.data}
+        self.assertEqual(len(definitions), 3)
+
+        qcd = qc.decompose()
+        self.assertEqual(Operator(qc), Operator(qcd))
+
+    def test_definition_key(self):
+        """Test the definition key distinguishes the attributes of a gate."""
+        self.assertEqual(definition_key(RXGate(0.5)), definition_key(RXGate(0.5)))
+        self.assertNotEqual(definition_key(RXGate(0.5)), definition_key(RXGate(0.25)))
+        self.assertNotEqual(
+            definition_key(CRXGate(0.5)), definition_key(CRXGate(0.5, ctrl_state=0))
+        )
+        self.assertIsNone(definition_key(RXGate(Parameter("x"))))
+
+    def test_definition_key_custom_definition(self):
+        """Test the definition key of a library gate includes a custom definition."""
+        definition = QuantumCircuit(1)
+        definition.h(0)
+        gate = SXGate()
+        gate.definition = definition
+
+        self.assertNotEqual(definition_key(gate), definition_key(SXGate()))
+
+    def test_decompose_does_not_share_operations(self):
+        """Test the decomposed operations are not shared with the cached definitions or
+        between the nodes of the decomposed circuit."""
+        qc = QuantumCircuit(2)
+        qc.s(0)
+        qc.swap(0, 1)
+        qc.swap(1, 0)
+        dag = Decompose(SGate).run(circuit_to_dag(qc))
+        dag.op_nodes()[0].op.params[0] = 1.234
+        self.assertEqual(cached_definition(SGate()).data[0][0].params, [pi / 2])
+
+        dag = Decompose(SwapGate).run(dag)
+        ops = [node.op for node in dag.op_nodes()]
+        self.assertEqual(len({id(op) for op in ops}), len(ops))
+
+    def test_decompose_conditional_shared_definition(self):
+        """Test decomposing a conditional gate does not condition equal gates."""
+        qr = QuantumRegister(1, "qr")
+        cr = ClassicalRegister(1, "cr")
+        circuit = QuantumCircuit(qr, cr)
+        circuit.h(qr).c_if(cr, 1)
+        circuit.h(qr)
+        decomposed = circuit.decompose()
+
+        self.assertEqual(decomposed.data[0][0].condition, (cr, 1))
+        self.assertIsNone(decomposed.data[1][0].condition)